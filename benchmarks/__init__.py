@@ -0,0 +1,14 @@
+"""
+Benchmark scripts for measuring the performance of TeX-Bot's hot paths.
+
+Each benchmark module can be run directly, e.g. `python -m benchmarks.import_times`.
+Benchmarks are not part of the test suite, because their results depend on the machine
+they are run on.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__: "Sequence[str]" = ()
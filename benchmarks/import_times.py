@@ -0,0 +1,77 @@
+"""Benchmark of the import cost of each lazily imported heavy third-party module."""
+
+import json
+import statistics
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+from utils.lazy_imports import LAZILY_IMPORTED_MODULE_NAMES
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("main", "measure_import_cost")
+
+
+REPEATS: "Final[int]" = 5
+
+_MEASURE_IMPORT_SCRIPT: "Final[str]" = """
+import importlib, json, resource, sys, time
+
+start_max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start_time = time.perf_counter()
+for module_name in sys.argv[1:]:
+    importlib.import_module(module_name)
+print(json.dumps({
+    "seconds": time.perf_counter() - start_time,
+    "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_max_rss,
+}))
+"""
+
+
+def measure_import_cost(module_names: "Sequence[str]") -> tuple[float, float]:
+    """
+    Return the median time (in seconds) & resident memory (in MiB) to import the modules.
+
+    Each measurement is taken in a fresh interpreter, so no module is already imported.
+    """
+    durations: list[float] = []
+    max_rss_increases: list[float] = []
+
+    _: int
+    for _ in range(REPEATS):
+        measurement: dict[str, float] = json.loads(
+            subprocess.run(
+                (sys.executable, "-c", _MEASURE_IMPORT_SCRIPT, *module_names),
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        durations.append(measurement["seconds"])
+        max_rss_increases.append(measurement["max_rss_kib"] / 1024)
+
+    return statistics.median(durations), statistics.median(max_rss_increases)
+
+
+def main() -> None:
+    """Print the import cost of every lazily imported module, then all of them together."""
+    print(f"{'module':<24}{'time (s)':>12}{'RSS (MiB)':>12}")  # noqa: T201
+
+    module_names: Sequence[str]
+    for module_names in (
+        *((module_name,) for module_name in LAZILY_IMPORTED_MODULE_NAMES),
+        LAZILY_IMPORTED_MODULE_NAMES,
+    ):
+        duration: float
+        max_rss_increase: float
+        duration, max_rss_increase = measure_import_cost(module_names)
+
+        label: str = module_names[0] if len(module_names) == 1 else "(all)"
+        print(f"{label:<24}{duration:>12.3f}{max_rss_increase:>12.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark of the latency of checking a reminder marker, through each available storage path.
+
+Each lookup is timed from the event loop, as the reminder tasks & opt-out button make them:
+through Django's async ORM (which runs each query on a separate thread),
+through the database executor, and directly through the marker store's read-only connection.
+
+Importing the database settings requires the same environment variables as running TeX-Bot,
+so this benchmark must be run from a configured environment.
+A temporary database is used, so the configured database is never modified.
+"""
+
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+
+from config import settings as tex_bot_settings
+
+tex_bot_settings._setup_env_variables()  # noqa: SLF001
+
+from db.core.models import DiscordMember, SentGetRolesReminderMember  # noqa: E402
+from db.executor import database_executor  # noqa: E402
+from db.marker_store import sent_get_roles_reminder_markers  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("main",)
+
+
+MEMBER_COUNT: "Final[int]" = 5_000
+MARKED_MEMBER_PROBABILITY: "Final[float]" = 0.5
+LOOKUP_COUNT: "Final[int]" = 2_000
+
+
+def _seed_database(discord_ids: "Sequence[str]") -> None:
+    """Create every Discord member, and mark a random half of them as reminded."""
+    randomiser: random.Random = random.Random(0)  # noqa: S311
+
+    sent_get_roles_reminder_markers.mark(
+        discord_id
+        for discord_id in discord_ids
+        if randomiser.random() < MARKED_MEMBER_PROBABILITY
+    )
+    DiscordMember.get_or_create_primary_keys(discord_ids)
+
+
+def _orm_exists(discord_id: str) -> bool:
+    return SentGetRolesReminderMember.objects.filter(
+        discord_member__discord_id=discord_id
+    ).exists()
+
+
+async def _time_lookups(
+    lookup: "Callable[[str], Awaitable[bool]]", discord_ids: "Sequence[str]"
+) -> "Sequence[float]":
+    """Return the time (in milliseconds) taken by each given lookup."""
+    durations: list[float] = []
+
+    discord_id: str
+    for discord_id in discord_ids:
+        start_time: float = time.perf_counter()
+        await lookup(discord_id)
+        durations.append((time.perf_counter() - start_time) * 1000)
+
+    return durations
+
+
+async def _run_benchmark(discord_ids: "Sequence[str]") -> None:
+    await database_executor.run(_seed_database, discord_ids)
+
+    lookup_discord_ids: Sequence[str] = random.Random(1).choices(discord_ids, k=LOOKUP_COUNT)  # noqa: S311
+
+    lookup_name: str
+    lookup: Callable[[str], Awaitable[bool]]
+    for lookup_name, lookup in (
+        (
+            "Django async ORM",
+            lambda discord_id: SentGetRolesReminderMember.objects.filter(
+                discord_member__discord_id=discord_id
+            ).aexists(),
+        ),
+        (
+            "Database executor",
+            lambda discord_id: database_executor.run(_orm_exists, discord_id),
+        ),
+        ("Marker store", sent_get_roles_reminder_markers.acontains),
+    ):
+        durations: Sequence[float] = await _time_lookups(lookup, lookup_discord_ids)
+        quantiles: Sequence[float] = statistics.quantiles(durations, n=100)
+        print(  # noqa: T201
+            f"{lookup_name:<22} p50 {quantiles[49]:.3f}ms, p99 {quantiles[98]:.3f}ms"
+        )
+
+    start_time: float = time.perf_counter()
+    await sent_get_roles_reminder_markers.aget_marked_discord_ids(discord_ids)
+    print(  # noqa: T201
+        f"Batched lookup of all {len(discord_ids):,} members (marker store): "
+        f"{(time.perf_counter() - start_time) * 1000:.2f}ms"
+    )
+
+
+def main() -> None:
+    """Print the latency of a single marker lookup, through each storage path."""
+    if not sent_get_roles_reminder_markers.is_direct_read_enabled():
+        print("Direct reads are disabled by the database performance profile.")  # noqa: T201
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        database_path: Path = Path(temporary_directory) / "core.db"
+        settings.DATABASES["default"]["NAME"] = database_path
+        connection.settings_dict["NAME"] = database_path
+
+        call_command("migrate", verbosity=0)
+
+        print(f"{LOOKUP_COUNT:,} lookups among {MEMBER_COUNT:,} members")  # noqa: T201
+        asyncio.run(
+            _run_benchmark(
+                [str(100_000_000_000_000_000 + index) for index in range(MEMBER_COUNT)]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
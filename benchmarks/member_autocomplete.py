@@ -0,0 +1,166 @@
+"""Benchmark of the latency of each keystroke of a member autocomplete, in a large guild."""
+
+import itertools
+import random
+import statistics
+import string
+import time
+from typing import TYPE_CHECKING
+
+import discord
+
+from utils.member_search_index import MemberSearchIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from collections.abc import Set as AbstractSet
+    from typing import Final
+
+__all__: "Sequence[str]" = ("main",)
+
+
+MEMBER_COUNT: "Final[int]" = 10_000
+TYPED_NAME_COUNT: "Final[int]" = 200
+GUEST_ROLE_ID: "Final[int]" = 1
+GLOBAL_NAME_PROBABILITY: "Final[float]" = 0.7
+
+
+class _SyntheticMember:
+    """Stand-in for a guild member, exposing the attributes used by member autocompletes."""
+
+    __slots__ = ("bot", "display_name", "global_name", "id", "name", "role_ids")
+
+    def __init__(self, member_id: int, name: str, global_name: str | None) -> None:
+        self.id: int = member_id
+        self.name: str = name
+        self.global_name: str | None = global_name
+        self.display_name: str = global_name or name
+        self.bot: bool = False
+        self.role_ids: AbstractSet[int] = frozenset()
+
+    def get_role(self, role_id: int) -> object | None:
+        return role_id if role_id in self.role_ids else None
+
+
+class _SyntheticGuild:
+    """Stand-in for a guild, exposing its cached members."""
+
+    def __init__(self, members: "Sequence[_SyntheticMember]") -> None:
+        self.members: Sequence[_SyntheticMember] = members
+        self._members_by_id: Mapping[int, _SyntheticMember] = {
+            member.id: member for member in members
+        }
+
+    def get_member(self, member_id: int) -> _SyntheticMember | None:
+        return self._members_by_id.get(member_id)
+
+
+def _autocomplete_all_members(
+    guild: _SyntheticGuild, value: str
+) -> "Sequence[discord.OptionChoice]":
+    """Build a choice for every member, then filter them as `basic_autocomplete()` does."""
+    members: set[_SyntheticMember] = {
+        member
+        for member in guild.members
+        if not member.bot and not member.get_role(GUEST_ROLE_ID)
+    }
+
+    choices: set[discord.OptionChoice] = (
+        {
+            discord.OptionChoice(name=f"@{member.name}", value=str(member.id))
+            for member in members
+        }
+        if not value or value.startswith("@")
+        else {
+            discord.OptionChoice(name=member.name, value=str(member.id)) for member in members
+        }
+    )
+
+    return list(
+        itertools.islice(
+            (choice for choice in choices if choice.name.lower().startswith(value.lower())),
+            25,
+        )
+    )
+
+
+def _autocomplete_indexed_members(
+    guild: _SyntheticGuild, member_search_index: MemberSearchIndex, value: str
+) -> "Sequence[discord.OptionChoice]":
+    """Return a choice for only the best matching members, found using the search index."""
+    SHOW_AT_PREFIX: Final[bool] = not value or value.startswith("@")
+
+    return [
+        discord.OptionChoice(
+            name=f"@{member.name}" if SHOW_AT_PREFIX else member.name, value=str(member.id)
+        )
+        for member in member_search_index.search(
+            guild,  # type: ignore[arg-type]
+            value.removeprefix("@"),
+            member_filter=lambda member: not member.bot and not member.get_role(GUEST_ROLE_ID),
+        )
+    ]
+
+
+def _time_keystrokes(
+    autocomplete: "Callable[[str], Sequence[discord.OptionChoice]]",
+    typed_values: "Sequence[str]",
+) -> float:
+    """Return the median time (in milliseconds) to autocomplete each typed value."""
+    durations: list[float] = []
+
+    typed_value: str
+    for typed_value in typed_values:
+        start_time: float = time.perf_counter()
+        autocomplete(typed_value)
+        durations.append((time.perf_counter() - start_time) * 1000)
+
+    return statistics.median(durations)
+
+
+def main() -> None:
+    """Print the median latency of each autocomplete method, per keystroke."""
+    randomiser: random.Random = random.Random(0)  # noqa: S311
+
+    guild: _SyntheticGuild = _SyntheticGuild(
+        [
+            _SyntheticMember(
+                member_id=100_000_000_000_000_000 + index,
+                name="".join(randomiser.choices(string.ascii_lowercase, k=10)),
+                global_name=(
+                    "".join(randomiser.choices(string.ascii_letters, k=8))
+                    if randomiser.random() < GLOBAL_NAME_PROBABILITY
+                    else None
+                ),
+            )
+            for index in range(MEMBER_COUNT)
+        ]
+    )
+
+    typed_values: Sequence[str] = [
+        f"@{member.name[:prefix_length]}"
+        for member in randomiser.sample(guild.members, TYPED_NAME_COUNT)
+        for prefix_length in range(6)
+    ]
+
+    start_time: float = time.perf_counter()
+    member_search_index: MemberSearchIndex = MemberSearchIndex()
+    member_search_index.rebuild(guild.members)  # type: ignore[arg-type]
+    index_build_duration: float = (time.perf_counter() - start_time) * 1000
+
+    all_members_duration: float = _time_keystrokes(
+        lambda value: _autocomplete_all_members(guild, value), typed_values
+    )
+    indexed_members_duration: float = _time_keystrokes(
+        lambda value: _autocomplete_indexed_members(guild, member_search_index, value),
+        typed_values,
+    )
+
+    print(f"Autocompleted {len(typed_values):,} keystrokes in a guild of {MEMBER_COUNT:,}")  # noqa: T201
+    print(f"Building member search index (once): {index_build_duration:.2f}ms")  # noqa: T201
+    print(f"Choice for every member:  {all_members_duration:.3f}ms per keystroke")  # noqa: T201
+    print(f"Member search index:      {indexed_members_duration:.3f}ms per keystroke")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
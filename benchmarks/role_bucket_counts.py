@@ -0,0 +1,141 @@
+"""
+Benchmark of counting per-role message statistics over one million synthetic messages.
+
+Importing the stats cog requires the same environment variables as running TeX-Bot,
+so this benchmark must be run from a configured environment.
+"""
+
+import random
+import time
+from typing import TYPE_CHECKING
+
+import discord
+
+from cogs.stats.counts import RoleBucketCounter
+from config import DEFAULT_STATISTICS_ROLES
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from collections.abc import Set as AbstractSet
+    from typing import Final
+
+__all__: "Sequence[str]" = ("main",)
+
+
+MESSAGE_COUNT: "Final[int]" = 1_000_000
+AUTHOR_COUNT: "Final[int]" = 2_000
+MAX_AUTHOR_ROLES: "Final[int]" = 6
+
+
+class _SyntheticRole:
+    __slots__ = ("id", "name")
+
+    def __init__(self, role_id: int, name: str) -> None:
+        self.id: int = role_id
+        self.name: str = name
+
+
+class _SyntheticAuthor:
+    """Stand-in for a message author, exposing the same role attributes as a member."""
+
+    __slots__ = ("_roles", "bot", "roles")
+
+    def __init__(self, roles: "Sequence[_SyntheticRole]") -> None:
+        self.bot: bool = False
+        self.roles: Sequence[_SyntheticRole] = roles
+        self._roles: discord.utils.SnowflakeList = discord.utils.SnowflakeList(
+            role.id for role in roles
+        )
+
+
+def _count_per_message(
+    authors: "Sequence[_SyntheticAuthor]", statistics_role_names: "AbstractSet[str]"
+) -> "Mapping[str, int]":
+    """Count messages by rebuilding each author's set of role names for every message."""
+    message_counts: dict[str, int] = {"Total": 0} | {
+        f"@{role_name}": 0 for role_name in statistics_role_names
+    }
+
+    author: _SyntheticAuthor
+    for author in authors:
+        message_counts["Total"] += 1
+
+        author_role_names: set[str] = {author_role.name for author_role in author.roles}
+
+        author_role_name: str
+        for author_role_name in author_role_names:
+            if f"@{author_role_name}" in message_counts:
+                is_author_role_committee: bool = author_role_name == "Committee"
+                if is_author_role_committee and "Committee-Elect" in author_role_names:
+                    continue
+
+                if author_role_name == "Guest" and "Member" in author_role_names:
+                    continue
+
+                message_counts[f"@{author_role_name}"] += 1
+
+    return message_counts
+
+
+def _count_with_role_buckets(
+    authors: "Sequence[_SyntheticAuthor]",
+    guild_roles: "Sequence[_SyntheticRole]",
+    statistics_role_names: "AbstractSet[str]",
+) -> "Mapping[str, int]":
+    """Count messages with the cached role-bucket counting engine."""
+    role_bucket_counter: RoleBucketCounter = RoleBucketCounter(
+        guild_roles,  # type: ignore[arg-type]
+        statistics_role_names=statistics_role_names,
+    )
+
+    author: _SyntheticAuthor
+    for author in authors:
+        role_bucket_counter.count_message(author)  # type: ignore[arg-type]
+
+    return role_bucket_counter.get_counts()
+
+
+def main() -> None:
+    """Print the time taken by each counting method, after checking that their counts match."""
+    randomiser: random.Random = random.Random(0)  # noqa: S311
+
+    guild_roles: Sequence[_SyntheticRole] = [
+        _SyntheticRole(role_id=1_000_000 + index, name=role_name)
+        for index, role_name in enumerate(
+            (*sorted(DEFAULT_STATISTICS_ROLES), *(f"Opt-In {index}" for index in range(40)))
+        )
+    ]
+
+    synthetic_authors: Sequence[_SyntheticAuthor] = [
+        _SyntheticAuthor(
+            randomiser.sample(guild_roles, randomiser.randint(0, MAX_AUTHOR_ROLES))
+        )
+        for _ in range(AUTHOR_COUNT)
+    ]
+    message_authors: Sequence[_SyntheticAuthor] = randomiser.choices(
+        synthetic_authors, k=MESSAGE_COUNT
+    )
+
+    start_time: float = time.perf_counter()
+    per_message_counts: Mapping[str, int] = _count_per_message(
+        message_authors, DEFAULT_STATISTICS_ROLES
+    )
+    per_message_duration: float = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    role_bucket_counts: Mapping[str, int] = _count_with_role_buckets(
+        message_authors, guild_roles, DEFAULT_STATISTICS_ROLES
+    )
+    role_bucket_duration: float = time.perf_counter() - start_time
+
+    if dict(per_message_counts) != dict(role_bucket_counts):
+        COUNTS_MISMATCH_MESSAGE: Final[str] = "Both counting methods must give equal counts."
+        raise RuntimeError(COUNTS_MISMATCH_MESSAGE)
+
+    print(f"Counted {MESSAGE_COUNT:,} messages from {AUTHOR_COUNT:,} authors")  # noqa: T201
+    print(f"Per-message role name sets: {per_message_duration:.3f}s")  # noqa: T201
+    print(f"Cached role buckets:        {role_bucket_duration:.3f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
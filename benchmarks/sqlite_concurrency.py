@@ -0,0 +1,206 @@
+"""
+Benchmark of concurrent SQLite reads & writes, under each database performance profile.
+
+A background writer repeatedly commits small transactions (like the reminder tasks do),
+while several readers run indexed lookups (like the autocompletes do).
+
+Importing the database settings requires the same environment variables as running TeX-Bot,
+so this benchmark must be run from a configured environment.
+"""
+
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from db._settings import DATABASE_BUSY_TIMEOUT, SQLITE_PERFORMANCE_PROFILE_PRAGMAS
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("main",)
+
+
+DURATION_SECONDS: "Final[float]" = 3.0
+READER_COUNT: "Final[int]" = 4
+SEEDED_ROW_COUNT: "Final[int]" = 20_000
+MEMBER_COUNT: "Final[int]" = 500
+
+
+class _ProfileResults:
+    """Counts & latencies measured while benchmarking a single performance profile."""
+
+    def __init__(self) -> None:
+        self.read_durations: list[float] = []
+        self.write_durations: list[float] = []
+        self.busy_error_count: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+
+def _connect(database_path: Path, pragmas: "Mapping[str, str | int]") -> sqlite3.Connection:
+    """Open a new connection to the given database, applying the given pragmas."""
+    connection: sqlite3.Connection = sqlite3.connect(
+        database_path,
+        timeout=DATABASE_BUSY_TIMEOUT,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+
+    pragma_name: str
+    pragma_value: str | int
+    for pragma_name, pragma_value in pragmas.items():
+        connection.execute(f"PRAGMA {pragma_name}={pragma_value}")
+
+    return connection
+
+
+def _seed_database(connection: sqlite3.Connection) -> None:
+    """Create & fill a table shaped like the assigned committee actions table."""
+    randomiser: random.Random = random.Random(0)  # noqa: S311
+
+    connection.execute(
+        "CREATE TABLE action "
+        "(id INTEGER PRIMARY KEY, member_id INTEGER, description TEXT, status TEXT)"
+    )
+    connection.execute("CREATE INDEX action_member_status ON action (member_id, status)")
+
+    connection.execute("BEGIN")
+    connection.executemany(
+        "INSERT INTO action (member_id, description, status) VALUES (?, ?, ?)",
+        (
+            (randomiser.randrange(MEMBER_COUNT), f"Action {index}", "NST")
+            for index in range(SEEDED_ROW_COUNT)
+        ),
+    )
+    connection.execute("COMMIT")
+
+
+def _run_reader(
+    connection: sqlite3.Connection, results: _ProfileResults, end_time: float
+) -> None:
+    """Repeatedly look up the open actions of random members, until the end time."""
+    randomiser: random.Random = random.Random()  # noqa: S311
+    read_durations: list[float] = []
+
+    while time.perf_counter() < end_time:
+        start_time: float = time.perf_counter()
+        try:
+            connection.execute(
+                "SELECT id, description FROM action WHERE member_id = ? AND status = ?",
+                (randomiser.randrange(MEMBER_COUNT), "NST"),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            with results.lock:
+                results.busy_error_count += 1
+            continue
+
+        read_durations.append((time.perf_counter() - start_time) * 1000)
+
+    with results.lock:
+        results.read_durations.extend(read_durations)
+
+
+def _run_writer(
+    connection: sqlite3.Connection,
+    results: _ProfileResults,
+    end_time: float,
+    begin_statement: str,
+) -> None:
+    """Repeatedly commit a small transaction that adds & updates actions, until the end."""
+    randomiser: random.Random = random.Random()  # noqa: S311
+
+    while time.perf_counter() < end_time:
+        start_time: float = time.perf_counter()
+        try:
+            connection.execute(begin_statement)
+            connection.execute(
+                "INSERT INTO action (member_id, description, status) VALUES (?, ?, ?)",
+                (randomiser.randrange(MEMBER_COUNT), "New action", "NST"),
+            )
+            connection.execute(
+                "UPDATE action SET status = ? WHERE id = ?",
+                ("INP", randomiser.randrange(1, SEEDED_ROW_COUNT)),
+            )
+            connection.execute("COMMIT")
+        except sqlite3.OperationalError:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            with results.lock:
+                results.busy_error_count += 1
+            continue
+
+        results.write_durations.append((time.perf_counter() - start_time) * 1000)
+
+
+def _benchmark_profile(profile_name: str, database_path: Path) -> _ProfileResults:
+    """Run the readers & the writer concurrently, against a database using the profile."""
+    pragmas: Mapping[str, str | int] = SQLITE_PERFORMANCE_PROFILE_PRAGMAS[profile_name]
+
+    seed_connection: sqlite3.Connection = _connect(database_path, pragmas)
+    _seed_database(seed_connection)
+    seed_connection.close()
+
+    results: _ProfileResults = _ProfileResults()
+    end_time: float = time.perf_counter() + DURATION_SECONDS
+
+    threads: list[threading.Thread] = [
+        threading.Thread(
+            target=_run_reader, args=(_connect(database_path, pragmas), results, end_time)
+        )
+        for _ in range(READER_COUNT)
+    ]
+    threads.append(
+        threading.Thread(
+            target=_run_writer,
+            args=(
+                _connect(database_path, pragmas),
+                results,
+                end_time,
+                "BEGIN IMMEDIATE" if profile_name == "TUNED" else "BEGIN",
+            ),
+        )
+    )
+
+    thread: threading.Thread
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def main() -> None:
+    """Print the throughput & latency of concurrent reads & writes, for each profile."""
+    print(  # noqa: T201
+        f"{READER_COUNT} readers & 1 writer for {DURATION_SECONDS:.0f}s each, "
+        f"over {SEEDED_ROW_COUNT:,} seeded actions"
+    )
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        profile_name: str
+        for profile_name in SQLITE_PERFORMANCE_PROFILE_PRAGMAS:
+            results: _ProfileResults = _benchmark_profile(
+                profile_name, Path(temporary_directory) / f"{profile_name.lower()}.db"
+            )
+
+            read_quantiles: Sequence[float] = statistics.quantiles(
+                results.read_durations, n=100
+            )
+            print(  # noqa: T201
+                f"{profile_name:<8} "
+                f"reads: {len(results.read_durations) / DURATION_SECONDS:>9,.0f}/s "
+                f"(p50 {read_quantiles[49]:.3f}ms, p99 {read_quantiles[98]:.3f}ms), "
+                f"writes: {len(results.write_durations) / DURATION_SECONDS:>7,.0f}/s "
+                f"(p50 {statistics.median(results.write_durations):.3f}ms), "
+                f"busy errors: {results.busy_error_count}"
+            )
+
+
+if __name__ == "__main__":
+    main()
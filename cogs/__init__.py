@@ -7,6 +7,8 @@ cogs for each activity.
 
 from typing import TYPE_CHECKING
 
+from db.marker_store import DiscordMemberMarkerStore
+
 from .add_users_to_threads_and_channels import AddUsersToThreadsAndChannelsCommandsCog
 from .annual_handover_and_reset import (
     AnnualRolesResetCommandCog,
@@ -23,7 +25,9 @@ from .committee_actions_tracking import (
     CommitteeActionsTrackingContextCommandCog,
     CommitteeActionsTrackingSlashCommandsCog,
 )
+from .database_query_stats import DatabaseQueryStatsCommandCog
 from .delete_all import DeleteAllCommandsCog
+from .delete_scheduled_messages import DeleteScheduledMessagesTaskCog
 from .edit_message import EditMessageCommandCog
 from .everest import EverestCommandCog
 from .induct import (
@@ -42,7 +46,7 @@ from .send_get_roles_reminders import SendGetRolesRemindersTaskCog
 from .send_introduction_reminders import SendIntroductionRemindersTaskCog
 from .source import SourceCommandCog
 from .startup import StartupCog
-from .stats import StatsCommandsCog
+from .stats import MessageActivityIndexTaskCog, StatsCommandsCog
 from .strike import ManualModerationCog, StrikeCommandsCog, StrikeContextCommandsCog
 from .write_roles import WriteRolesCommandCog
 
@@ -63,7 +67,9 @@ __all__: "Sequence[str]" = (
     "CommitteeActionsTrackingContextCommandsCog",
     "CommitteeActionsTrackingSlashCommandsCog",
     "CommitteeHandoverCommandCog",
+    "DatabaseQueryStatsCommandCog",
     "DeleteAllCommandsCog",
+    "DeleteScheduledMessagesTaskCog",
     "EditMessageCommandCog",
     "EnsureMembersInductedCommandCog",
     "EverestCommandCog",
@@ -77,6 +83,7 @@ __all__: "Sequence[str]" = (
     "MakeMemberCommandCog",
     "ManualModerationCog",
     "MemberCountCommandCog",
+    "MessageActivityIndexTaskCog",
     "PingCommandCog",
     "RemindMeCommandCog",
     "SendGetRolesRemindersTaskCog",
@@ -103,7 +110,9 @@ def setup(bot: "TeXBot") -> None:
         CommitteeActionsTrackingSlashCommandsCog,
         CommitteeActionsTrackingContextCommandCog,
         CommitteeHandoverCommandCog,
+        DatabaseQueryStatsCommandCog,
         DeleteAllCommandsCog,
+        DeleteScheduledMessagesTaskCog,
         EditMessageCommandCog,
         EnsureMembersInductedCommandCog,
         EverestCommandCog,
@@ -118,6 +127,7 @@ def setup(bot: "TeXBot") -> None:
         MakeMemberCommandCog,
         ManualModerationCog,
         MemberCountCommandCog,
+        MessageActivityIndexTaskCog,
         PingCommandCog,
         RemindMeCommandCog,
         SendGetRolesRemindersTaskCog,
@@ -133,3 +143,5 @@ def setup(bot: "TeXBot") -> None:
     Cog: type[TeXBotBaseCog]
     for Cog in cogs:
         bot.add_cog(Cog(bot))
+
+    bot.add_close_callback(DiscordMemberMarkerStore.close_direct_read_connection)
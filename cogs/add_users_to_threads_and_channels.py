@@ -32,29 +32,18 @@ class AddUsersToThreadsAndChannelsCommandsCog(TeXBotBaseCog):
     @staticmethod
     async def autocomplete_get_members(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
-        """Autocomplete callable that generates the set of available selectable members."""
+    ) -> "Sequence[discord.OptionChoice]":
+        """Autocomplete callable that generates the list of matching selectable members."""
         try:
-            main_guild: discord.Guild = ctx.bot.main_guild
             guest_role: discord.Role = await ctx.bot.guest_role
+            return ctx.bot.search_main_guild_member_choices(
+                ctx.value or "",
+                member_filter=lambda member: (
+                    not member.bot and bool(member.get_role(guest_role.id))
+                ),
+            )
         except (GuildDoesNotExistError, GuestRoleDoesNotExistError):
-            return set()
-
-        members: set[discord.Member] = {
-            member
-            for member in main_guild.members
-            if not member.bot and guest_role in member.roles
-        }
-
-        if not ctx.value or ctx.value.startswith("@"):
-            return {
-                discord.OptionChoice(name=f"@{member.name}", value=str(member.id))
-                for member in members
-            }
-
-        return {
-            discord.OptionChoice(name=member.name, value=str(member.id)) for member in members
-        }
+            return []
 
     @staticmethod
     async def autocomplete_get_roles(
@@ -190,7 +179,7 @@ class AddUsersToThreadsAndChannelsCommandsCog(TeXBotBaseCog):
         name="user",
         description="The user to add to the channel.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_members),
+        autocomplete=autocomplete_get_members,
         required=True,
         parameter_name="user_id_str",
     )
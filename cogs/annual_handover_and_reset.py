@@ -233,7 +233,10 @@ class AnnualRolesResetCommandCog(TeXBotBaseCog):
                 content=":hourglass: Removed Member role from all users..."
             )
 
-            await GroupMadeMember._default_manager.all().adelete()
+            try:
+                await GroupMadeMember._default_manager.all().adelete()
+            finally:
+                GroupMadeMember.clear_used_hashed_group_member_ids()
 
             await initial_response.edit(
                 content=":hourglass: Deleted all members from the database..."
@@ -12,7 +12,6 @@ from utils import CommandChecks, TeXBotBaseCog
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
-    from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final
 
@@ -30,74 +29,91 @@ class ArchiveCommandsCog(TeXBotBaseCog):
     @staticmethod
     async def autocomplete_get_non_archival_categories(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of available selectable categories.
+        Autocomplete callable that generates the list of available selectable categories.
 
-        Returns the set of selectable categories.
+        Returns the list of selectable categories.
         Only categories which do not contain the word "archive" are selectable.
         """
         try:
-            main_guild: discord.Guild = ctx.bot.main_guild
+            return [
+                discord.OptionChoice(name=category_name, value=str(category_id))
+                for category_name, category_id in ctx.bot.search_main_guild_channels(
+                    "non_archival_categories",
+                    lambda main_guild: (
+                        category
+                        for category in main_guild.categories
+                        if "archive" not in category.name.lower()
+                    ),
+                    ctx.value or "",
+                )
+            ]
         except BaseDoesNotExistError:
-            return set()
-
-        return {
-            discord.OptionChoice(name=category.name, value=str(category.id))
-            for category in main_guild.categories
-            if "archive" not in category.name.lower()
-        }
+            return []
 
     @staticmethod
     async def autocomplete_get_archival_categories(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of categories to hold archived channels.
+        Autocomplete callable that generates the list of categories to hold archived channels.
 
-        The set of categories only includes those that contain the word "archive".
+        The list of categories only includes those that contain the word "archive".
         These are the categories that channels are to be placed into for archiving.
         It is assumed that the categories have the correct permission configuration.
         """
         try:
-            main_guild: discord.Guild = ctx.bot.main_guild
+            return [
+                discord.OptionChoice(name=category_name, value=str(category_id))
+                for category_name, category_id in ctx.bot.search_main_guild_channels(
+                    "archival_categories",
+                    lambda main_guild: (
+                        category
+                        for category in main_guild.categories
+                        if "archive" in category.name.lower()
+                    ),
+                    ctx.value or "",
+                )
+            ]
         except BaseDoesNotExistError:
-            return set()
-
-        return {
-            discord.OptionChoice(name=category.name, value=str(category.id))
-            for category in main_guild.categories
-            if "archive" in category.name.lower()
-        }
+            return []
 
     @staticmethod
     async def autocomplete_get_non_archived_channels(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of channels that the user can archive.
+        Autocomplete callable that generates the list of channels that the user can archive.
 
         The list of channels will include all types of channels and categories, except those
         that have not been archived.
         """
-        try:
-            main_guild: discord.Guild = ctx.bot.main_guild
-        except BaseDoesNotExistError:
-            return set()
-
         interaction_user: discord.Member | discord.User | None = ctx.interaction.user
+        if not isinstance(interaction_user, discord.Member):
+            return []
 
-        return {
-            discord.OptionChoice(name=channel.name, value=str(channel.id))
-            for channel in main_guild.channels
-            if (
-                not isinstance(channel, discord.CategoryChannel)  # noqa: CAR180
-                and channel.category
-                and "archive" not in channel.category.name.lower()
-                and isinstance(interaction_user, discord.Member)
-                and channel.permissions_for(interaction_user).read_messages
-            )
-        }
+        try:
+            return [
+                discord.OptionChoice(name=channel_name, value=str(channel_id))
+                for channel_name, channel_id in ctx.bot.search_main_guild_channels(
+                    "non_archived_channels",
+                    lambda main_guild: (
+                        channel
+                        for channel in main_guild.channels
+                        if (
+                            not isinstance(channel, discord.CategoryChannel)  # noqa: CAR180
+                            and channel.category
+                            and "archive" not in channel.category.name.lower()
+                            and channel.permissions_for(interaction_user).read_messages
+                        )
+                    ),
+                    ctx.value or "",
+                    permissions_target=interaction_user,
+                )
+            ]
+        except BaseDoesNotExistError:
+            return []
 
     @discord.slash_command(
         name="archive-category", description="Archives the selected category."
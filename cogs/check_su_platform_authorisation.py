@@ -4,11 +4,11 @@ import logging
 from enum import Enum
 from typing import TYPE_CHECKING, override
 
-import bs4
 import discord
 from discord.ext import tasks
 
 from config import settings
+from db.executor import background_database_priority
 from utils import CommandChecks, TeXBotBaseCog
 from utils.error_capture_decorators import (
     capture_guild_does_not_exist_error,
@@ -69,6 +69,9 @@ class CheckSUPlatformAuthorisationBaseCog(TeXBotBaseCog):
 
     async def get_su_platform_access_cookie_status(self) -> SUPlatformAccessCookieStatus:
         """Retrieve the current validity status of the SU platform access cookie."""
+        # NOTE: bs4 is slow to import, so it is only imported once an SU platform page is fetched
+        import bs4
+
         response_object: bs4.BeautifulSoup = bs4.BeautifulSoup(
             await fetch_url_content_with_session(SU_PLATFORM_PROFILE_URL), "html.parser"
         )
@@ -95,6 +98,9 @@ class CheckSUPlatformAuthorisationBaseCog(TeXBotBaseCog):
 
     async def get_su_platform_organisations(self) -> "Iterable[str]":
         """Retrieve the MSL organisations the current SU platform cookie has access to."""
+        # NOTE: bs4 is slow to import, so it is only imported once an SU platform page is fetched
+        import bs4
+
         response_object: bs4.BeautifulSoup = bs4.BeautifulSoup(
             await fetch_url_content_with_session(SU_PLATFORM_PROFILE_URL), "html.parser"
         )
@@ -227,6 +233,7 @@ class CheckSUPlatformAuthorisationTaskCog(CheckSUPlatformAuthorisationBaseCog):
 
     @tasks.loop(**settings["AUTO_SU_PLATFORM_ACCESS_COOKIE_CHECKING_INTERVAL"])
     @capture_guild_does_not_exist_error
+    @background_database_priority
     async def su_platform_access_cookie_check_task(self) -> None:
         """
         Definition of the repeated background task that checks the SU platform access cookie.
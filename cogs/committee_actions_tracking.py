@@ -1,15 +1,17 @@
 """Contains cog classes for tracking committee-actions."""
 
+import bisect
 import contextlib
 import logging
 import random
 import textwrap
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import discord
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist, ValidationError
 from django.db.models import Q
+from django.db.models.signals import post_delete
 
 from db.core.models import AssignedCommitteeAction, DiscordMember
 from exceptions import (
@@ -21,12 +23,12 @@ from exceptions import (
 from utils import CommandChecks, TeXBotBaseCog
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
     from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final
 
-    from utils import TeXBotApplicationContext, TeXBotAutocompleteContext
+    from utils import TeXBot, TeXBotApplicationContext, TeXBotAutocompleteContext
 
 __all__: "Sequence[str]" = (
     "CommitteeActionsTrackingBaseCog",
@@ -51,14 +53,97 @@ class Status(Enum):
 class CommitteeActionsTrackingBaseCog(TeXBotBaseCog):
     """Base cog class that defines methods for committee actions tracking."""
 
-    async def _create_action(
-        self, ctx: "TeXBotApplicationContext", action_user: discord.Member, description: str
-    ) -> AssignedCommitteeAction | None:
+    AUTOCOMPLETE_MAX_RESULTS: "Final[int]" = 25
+
+    @override
+    def __init__(self, bot: "TeXBot") -> None:
         """
-        Create the action object with the given description for the given user.
+        Initialise a new cog instance.
 
-        If action creation is successful, the Action object will be returned.
-        If unsuccessful, a string explaining the error will be returned.
+        Cached action choices are also removed whenever deleting a Discord member
+        cascades to delete the actions assigned to them.
+        """
+        super().__init__(bot)
+
+        post_delete.connect(
+            self._clear_cached_actions_of_deleted_member,
+            sender=DiscordMember,
+            dispatch_uid="clear_cached_actions_of_deleted_member",
+        )
+
+    def _clear_cached_actions_of_deleted_member(
+        self, instance: DiscordMember, **_kwargs: object
+    ) -> None:
+        self.clear_cached_actions(self.bot, instance.discord_id)
+
+    @staticmethod
+    def clear_cached_actions(
+        bot: "TeXBot", discord_member_id: int | str | None = None
+    ) -> None:
+        """
+        Remove the cached autocomplete choices for the actions assigned to the given user.
+
+        The cached choices of every action (as shown to admins) are always removed.
+        If no user is given, the cached choices for every user are removed.
+        """
+        if discord_member_id is None:
+            bot.committee_action_choices.clear()
+            return
+
+        bot.committee_action_choices.pop(int(discord_member_id), None)
+        bot.committee_action_choices.pop(None, None)
+
+    @staticmethod
+    async def get_action_choices(
+        bot: "TeXBot", discord_member_id: int | None
+    ) -> "Sequence[tuple[str, str, int]]":
+        """
+        Return the sorted autocomplete choices for the given user's open actions.
+
+        If no user is given, the choices for every action are returned instead.
+        Choices are only retrieved from the database when they are not already cached.
+        """
+        action_choices: Sequence[tuple[str, str, int]] | None = (
+            bot.committee_action_choices.get(discord_member_id)
+        )
+        if action_choices is not None:
+            return action_choices
+
+        action_choices = (
+            sorted(
+                [
+                    (
+                        action.description.casefold(),
+                        f"{action.description} ({action.status})",
+                        action.id,
+                    )
+                    async for action in AssignedCommitteeAction.objects.all()
+                ]
+            )
+            if discord_member_id is None
+            else sorted(
+                [
+                    (action.description.casefold(), action.description, action.id)
+                    async for action in AssignedCommitteeAction.objects.filter(
+                        (
+                            Q(status=Status.IN_PROGRESS.value)
+                            | Q(status=Status.BLOCKED.value)
+                            | Q(status=Status.NOT_STARTED.value)
+                        ),
+                        discord_member__discord_id=discord_member_id,
+                    )
+                ]
+            )
+        )
+        bot.committee_action_choices[discord_member_id] = action_choices
+        return action_choices
+
+    @staticmethod
+    def _validate_action(action_user: discord.Member, description: str) -> None:
+        """
+        Check that an action with the given description can be assigned to the given user.
+
+        An exception explaining the error is raised if the action is not valid.
         """
         if len(description) >= 200:
             INVALID_DESCRIPTION_ERROR_MESSAGE: Final[str] = (
@@ -73,13 +158,23 @@ class CommitteeActionsTrackingBaseCog(TeXBotBaseCog):
             )
             raise InvalidActionTargetError(message=INVALID_ACTION_TARGET_MESSAGE)
 
+    async def _create_action(
+        self, ctx: "TeXBotApplicationContext", action_user: discord.Member, description: str
+    ) -> AssignedCommitteeAction | None:
+        """
+        Create the action object with the given description for the given user.
+
+        If action creation is successful, the Action object will be returned.
+        If unsuccessful, a string explaining the error will be returned.
+        """
+        self._validate_action(action_user, description)
+
         try:
             action: AssignedCommitteeAction = await AssignedCommitteeAction.objects.acreate(
-                discord_member=(
-                    await DiscordMember.objects.aget_or_create(discord_id=action_user.id)
-                )[0],
+                discord_member=await DiscordMember.aget_or_create_cached(action_user.id),
                 description=description,
             )
+            self.clear_cached_actions(self.bot, action_user.id)
         except ValidationError as create_action_error:
             error_is_already_exits: bool = (
                 "__all__" in create_action_error.message_dict
@@ -113,6 +208,8 @@ class CommitteeActionsTrackingBaseCog(TeXBotBaseCog):
 class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
     """Cog class that defines the committee-actions tracking slash commands functionality."""
 
+    MAX_MESSAGE_LENGTH: "Final[int]" = 1950
+
     committee_actions: discord.SlashCommandGroup = discord.SlashCommandGroup(
         name="committee-actions",
         description="Add, list, remove and reassign tracked committee-actions.",
@@ -150,11 +247,15 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
     @staticmethod
     async def autocomplete_get_user_action_ids(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
-        """Autocomplete callable that provides a set of actions that belong to the user."""
+    ) -> "Sequence[discord.OptionChoice] | Sequence[str]":
+        """
+        Autocomplete callable that provides a list of actions that belong to the user.
+
+        Admins are instead provided with every action, whatever its status.
+        """
         if not ctx.interaction.user:
             logger.debug("User actions autocomplete did not have an interaction user!!")
-            return set()
+            return []
 
         try:
             interaction_user: discord.Member = await ctx.bot.get_member_from_str_id(
@@ -162,31 +263,32 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
             )
         except ValueError:
             logger.debug("User action ID autocomplete could not acquire an interaction user!")
-            return set()
+            return []
 
         admin_role: discord.Role | None = discord.utils.get(
             ctx.bot.main_guild.roles, name="Admin"
         )
 
-        if admin_role and admin_role in interaction_user.roles:
-            return {
-                discord.OptionChoice(
-                    name=f"{action.description} ({action.status})", value=str(action.id)
-                )
-                async for action in AssignedCommitteeAction.objects.select_related().all()
-            }
+        action_choices: Sequence[
+            tuple[str, str, int]
+        ] = await CommitteeActionsTrackingBaseCog.get_action_choices(
+            ctx.bot,
+            None
+            if admin_role and interaction_user.get_role(admin_role.id)
+            else interaction_user.id,
+        )
 
-        return {
-            discord.OptionChoice(name=action.description, value=str(action.id))
-            async for action in AssignedCommitteeAction.objects.filter(
-                (
-                    Q(status=Status.IN_PROGRESS.value)
-                    | Q(status=Status.BLOCKED.value)
-                    | Q(status=Status.NOT_STARTED.value)
-                ),
-                discord_member__discord_id=interaction_user.id,
-            )
-        }
+        casefolded_prefix: str = (ctx.value or "").casefold()
+        start_index: int = bisect.bisect_left(action_choices, (casefolded_prefix,))
+
+        return [
+            discord.OptionChoice(name=choice_name, value=str(action_id))
+            for casefolded_description, choice_name, action_id in action_choices[
+                start_index : start_index
+                + CommitteeActionsTrackingBaseCog.AUTOCOMPLETE_MAX_RESULTS
+            ]
+            if casefolded_description.startswith(casefolded_prefix)
+        ]
 
     @staticmethod
     async def autocomplete_get_action_status(
@@ -272,7 +374,7 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
         name="action",
         description="The action to mark as completed.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_user_action_ids),
+        autocomplete=autocomplete_get_user_action_ids,
         required=True,
         parameter_name="action_id",
     )
@@ -331,6 +433,7 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
             return
 
         await action.aupdate(status=new_status)
+        self.clear_cached_actions(self.bot, action.discord_member.discord_id)
 
         await ctx.respond(
             content=f"Status for action`{action.description}` updated to `{action.status}`",
@@ -344,7 +447,7 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
         name="action",
         description="The action to mark as completed.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_user_action_ids),
+        autocomplete=autocomplete_get_user_action_ids,
         required=True,
         parameter_name="action_id",
     )
@@ -393,6 +496,7 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
         old_description: str = action.description
 
         await action.aupdate(description=new_description)
+        self.clear_cached_actions(self.bot, action.discord_member.discord_id)
 
         await ctx.respond(
             content=f"Action `{old_description}` updated to `{action.description}`!"
@@ -475,21 +579,47 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
             await ctx.respond(content="No committee members were found! Command aborted.")
             return
 
-        success_members: list[discord.Member] = []
+        valid_members: list[discord.Member] = []
         failed_members: str = ""
 
         committee_member: discord.Member
         for committee_member in committee_members:
             try:
-                _: AssignedCommitteeAction | None = await self._create_action(
-                    ctx, action_user=committee_member, description=action_description
-                )
-                success_members.append(committee_member)
+                self._validate_action(committee_member, action_description)
+                valid_members.append(committee_member)
             except (
                 InvalidActionDescriptionError,
                 InvalidActionTargetError,
-            ) as creation_failed_error:
-                failed_members += creation_failed_error.message + "\n"
+            ) as invalid_action_error:
+                failed_members += invalid_action_error.message + "\n"
+
+        try:
+            existing_action_member_ids: AbstractSet[str] = (
+                await AssignedCommitteeAction.abulk_create_for_discord_members(
+                    [valid_member.id for valid_member in valid_members], action_description
+                )
+                if valid_members
+                else set()
+            )
+        except ValidationError as create_actions_error:
+            await self.command_send_error(ctx, message="An unrecoverable error occurred.")
+            logger.critical("Error upon creating Action objects: %s", create_actions_error)
+            await self.bot.close()
+            return
+
+        success_members: list[discord.Member] = []
+
+        valid_member: discord.Member
+        for valid_member in valid_members:
+            if str(valid_member.id) in existing_action_member_ids:
+                failed_members += (
+                    f"User: {valid_member} already has an action "
+                    f"with description: {action_description}!\n"
+                )
+                continue
+
+            self.clear_cached_actions(self.bot, valid_member.id)
+            success_members.append(valid_member)
 
         response_message: str = ""
 
@@ -650,7 +780,7 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
         name="action",
         description="The action to reassign.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_user_action_ids),
+        autocomplete=autocomplete_get_user_action_ids,
         required=True,
         parameter_name="action_id",
     )
@@ -740,6 +870,9 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
             )
             if new_action:
                 await action_to_reassign.adelete()
+                self.clear_cached_actions(
+                    self.bot, action_to_reassign.discord_member.discord_id
+                )
                 await ctx.respond(
                     content=(
                         f"Action `{new_action.description}` successfully "
@@ -753,6 +886,43 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
             await ctx.respond(content=invalid_description_error.message)
             return
 
+    @staticmethod
+    async def _stream_grouped_action_lines(
+        discord_member_ids: "Iterable[str]", statuses: "Iterable[str]"
+    ) -> "AsyncIterator[tuple[str, Sequence[str]]]":
+        """
+        Yield the description & status of each of the given users' actions, grouped by user.
+
+        Actions are filtered & ordered by the database,
+        so each user's actions are yielded as soon as they have all been retrieved.
+        """
+        current_discord_member_id: str | None = None
+        current_action_lines: list[str] = []
+
+        discord_member_id: str
+        description: str
+        action_status: str
+        async for discord_member_id, description, action_status in (
+            AssignedCommitteeAction.objects.filter(
+                status__in=statuses, discord_member__discord_id__in=discord_member_ids
+            )
+            .order_by("discord_member__discord_id", "id")
+            .values_list("discord_member__discord_id", "description", "status")
+        ):
+            if discord_member_id != current_discord_member_id:
+                if current_discord_member_id is not None:
+                    yield current_discord_member_id, current_action_lines
+
+                current_discord_member_id = discord_member_id
+                current_action_lines = []
+
+            current_action_lines.append(
+                f"{description} ({AssignedCommitteeAction.Status(action_status).label})"
+            )
+
+        if current_discord_member_id is not None:
+            yield current_discord_member_id, current_action_lines
+
     @committee_actions.command(name="list-all", description="List all current actions.")
     @discord.option(
         name="ping",
@@ -779,11 +949,10 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
         status: str | None,
     ) -> None:
         """List all actions."""  # NOTE: this doesn't actually list *all* actions as it is possible for non-committee to be actioned.
-        committee_role: discord.Role = await self.bot.committee_role
-
-        actions: list[AssignedCommitteeAction] = [
-            action async for action in AssignedCommitteeAction.objects.select_related().all()
-        ]
+        committee_members: Mapping[str, discord.Member] = {
+            str(committee_member.id): committee_member
+            for committee_member in (await self.bot.committee_role).members
+        }
 
         desired_status: list[str] = (
             [status]
@@ -791,49 +960,54 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
             else [Status.NOT_STARTED.value, Status.IN_PROGRESS.value, Status.BLOCKED.value]
         )
 
-        committee_members: list[discord.Member] = committee_role.members
-
-        committee_actions: dict[discord.Member, list[AssignedCommitteeAction]] = {
-            committee: [
-                action
-                for action in actions
-                if str(action.discord_member) == str(committee.id)
-                and action.status in desired_status
-            ]
-            for committee in committee_members
-        }
-
-        filtered_committee_actions = {
-            committee: actions for committee, actions in committee_actions.items() if actions
-        }
+        actions_found: bool = False
+        pending_message: str = ""
 
-        if not filtered_committee_actions:
-            await ctx.respond(content="No one has any actions that match the request!")
-            logger.debug("No actions found with the status filter: %s", status)
-            return
+        discord_member_id: str
+        action_lines: Sequence[str]
+        async for discord_member_id, action_lines in self._stream_grouped_action_lines(
+            committee_members.keys(), desired_status
+        ):
+            actions_found = True
 
-        all_actions_message: str = "\n".join(
-            [
-                f"\n{committee.mention if ping else committee}, Actions:"
-                f"\n{', \n'.join(str(action.description) + f' ({AssignedCommitteeAction.Status(action.status).label})' for action in actions)}"  # noqa: E501
-                for committee, actions in filtered_committee_actions.items()
-            ],
-        )
+            committee_member: discord.Member = committee_members[discord_member_id]
+            member_actions_message: str = (
+                f"{committee_member.mention if ping else committee_member}, Actions:\n"
+                + ", \n".join(action_lines)
+            )
 
-        if len(all_actions_message) >= 2000:
-            chunk: str
-            for chunk in all_actions_message.split("\n\n"):
-                sub_chunk: str
-                for sub_chunk in textwrap.wrap(
-                    text=chunk,
-                    width=1950,
+            if (
+                pending_message
+                and len(pending_message) + len(member_actions_message) + 2
+                > self.MAX_MESSAGE_LENGTH
+            ):
+                await ctx.respond(content=pending_message)
+                pending_message = ""
+
+            if len(member_actions_message) > self.MAX_MESSAGE_LENGTH:
+                chunk: str
+                for chunk in textwrap.wrap(
+                    text=member_actions_message,
+                    width=self.MAX_MESSAGE_LENGTH,
                     break_long_words=False,
                     fix_sentence_endings=True,
                 ):
-                    await ctx.respond(content=sub_chunk)
+                    await ctx.respond(content=chunk)
+                continue
+
+            pending_message = (
+                f"{pending_message}\n\n{member_actions_message}"
+                if pending_message
+                else member_actions_message
+            )
+
+        if not actions_found:
+            await ctx.respond(content="No one has any actions that match the request!")
+            logger.debug("No actions found with the status filter: %s", status)
             return
 
-        await ctx.respond(content=all_actions_message)
+        if pending_message:
+            await ctx.respond(content=pending_message)
 
     @committee_actions.command(
         name="delete", description="Deletes the specified action from the database completely."
@@ -842,7 +1016,7 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
         name="action",
         description="The action to delete.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_user_action_ids),
+        autocomplete=autocomplete_get_user_action_ids,
         required=True,
         parameter_name="action_id",
     )
@@ -877,6 +1051,7 @@ class CommitteeActionsTrackingSlashCommandsCog(CommitteeActionsTrackingBaseCog):
         action_description: str = action.description
 
         await action.adelete()
+        self.clear_cached_actions(self.bot, action.discord_member.discord_id)
 
         await ctx.respond(content=f"Action `{action_description}` successfully deleted.")
 
@@ -0,0 +1,74 @@
+"""Contains cog classes for any database_query_stats interactions."""
+
+from typing import TYPE_CHECKING
+
+import discord
+
+from utils import CommandChecks, TeXBotBaseCog
+from utils.query_profiler import query_profiler
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import Final
+
+    from utils import TeXBotApplicationContext
+    from utils.query_profiler import QueryProfileStatistics
+
+__all__: "Sequence[str]" = ("DatabaseQueryStatsCommandCog",)
+
+
+class DatabaseQueryStatsCommandCog(TeXBotBaseCog):
+    """Cog class that defines the "/database-query-stats" command and its call-back method."""
+
+    MAX_DISPLAYED_SCOPES: "Final[int]" = 15
+
+    @discord.slash_command(
+        name="database-query-stats",
+        description=(
+            "Displays the database queries made by each command & task since TeX-Bot started."
+        ),
+    )
+    @CommandChecks.check_interaction_user_has_committee_role
+    @CommandChecks.check_interaction_user_in_main_guild
+    async def database_query_stats(self, ctx: "TeXBotApplicationContext") -> None:
+        """
+        Definition & callback response of the "database_query_stats" command.
+
+        The "database_query_stats" command lists the commands & tasks
+        that have spent the most time querying the database,
+        along with how many queries each of their runs made.
+        """
+        if not query_profiler.is_installed:
+            await ctx.respond(
+                "Database queries are not being profiled. "
+                "Set `DATABASE_QUERY_PROFILING` to enable profiling.",
+                ephemeral=True,
+            )
+            return
+
+        query_profile_statistics: Mapping[str, QueryProfileStatistics] = (
+            query_profiler.get_statistics()
+        )
+        if not query_profile_statistics:
+            await ctx.respond("No database queries have been profiled yet.", ephemeral=True)
+            return
+
+        await ctx.respond(
+            "Database queries made since TeX-Bot started "
+            "(sorted by total time spent querying):\n"
+            + "\n".join(
+                (
+                    f"* `{name}`: {statistics.run_count:,} runs, "
+                    f"{statistics.query_count:,} queries "
+                    f"({statistics.query_count / statistics.run_count:.1f} per run, "
+                    f"{statistics.max_query_count:,} max), "
+                    f"{statistics.total_duration:,.0f}ms in total"
+                )
+                for name, statistics in sorted(
+                    query_profile_statistics.items(),
+                    key=lambda item: item[1].total_duration,
+                    reverse=True,
+                )[: self.MAX_DISPLAYED_SCOPES]
+            ),
+            ephemeral=True,
+        )
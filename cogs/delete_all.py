@@ -1,5 +1,6 @@
 """Contains cog classes for any delete_all interactions."""
 
+import time
 from typing import TYPE_CHECKING
 
 import discord
@@ -9,13 +10,18 @@ from db.core.models import (
     DiscordMemberStrikes,
     DiscordReminder,
     GroupMadeMember,
+    LeftDiscordMember,
     SentGetRolesReminderMember,
     SentOneOffIntroductionReminderMember,
 )
+from db.executor import background_database_priority
 from utils import CommandChecks, TeXBotBaseCog
 
+from .committee_actions_tracking import CommitteeActionsTrackingBaseCog
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from typing import Final
 
     from db.core.models.utils import AsyncBaseModel
     from utils import TeXBotApplicationContext
@@ -33,21 +39,57 @@ class DeleteAllCommandsCog(TeXBotBaseCog):
         ),
     )
 
+    PROGRESS_UPDATE_INTERVAL: "Final[float]" = 2.0
+
     @staticmethod
+    @background_database_priority
     async def _delete_all(
         ctx: "TeXBotApplicationContext", delete_model: type["AsyncBaseModel"]
     ) -> None:
-        """Perform the actual deletion process of all instances of the given model class."""
-        await delete_model._default_manager.all().adelete()
+        """
+        Perform the actual deletion process of all instances of the given model class.
 
+        Instances are deleted in chunks, each within its own transaction,
+        so other commands can still write to the database during a large deletion.
+        """
         delete_model_instances_name_plural: str = (
             delete_model.INSTANCES_NAME_PLURAL
             if hasattr(delete_model, "INSTANCES_NAME_PLURAL")
             else "objects"
         )
 
-        await ctx.respond(
-            f"All {delete_model_instances_name_plural} deleted successfully.", ephemeral=True
+        initial_delete_count: int = await delete_model._default_manager.acount()
+
+        progress_message: discord.Interaction | discord.WebhookMessage = await ctx.respond(
+            (
+                f":hourglass: Deleting {initial_delete_count:,} "
+                f"{delete_model_instances_name_plural}... :hourglass:"
+            ),
+            ephemeral=True,
+        )
+
+        deleted_count: int = 0
+        last_progress_update_time: float = time.monotonic()
+
+        chunk_deleted_count: int
+        async for chunk_deleted_count in delete_model.adelete_all_in_chunks():
+            deleted_count += chunk_deleted_count
+
+            if (
+                time.monotonic() - last_progress_update_time
+                >= DeleteAllCommandsCog.PROGRESS_UPDATE_INTERVAL
+            ):
+                await progress_message.edit(
+                    content=(
+                        f":hourglass: Deleted {deleted_count:,} of "
+                        f"{max(initial_delete_count, deleted_count):,} "
+                        f"{delete_model_instances_name_plural}... :hourglass:"
+                    )
+                )
+                last_progress_update_time = time.monotonic()
+
+        await progress_message.edit(
+            content=f"All {delete_model_instances_name_plural} deleted successfully."
         )
 
     @delete_all.command(
@@ -77,7 +119,11 @@ class DeleteAllCommandsCog(TeXBotBaseCog):
         The "delete_all_group_made_members" command uses the _delete_all() function
         to delete all `GroupMadeMember` instance objects stored in the database.
         """
-        await self._delete_all(ctx, delete_model=GroupMadeMember)
+        try:
+            await self._delete_all(ctx, delete_model=GroupMadeMember)
+        finally:
+            # NOTE: Chunks deleted before any error are already committed, so the index of used IDs must be reloaded whether or not every chunk was deleted
+            GroupMadeMember.clear_used_hashed_group_member_ids()
 
     @delete_all.command(
         name="actions", description="Deletes all the Actions from the backend database."
@@ -91,7 +137,10 @@ class DeleteAllCommandsCog(TeXBotBaseCog):
         The "delete-all-actions" command uses the _delete_all() function
         to delete all `Action` instance objects stored in the database.
         """
-        await self._delete_all(ctx, delete_model=AssignedCommitteeAction)
+        try:
+            await self._delete_all(ctx, delete_model=AssignedCommitteeAction)
+        finally:
+            CommitteeActionsTrackingBaseCog.clear_cached_actions(self.bot)
 
     @delete_all.command(
         name="strikes", description="Deletes all the Strikes from the backend database."
@@ -141,3 +190,22 @@ class DeleteAllCommandsCog(TeXBotBaseCog):
         instance objects in the database.
         """  # noqa: E501, W505
         await self._delete_all(ctx, delete_model=SentOneOffIntroductionReminderMember)
+
+    @delete_all.command(
+        name="left-members",
+        description=(
+            "Deletes all stored roles of left members (the aggregated role stats are kept)."
+        ),
+    )
+    @CommandChecks.check_interaction_user_has_committee_role
+    @CommandChecks.check_interaction_user_in_main_guild
+    async def delete_all_left_members(self, ctx: "TeXBotApplicationContext") -> None:
+        """
+        Definition & callback response of the "delete_all_left_members" command.
+
+        The "delete_all_left_members" command uses the _delete_all() function
+        to delete all `LeftDiscordMember` instance objects stored in the database.
+        This compacts the stored left-member statistics,
+        because the `LeftDiscordMemberRoleCount` aggregated counts are not deleted.
+        """
+        await self._delete_all(ctx, delete_model=LeftDiscordMember)
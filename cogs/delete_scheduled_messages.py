@@ -0,0 +1,179 @@
+"""Contains cog classes for deleting TeX-Bot's messages after a delay."""
+
+import datetime
+import logging
+import time
+from typing import TYPE_CHECKING, override
+
+import discord
+from discord.ext import tasks
+from django.db import DatabaseError
+
+from db.core.models import ScheduledMessageDeletion
+from db.executor import background_database_priority
+from utils import TeXBotBaseCog
+from utils.query_profiler import profile_database_queries
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+    from utils import TeXBot
+
+__all__: "Sequence[str]" = ("DeleteScheduledMessagesTaskCog", "schedule_message_deletion")
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+
+def _schedule_in_memory(
+    bot: "TeXBot", channel_id: int, message_id: int, delete_datetime: "datetime.datetime"
+) -> None:
+    """Add the given deletion to TeX-Bot's timer wheel, unless it is already pending."""
+    if (channel_id, message_id) in bot.message_deletion_timer_wheel:
+        return
+
+    bot.message_deletion_timer_wheel.schedule(
+        (channel_id, message_id), delete_datetime.timestamp()
+    )
+
+
+async def schedule_message_deletion(
+    bot: "TeXBot", message: discord.Message, delete_after: "datetime.timedelta"
+) -> None:
+    """
+    Schedule the given message to be deleted once the given amount of time has passed.
+
+    The scheduled deletion is stored in the database, so it still occurs after a restart.
+    """
+    delete_datetime: datetime.datetime = discord.utils.utcnow() + delete_after
+
+    await ScheduledMessageDeletion.objects.acreate(
+        channel_id=message.channel.id, message_id=message.id, delete_datetime=delete_datetime
+    )
+
+    # NOTE: Deletions already pending are skipped, so a deletion stored while the stored deletions are being loaded is only scheduled once
+    _schedule_in_memory(bot, message.channel.id, message.id, delete_datetime)
+
+
+class DeleteScheduledMessagesTaskCog(TeXBotBaseCog):
+    """Cog class that defines the delete_scheduled_messages task."""
+
+    # NOTE: Deletions that fail because of a rate limit or a Discord server error are retried after this delay
+    FAILED_DELETION_RETRY_DELAY: "Final[datetime.timedelta]" = datetime.timedelta(minutes=1)
+
+    @override
+    def __init__(self, bot: "TeXBot") -> None:
+        """Start all task managers when this cog is initialised."""
+        _ = self.delete_scheduled_messages.start()
+
+        super().__init__(bot)
+
+    @override
+    def cog_unload(self) -> None:
+        """
+        Unload-hook that ends all running tasks whenever the tasks cog is unloaded.
+
+        This may be run dynamically or when the bot closes.
+        """
+        self.delete_scheduled_messages.cancel()
+
+    async def _delete_message(self, channel_id: int, message_id: int) -> bool:
+        """
+        Delete the given message, returning whether its scheduled deletion is complete.
+
+        Deletions that fail because of a rate limit or a Discord server error are incomplete,
+        so are retried later.
+        """
+        http_error: discord.HTTPException
+        try:
+            await (
+                self.bot.get_partial_messageable(channel_id)
+                .get_partial_message(message_id)
+                .delete()
+            )
+        except discord.NotFound:
+            logger.debug(
+                "Scheduled message %s was already deleted from channel %s",
+                message_id,
+                channel_id,
+            )
+        except discord.HTTPException as http_error:
+            if http_error.status == 429 or http_error.status >= 500:
+                logger.debug(
+                    "Failed to delete scheduled message %s from channel %s, will retry: %s",
+                    message_id,
+                    channel_id,
+                    http_error,
+                )
+                return False
+
+            logger.warning(
+                "Failed to delete scheduled message %s from channel %s: %s",
+                message_id,
+                channel_id,
+                http_error,
+            )
+
+        return True
+
+    @tasks.loop(seconds=1)
+    @background_database_priority
+    @profile_database_queries
+    async def delete_scheduled_messages(self) -> None:
+        """Recurring task to delete every message whose scheduled deletion time has passed."""
+        due_message_deletions: Sequence[tuple[int, int]] = (
+            self.bot.message_deletion_timer_wheel.advance(time.time())
+        )
+        if not due_message_deletions:
+            return
+
+        completed_message_ids: list[str] = []
+
+        channel_id: int
+        message_id: int
+        for channel_id, message_id in due_message_deletions:
+            if await self._delete_message(channel_id, message_id):
+                completed_message_ids.append(str(message_id))
+            else:
+                self.bot.message_deletion_timer_wheel.schedule(
+                    (channel_id, message_id),
+                    time.time() + self.FAILED_DELETION_RETRY_DELAY.total_seconds(),
+                )
+
+        if not completed_message_ids:
+            return
+
+        database_error: DatabaseError
+        try:
+            await ScheduledMessageDeletion.objects.filter(
+                _message_id__in=completed_message_ids
+            ).adelete()
+        except DatabaseError as database_error:
+            # NOTE: Any stored deletions left behind are loaded again after a restart, when deleting their already deleted messages is skipped
+            logger.warning(
+                "Failed to remove %s completed scheduled message deletions: %s",
+                len(completed_message_ids),
+                database_error,
+            )
+
+    @delete_scheduled_messages.before_loop
+    @background_database_priority
+    async def before_tasks(self) -> None:
+        """Pre-execution hook, loading the stored scheduled deletions once the bot is ready."""
+        await self.bot.wait_until_ready()
+
+        scheduled_message_deletion: ScheduledMessageDeletion
+        async for scheduled_message_deletion in ScheduledMessageDeletion.objects.all():
+            _schedule_in_memory(
+                self.bot,
+                scheduled_message_deletion.channel_id,
+                scheduled_message_deletion.message_id,
+                scheduled_message_deletion.delete_datetime,
+            )
+
+        logger.debug(
+            "Loaded %s stored scheduled message deletions",
+            len(self.bot.message_deletion_timer_wheel),
+        )
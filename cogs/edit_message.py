@@ -11,7 +11,6 @@ from utils import CommandChecks, TeXBotBaseCog
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
-    from collections.abc import Set as AbstractSet
 
     from utils import TeXBotApplicationContext, TeXBotAutocompleteContext
 
@@ -25,21 +24,21 @@ class EditMessageCommandCog(TeXBotBaseCog):
     @override
     async def autocomplete_get_text_channels(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of available selectable channels.
+        Autocomplete callable that generates the list of available selectable channels.
 
         The list of available selectable channels is unique to each member and is used in any
         of the "edit-message" slash-command options that have a channel input-type.
         """
         if not ctx.interaction.user:
-            return set()
+            return []
 
         try:
             if not await ctx.bot.check_user_has_committee_role(ctx.interaction.user):
-                return set()
+                return []
         except (BaseDoesNotExistError, DiscordMemberNotInMainGuildError):
-            return set()
+            return []
 
         return await TeXBotBaseCog.autocomplete_get_text_channels(ctx)
 
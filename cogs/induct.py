@@ -1,6 +1,5 @@
 """Contains cog classes for any induction interactions."""
 
-import contextlib
 import logging
 import random
 from typing import TYPE_CHECKING
@@ -8,7 +7,7 @@ from typing import TYPE_CHECKING
 import discord
 
 from config import settings
-from db.core.models import IntroductionReminderOptOutMember
+from db.marker_store import introduction_reminder_opt_out_markers
 from exceptions import (
     ApplicantRoleDoesNotExistError,
     CommitteeRoleDoesNotExistError,
@@ -21,7 +20,6 @@ from utils.error_capture_decorators import capture_guild_does_not_exist_error
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
-    from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final, Literal
 
@@ -65,12 +63,7 @@ class InductSendMessageCog(TeXBotBaseCog):
         if guest_role in before.roles or guest_role not in after.roles:
             return
 
-        with contextlib.suppress(IntroductionReminderOptOutMember.DoesNotExist):
-            await (
-                await IntroductionReminderOptOutMember.objects.aget(
-                    discord_member__discord_id=before.id
-                )
-            ).adelete()
+        await introduction_reminder_opt_out_markers.aunmark((before.id,))
 
         reminder_message: discord.Message
         async for reminder_message in after.history():
@@ -288,34 +281,23 @@ class InductSlashCommandCog(BaseInductCog):
     @staticmethod
     async def autocomplete_get_members(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of available selectable members.
+        Autocomplete callable that generates the list of matching selectable members.
 
         This list of selectable members is used in any of the "induct" slash-command options
         that have a member input-type.
         """
         try:
-            main_guild: discord.Guild = ctx.bot.main_guild
             guest_role: discord.Role = await ctx.bot.guest_role
+            return ctx.bot.search_main_guild_member_choices(
+                ctx.value or "",
+                member_filter=lambda member: (
+                    not member.bot and not member.get_role(guest_role.id)
+                ),
+            )
         except (GuildDoesNotExistError, GuestRoleDoesNotExistError):
-            return set()
-
-        members: set[discord.Member] = {
-            member
-            for member in main_guild.members
-            if not member.bot and guest_role not in member.roles
-        }
-
-        if not ctx.value or ctx.value.startswith("@"):
-            return {
-                discord.OptionChoice(name=f"@{member.name}", value=str(member.id))
-                for member in members
-            }
-
-        return {
-            discord.OptionChoice(name=member.name, value=str(member.id)) for member in members
-        }
+            return []
 
     @discord.slash_command(
         name="induct",
@@ -327,7 +309,7 @@ class InductSlashCommandCog(BaseInductCog):
         name="user",
         description="The user to induct.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_members),
+        autocomplete=autocomplete_get_members,
         required=True,
         parameter_name="str_induct_member_id",
     )
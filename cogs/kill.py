@@ -80,16 +80,29 @@ class KillCommandCog(TeXBotBaseCog):
             else await response.original_response()
         )
 
-        button_interaction: discord.Interaction = await self.bot.wait_for(
-            "interaction",
-            check=lambda interaction: (
-                interaction.type == discord.InteractionType.component  # noqa: CAR180
-                and interaction.message.id == confirmation_message.id
-                and ((committee_role in interaction.user.roles) if committee_role else True)
-                and "custom_id" in interaction.data
-                and interaction.data["custom_id"] in {"shutdown_confirm", "shutdown_cancel"}
-            ),
-        )
+        try:
+            button_interaction: discord.Interaction = (
+                await self.bot.wait_for_component_interaction(
+                    {"shutdown_confirm", "shutdown_cancel"},
+                    confirmation_message.channel.id,
+                    user_id=None,
+                    check=lambda interaction: (
+                        interaction.message is not None  # noqa: CAR180
+                        and interaction.message.id == confirmation_message.id
+                        and (
+                            (committee_role in interaction.user.roles)
+                            if committee_role
+                            else True
+                        )
+                    ),
+                )
+            )
+        except TimeoutError:
+            await confirmation_message.edit(
+                content="Shutdown confirmation timed out, so shutdown has been cancelled.",
+                view=None,
+            )
+            return
 
         if button_interaction.data["custom_id"] == "shutdown_confirm":  # type: ignore[index, typeddict-item]
             await confirmation_message.edit(
@@ -148,34 +148,23 @@ class MakeApplicantSlashCommandCog(BaseMakeApplicantCog):
     @staticmethod
     async def autocomplete_get_members(
         ctx: "TeXBotAutocompleteContext",
-    ) -> set[discord.OptionChoice]:
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of available selectable members.
+        Autocomplete callable that generates the list of matching selectable members.
 
         This list of selectable members is used in any of the "make_applicant" slash-command
         options that have a member input-type.
         """
         try:
-            main_guild: discord.Guild = ctx.bot.main_guild
             applicant_role: discord.Role = await ctx.bot.applicant_role
+            return ctx.bot.search_main_guild_member_choices(
+                ctx.value or "",
+                member_filter=lambda member: (
+                    not member.bot and not member.get_role(applicant_role.id)
+                ),
+            )
         except (GuildDoesNotExistError, ApplicantRoleDoesNotExistError):
-            return set()
-
-        members: set[discord.Member] = {
-            member
-            for member in main_guild.members
-            if not member.bot and applicant_role not in member.roles
-        }
-
-        if not ctx.value or ctx.value.startswith("@"):
-            return {
-                discord.OptionChoice(name=f"@{member.name}", value=str(member.id))
-                for member in members
-            }
-
-        return {
-            discord.OptionChoice(name=member.name, value=str(member.id)) for member in members
-        }
+            return []
 
     @discord.slash_command(
         name="make-applicant",
@@ -185,7 +174,7 @@ class MakeApplicantSlashCommandCog(BaseMakeApplicantCog):
         name="user",
         description="The user to make an Applicant.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_members),
+        autocomplete=autocomplete_get_members,
         required=True,
         parameter_name="str_applicant_member_id",
     )
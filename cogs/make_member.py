@@ -130,11 +130,11 @@ class MakeMemberCommandCog(TeXBotBaseCog):
                 )
                 return
 
-            if await GroupMadeMember.objects.filter(
-                hashed_group_member_id=GroupMadeMember.hash_group_member_id(
+            if await GroupMadeMember.ais_hashed_group_member_id_used(
+                GroupMadeMember.hash_group_member_id(
                     group_member_id, self.bot.group_member_id_type
                 )
-            ).aexists():
+            ):
                 await ctx.followup.send(
                     content=(
                         ":information_source: No changes made. This student ID has already "
@@ -222,6 +222,8 @@ class MemberCountCommandCog(TeXBotBaseCog):
             await ctx.followup.send(
                 content=(
                     f"{self.bot.group_full_name} has "
-                    f"{await fetch_community_group_members_count()} members! :tada:"
+                    f"{await fetch_community_group_members_count()} members! :tada:\n"
+                    f"{await GroupMadeMember.aget_claimed_count()} of them "
+                    "have claimed their membership on this server."
                 )
             )
@@ -7,13 +7,14 @@ import re
 from typing import TYPE_CHECKING, override
 
 import discord
-import parsedatetime
 from discord.ext import tasks
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from db.core.models import DiscordMember, DiscordReminder
+from db.executor import background_database_priority
 from utils import TeXBotBaseCog
+from utils.query_profiler import profile_database_queries
 
 if TYPE_CHECKING:
     import time
@@ -210,6 +211,9 @@ class RemindMeCommandCog(TeXBotBaseCog):
 
         The "remind_me" command responds with the given message after the specified time.
         """
+        # NOTE: parsedatetime is slow to import, so it is only imported once a reminder time is parsed
+        import parsedatetime
+
         parsed_time: tuple[time.struct_time, int] = parsedatetime.Calendar().parseDT(
             delay, tzinfo=timezone.get_current_timezone()
         )
@@ -226,9 +230,7 @@ class RemindMeCommandCog(TeXBotBaseCog):
 
         try:
             reminder: DiscordReminder = await DiscordReminder.objects.acreate(  # type: ignore[misc]
-                discord_member=(
-                    await DiscordMember.objects.aget_or_create(discord_id=ctx.user.id)
-                )[0],
+                discord_member=await DiscordMember.aget_or_create_cached(ctx.user.id),
                 message=message or "",
                 channel_id=ctx.channel_id,
                 send_datetime=parsed_time[0],
@@ -288,6 +290,8 @@ class ClearRemindersBacklogTaskCog(TeXBotBaseCog):
         self.clear_reminders_backlog.cancel()
 
     @tasks.loop(minutes=15)
+    @background_database_priority
+    @profile_database_queries
     async def clear_reminders_backlog(self) -> None:
         """Recurring task to send any late Discord reminders still stored in the database."""
         TEXTABLE_CHANNEL_TYPES: Final[frozenset[discord.ChannelType]] = frozenset(
@@ -10,20 +10,24 @@ from discord.ext import tasks
 
 import utils
 from config import settings
-from db.core.models import DiscordMember, SentGetRolesReminderMember
+from db.executor import background_database_priority
+from db.marker_store import sent_get_roles_reminder_markers
 from exceptions import GuestRoleDoesNotExistError
 from utils import TeXBotBaseCog
 from utils.error_capture_decorators import (
     ErrorCaptureDecorators,
     capture_guild_does_not_exist_error,
 )
+from utils.query_profiler import profile_database_queries
 
 if TYPE_CHECKING:
     import datetime
     from collections.abc import Sequence
+    from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final
 
+    from db.marker_store import DiscordMemberMarkBuffer
     from utils import TeXBot
 
 __all__: "Sequence[str]" = ("SendGetRolesRemindersTaskCog",)
@@ -59,6 +63,8 @@ class SendGetRolesRemindersTaskCog(TeXBotBaseCog):
         close_func=ErrorCaptureDecorators.critical_error_close_func,
     )
     @capture_guild_does_not_exist_error
+    @background_database_priority
+    @profile_database_queries
     async def send_get_roles_reminders(self) -> None:
         """
         Recurring task to send an opt-in roles reminder message to Discord members' DMs.
@@ -108,80 +114,83 @@ class SendGetRolesRemindersTaskCog(TeXBotBaseCog):
             }
         )
 
-        member: discord.Member
-        for member in main_guild.members:
-            member_requires_opt_in_roles_reminder: bool = (
-                not member.bot
-                and utils.is_member_inducted(member)
-                and not any(
-                    opt_in_role_name.lower() in {role.name.lower() for role in member.roles}
-                    for opt_in_role_name in OPT_IN_ROLE_NAMES
-                )
-            )
-            if not member_requires_opt_in_roles_reminder:
-                continue
-
-            sent_get_roles_reminder_member_exists: bool = await (
-                SentGetRolesReminderMember.objects.filter(discord_member__discord_id=member.id)
-            ).aexists()
-            if sent_get_roles_reminder_member_exists:
-                continue
-
-            guest_role_received_time: datetime.datetime | None
-            try:
-                guest_role_received_time = await anext(
-                    log.created_at
-                    async for log in main_guild.audit_logs(
-                        action=AuditLogAction.member_role_update
-                    )
-                    if (
-                        log.target == member
-                        and guest_role not in log.before.roles
-                        and guest_role in log.after.roles
+        reminded_discord_ids: AbstractSet[
+            str
+        ] = await sent_get_roles_reminder_markers.aget_marked_discord_ids(
+            member.id for member in main_guild.members
+        )
+
+        # NOTE: Sent reminders are recorded in bounded batches while the run continues, so a crash part-way through a long run cannot cause every reminder to be resent
+        sent_reminder_marks: DiscordMemberMarkBuffer
+        async with sent_get_roles_reminder_markers.abuffer_marks() as sent_reminder_marks:
+            member: discord.Member
+            for member in main_guild.members:
+                member_requires_opt_in_roles_reminder: bool = (
+                    not member.bot
+                    and utils.is_member_inducted(member)
+                    and not any(
+                        opt_in_role_name.lower()
+                        in {role.name.lower() for role in member.roles}
+                        for opt_in_role_name in OPT_IN_ROLE_NAMES
                     )
                 )
-            except (StopIteration, StopAsyncIteration):
-                guest_role_received_time = None
+                if not member_requires_opt_in_roles_reminder:
+                    continue
 
-            if guest_role_received_time is not None:
-                time_since_role_received: datetime.timedelta = (
-                    discord.utils.utcnow() - guest_role_received_time
-                )
-                if time_since_role_received <= settings["SEND_GET_ROLES_REMINDERS_DELAY"]:
+                if str(member.id) in reminded_discord_ids:
                     continue
 
-            if (
-                member not in main_guild.members
-            ):  # HACK: Caching errors can cause the member to no longer be part of the guild at this point, so this check must be performed before sending that member a message # noqa: FIX004
-                logger.info(
-                    (
-                        "Member with ID: %s does not need to be sent a reminder "
-                        "because they have left the server."
-                    ),
-                    member.id,
-                )
-                continue
-
-            try:
-                await member.send(
-                    "Hey! It seems like you have been given the `@Guest` role "
-                    f"on the {self.bot.group_short_name} Discord server "
-                    " but have not yet nabbed yourself any opt-in roles.\n"
-                    f"You can head to {roles_channel_mention} "
-                    "and click on the icons to get optional roles like pronouns "
-                    "and year group identifiers."
-                )
-            except discord.Forbidden:
-                logger.info(
-                    "Failed to open DM channel to user, %s, so no role reminder was sent.",
-                    member,
-                )
+                guest_role_received_time: datetime.datetime | None
+                try:
+                    guest_role_received_time = await anext(
+                        log.created_at
+                        async for log in main_guild.audit_logs(
+                            action=AuditLogAction.member_role_update
+                        )
+                        if (
+                            log.target == member
+                            and guest_role not in log.before.roles
+                            and guest_role in log.after.roles
+                        )
+                    )
+                except (StopIteration, StopAsyncIteration):
+                    guest_role_received_time = None
+
+                if guest_role_received_time is not None:
+                    time_since_role_received: datetime.timedelta = (
+                        discord.utils.utcnow() - guest_role_received_time
+                    )
+                    if time_since_role_received <= settings["SEND_GET_ROLES_REMINDERS_DELAY"]:
+                        continue
+
+                if (
+                    member not in main_guild.members
+                ):  # HACK: Caching errors can cause the member to no longer be part of the guild at this point, so this check must be performed before sending that member a message # noqa: FIX004
+                    logger.info(
+                        (
+                            "Member with ID: %s does not need to be sent a reminder "
+                            "because they have left the server."
+                        ),
+                        member.id,
+                    )
+                    continue
+
+                try:
+                    await member.send(
+                        "Hey! It seems like you have been given the `@Guest` role "
+                        f"on the {self.bot.group_short_name} Discord server "
+                        " but have not yet nabbed yourself any opt-in roles.\n"
+                        f"You can head to {roles_channel_mention} "
+                        "and click on the icons to get optional roles like pronouns "
+                        "and year group identifiers."
+                    )
+                except discord.Forbidden:
+                    logger.info(
+                        "Failed to open DM channel to user, %s, so no role reminder was sent.",
+                        member,
+                    )
 
-            await SentGetRolesReminderMember.objects.acreate(
-                discord_member=(
-                    await DiscordMember.objects.aget_or_create(discord_id=member.id)
-                )[0]
-            )
+                await sent_reminder_marks.aadd(member.id)
 
     @send_get_roles_reminders.before_loop
     async def before_tasks(self) -> None:
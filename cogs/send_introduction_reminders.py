@@ -9,14 +9,14 @@ import emoji
 from discord import ui
 from discord.ext import tasks
 from discord.ui import View
-from django.core.exceptions import ValidationError
 
 import utils
 from config import settings
-from db.core.models import (
-    DiscordMember,
-    IntroductionReminderOptOutMember,
-    SentOneOffIntroductionReminderMember,
+from db.core.models import SentOneOffIntroductionReminderMember
+from db.executor import background_database_priority
+from db.marker_store import (
+    introduction_reminder_opt_out_markers,
+    sent_one_off_introduction_reminder_markers,
 )
 from exceptions import DiscordMemberNotInMainGuildError, GuestRoleDoesNotExistError
 from utils import TeXBotBaseCog
@@ -24,12 +24,15 @@ from utils.error_capture_decorators import (
     ErrorCaptureDecorators,
     capture_guild_does_not_exist_error,
 )
+from utils.query_profiler import profile_database_queries
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final
 
+    from db.marker_store import DiscordMemberMarkBuffer
     from utils import TeXBot
 
 __all__: "Sequence[str]" = ("SendIntroductionRemindersTaskCog",)
@@ -73,6 +76,8 @@ class SendIntroductionRemindersTaskCog(TeXBotBaseCog):
         close_func=ErrorCaptureDecorators.critical_error_close_func,
     )
     @capture_guild_does_not_exist_error
+    @background_database_priority
+    @profile_database_queries
     async def send_introduction_reminders(self) -> None:
         """
         Recurring task to send an introduction reminder message to Discord members' DMs.
@@ -86,104 +91,110 @@ class SendIntroductionRemindersTaskCog(TeXBotBaseCog):
         # NOTE: Shortcut accessors are placed at the top of the function so that the exceptions they raise are displayed before any further errors may be sent
         main_guild: discord.Guild = self.bot.main_guild
 
-        member: discord.Member
-        for member in main_guild.members:
-            if utils.is_member_inducted(member) or member.bot:
-                continue
-
-            if not member.joined_at:
-                logger.error(
-                    (
-                        "Member with ID: %s could not be checked whether to send "
-                        "introduction_reminder, because their %s attribute "
-                        "was None."
-                    ),
-                    member.id,
-                    repr("joined_at"),
-                )
-                continue
+        one_off_reminded_discord_ids: AbstractSet[str] = (
+            await sent_one_off_introduction_reminder_markers.aget_marked_discord_ids(
+                member.id for member in main_guild.members
+            )
+            if settings["SEND_INTRODUCTION_REMINDERS"] == "once"
+            else set()
+        )
+        opted_out_discord_ids: AbstractSet[
+            str
+        ] = await introduction_reminder_opt_out_markers.aget_marked_discord_ids(
+            member.id for member in main_guild.members
+        )
 
-            member_needs_one_off_reminder: bool = (
-                settings["SEND_INTRODUCTION_REMINDERS"] == "once"
-                and not await (
-                    SentOneOffIntroductionReminderMember.objects.filter(
-                        discord_member__discord_id=member.id,
+        # NOTE: Sent reminders are recorded in bounded batches while the run continues, so a crash part-way through a long run cannot cause every reminder to be resent
+        sent_reminder_marks: DiscordMemberMarkBuffer
+        async with (
+            sent_one_off_introduction_reminder_markers.abuffer_marks() as sent_reminder_marks
+        ):
+            member: discord.Member
+            for member in main_guild.members:
+                if utils.is_member_inducted(member) or member.bot:
+                    continue
+
+                if not member.joined_at:
+                    logger.error(
+                        (
+                            "Member with ID: %s could not be checked whether to send "
+                            "introduction_reminder, because their %s attribute "
+                            "was None."
+                        ),
+                        member.id,
+                        repr("joined_at"),
                     )
-                ).aexists()
-            )
-            member_needs_recurring_reminder: bool = (
-                settings["SEND_INTRODUCTION_REMINDERS"] == "interval"
-            )
-            member_recently_joined: bool = (
-                discord.utils.utcnow() - member.joined_at
-            ) <= settings["SEND_INTRODUCTION_REMINDERS_DELAY"]
-            member_opted_out_from_reminders: bool = await (
-                IntroductionReminderOptOutMember.objects.filter(
-                    discord_member__discord_id=member.id,
+                    continue
+
+                member_needs_one_off_reminder: bool = (
+                    settings["SEND_INTRODUCTION_REMINDERS"] == "once"
+                    and str(member.id) not in one_off_reminded_discord_ids
+                )
+                member_needs_recurring_reminder: bool = (
+                    settings["SEND_INTRODUCTION_REMINDERS"] == "interval"
+                )
+                member_recently_joined: bool = (
+                    discord.utils.utcnow() - member.joined_at
+                ) <= settings["SEND_INTRODUCTION_REMINDERS_DELAY"]
+                member_opted_out_from_reminders: bool = str(member.id) in opted_out_discord_ids
+                member_needs_reminder: bool = (
+                    (member_needs_one_off_reminder or member_needs_recurring_reminder)
+                    and not member_recently_joined
+                    and not member_opted_out_from_reminders
                 )
-            ).aexists()
-            member_needs_reminder: bool = (
-                (member_needs_one_off_reminder or member_needs_recurring_reminder)
-                and not member_recently_joined
-                and not member_opted_out_from_reminders
-            )
 
-            if not member_needs_reminder:
-                continue
+                if not member_needs_reminder:
+                    continue
+
+                async for message in member.history():
+                    if (
+                        message.components  # noqa: CAR180
+                        and isinstance(message.components[0], discord.ActionRow)
+                        and isinstance(message.components[0].children[0], discord.Button)
+                        and (
+                            message.components[0].children[0].custom_id
+                            == "opt_out_introduction_reminders_button"
+                        )
+                    ):
+                        await message.edit(view=None)
 
-            async for message in member.history():
                 if (
-                    message.components  # noqa: CAR180
-                    and isinstance(message.components[0], discord.ActionRow)
-                    and isinstance(message.components[0].children[0], discord.Button)
-                    and (
-                        message.components[0].children[0].custom_id
-                        == "opt_out_introduction_reminders_button"
+                    member not in main_guild.members
+                ):  # HACK: Caching errors can cause the member to no longer be part of the guild at this point, so this check must be performed before sending that member a message # noqa: FIX004
+                    logger.info(
+                        (
+                            "Member with ID: %s does not need to be sent a reminder "
+                            "because they have left the server."
+                        ),
+                        member.id,
                     )
-                ):
-                    await message.edit(view=None)
-
-            if (
-                member not in main_guild.members
-            ):  # HACK: Caching errors can cause the member to no longer be part of the guild at this point, so this check must be performed before sending that member a message # noqa: FIX004
-                logger.info(
-                    (
-                        "Member with ID: %s does not need to be sent a reminder "
-                        "because they have left the server."
-                    ),
-                    member.id,
-                )
-                continue
+                    continue
 
-            try:
-                await member.send(
-                    content=(
-                        "Hey! It seems like you joined "
-                        f"the {self.bot.group_short_name} Discord server "
-                        "but have not yet introduced yourself.\n"
-                        "You will only get access to the rest of the server after sending "
-                        "an introduction message."
-                    ),
-                    view=(
-                        self.OptOutIntroductionRemindersView(self.bot)
-                        if settings["SEND_INTRODUCTION_REMINDERS"] == "interval"
-                        else None  # type: ignore[arg-type]
-                    ),
-                )
-            except discord.Forbidden:
-                logger.info(
-                    (
-                        "Failed to open DM channel with user, %s, "
-                        "so no induction reminder was sent."
-                    ),
-                    member,
-                )
+                try:
+                    await member.send(
+                        content=(
+                            "Hey! It seems like you joined "
+                            f"the {self.bot.group_short_name} Discord server "
+                            "but have not yet introduced yourself.\n"
+                            "You will only get access to the rest of the server after sending "
+                            "an introduction message."
+                        ),
+                        view=(
+                            self.OptOutIntroductionRemindersView(self.bot)
+                            if settings["SEND_INTRODUCTION_REMINDERS"] == "interval"
+                            else None  # type: ignore[arg-type]
+                        ),
+                    )
+                except discord.Forbidden:
+                    logger.info(
+                        (
+                            "Failed to open DM channel with user, %s, "
+                            "so no induction reminder was sent."
+                        ),
+                        member,
+                    )
 
-            await SentOneOffIntroductionReminderMember.objects.acreate(
-                discord_member=(
-                    await DiscordMember.objects.aget_or_create(discord_id=member.id)
-                )[0],
-            )
+                await sent_reminder_marks.aadd(member.id)
 
     class OptOutIntroductionRemindersView(View):
         """
@@ -285,29 +296,7 @@ class SendIntroductionRemindersTaskCog(TeXBotBaseCog):
                 return
 
             if BUTTON_WILL_MAKE_OPT_OUT:
-                try:
-                    await IntroductionReminderOptOutMember.objects.acreate(
-                        discord_member=(
-                            await DiscordMember.objects.aget_or_create(
-                                discord_id=interaction_member.id
-                            )
-                        )[0],
-                    )
-                except ValidationError as create_introduction_reminder_opt_out_member_error:
-                    error_is_already_exists: bool = (
-                        "discord_id"
-                        in create_introduction_reminder_opt_out_member_error.message_dict
-                        and any(
-                            "already exists" in error
-                            for error in (
-                                create_introduction_reminder_opt_out_member_error.message_dict[
-                                    "discord_id"
-                                ]
-                            )
-                        )
-                    )
-                    if not error_is_already_exists:
-                        raise
+                await introduction_reminder_opt_out_markers.amark((interaction_member.id,))
 
                 button.style = discord.ButtonStyle.green
                 button.label = "Opt back in to introduction reminders"
@@ -318,16 +307,7 @@ class SendIntroductionRemindersTaskCog(TeXBotBaseCog):
                 await interaction.response.edit_message(view=self)
 
             else:
-                try:
-                    introduction_reminder_opt_out_member: IntroductionReminderOptOutMember = (
-                        await IntroductionReminderOptOutMember.objects.aget(
-                            discord_member__discord_id=interaction_member.id
-                        )
-                    )
-                except IntroductionReminderOptOutMember.DoesNotExist:
-                    pass
-                else:
-                    await introduction_reminder_opt_out_member.adelete()
+                await introduction_reminder_opt_out_markers.aunmark((interaction_member.id,))
 
                 button.style = discord.ButtonStyle.red
                 button.label = "Opt-out of introduction reminders"
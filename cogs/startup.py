@@ -19,6 +19,7 @@ from exceptions import (
     RolesChannelDoesNotExistError,
 )
 from utils import TeXBotBaseCog
+from utils.lazy_imports import prewarm_lazily_imported_modules
 from utils.msl import fetch_community_group_members_list
 
 if TYPE_CHECKING:
@@ -150,3 +151,5 @@ class StartupCog(TeXBotBaseCog):
                 await self.bot.close()
 
         logger.info("Ready! Logged in as %s", self.bot.user)
+
+        await prewarm_lazily_imported_modules()
@@ -1,26 +1,50 @@
 """Contains cog classes for any stats interactions."""
 
+import functools
+import logging
 import math
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import discord
+from discord.ext import tasks
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError
+from django.db.models import Sum
 
 from config import settings
-from db.core.models import LeftDiscordMember
+from db.core.models import (
+    DiscordMemberMessageActivity,
+    LeftDiscordMember,
+    LeftDiscordMemberRoleCount,
+    MessageActivityIndexedChannel,
+)
+from db.executor import background_database_priority
+from exceptions import GuestRoleDoesNotExistError
 from utils import CommandChecks, TeXBotBaseCog
-from utils.error_capture_decorators import capture_guild_does_not_exist_error
+from utils.error_capture_decorators import (
+    ErrorCaptureDecorators,
+    capture_guild_does_not_exist_error,
+)
+from utils.query_profiler import profile_database_queries
 
+from .activity import MessageActivityBuffer
 from .counts import get_channel_message_counts, get_server_message_counts
 from .graphs import amount_of_time_formatter, plot_bar_chart
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterable, Mapping, Sequence
+    import datetime
+    from collections.abc import Mapping, Sequence
+    from collections.abc import Set as AbstractSet
+    from logging import Logger
     from typing import Final
 
-    from utils import TeXBotApplicationContext
+    from utils import TeXBot, TeXBotApplicationContext
 
-__all__: "Sequence[str]" = ("StatsCommandsCog",)
+__all__: "Sequence[str]" = ("MessageActivityIndexTaskCog", "StatsCommandsCog")
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
 
 
 class StatsCommandsCog(TeXBotBaseCog):
@@ -120,7 +144,7 @@ class StatsCommandsCog(TeXBotBaseCog):
 
         await ctx.channel.send(
             f"**{ctx.user.display_name}** used `/{ctx.command}`",
-            file=plot_bar_chart(
+            file=await plot_bar_chart(
                 message_counts,
                 x_label="Role Name",
                 y_label=(
@@ -178,7 +202,7 @@ class StatsCommandsCog(TeXBotBaseCog):
         await ctx.channel.send(
             f"**{ctx.user.display_name}** used `/{ctx.command}`",
             files=[
-                plot_bar_chart(
+                await plot_bar_chart(
                     message_counts["roles"],
                     x_label="Role Name",
                     y_label=(
@@ -200,7 +224,7 @@ class StatsCommandsCog(TeXBotBaseCog):
                         "(except for @Member vs @Guest & @Committee vs @Committee-Elect)"
                     ),
                 ),
-                plot_bar_chart(
+                await plot_bar_chart(
                     message_counts["channels"],
                     x_label="Channel Name",
                     y_label=(
@@ -231,6 +255,8 @@ class StatsCommandsCog(TeXBotBaseCog):
 
         The "user_stats" command sends a graph of the stats about messages sent by the given
         member.
+        The message counts are read from the stored per-day message activity of the member,
+        rather than crawling the message history of every channel.
         """
         # NOTE: Shortcut accessors are placed at the top of the function so that the exceptions they raise are displayed before any further errors may be sent
         main_guild: discord.Guild = self.bot.main_guild
@@ -250,6 +276,20 @@ class StatsCommandsCog(TeXBotBaseCog):
 
         await ctx.defer(ephemeral=True)
 
+        user_channel_message_counts: Mapping[int, int] = {
+            int(user_channel_message_count["_channel_id"]): user_channel_message_count[
+                "message_count_sum"
+            ]
+            async for user_channel_message_count in (
+                DiscordMemberMessageActivity.objects.filter(
+                    discord_member__discord_id=str(ctx.user.id),
+                    date__gte=(discord.utils.utcnow() - settings["STATISTICS_DAYS"]).date(),
+                )
+                .values("_channel_id")
+                .annotate(message_count_sum=Sum("message_count"))
+            )
+        }
+
         message_counts: dict[str, int] = {"Total": 0}
 
         channel: discord.TextChannel
@@ -260,16 +300,8 @@ class StatsCommandsCog(TeXBotBaseCog):
             if not member_has_access_to_channel:
                 continue
 
-            message_counts[f"#{channel.name}"] = 0
-
-            message_history_period: AsyncIterable[discord.Message] = channel.history(
-                after=discord.utils.utcnow() - settings["STATISTICS_DAYS"]
-            )
-            message: discord.Message
-            async for message in message_history_period:
-                if message.author == ctx.user and not message.author.bot:
-                    message_counts[f"#{channel.name}"] += 1
-                    message_counts["Total"] += 1
+            message_counts[f"#{channel.name}"] = user_channel_message_counts.get(channel.id, 0)
+            message_counts["Total"] += message_counts[f"#{channel.name}"]
 
         if math.ceil(max(message_counts.values()) / 15) < 1:
             await self.command_send_error(ctx, message="You have not sent enough messages.")
@@ -279,7 +311,7 @@ class StatsCommandsCog(TeXBotBaseCog):
 
         await ctx.channel.send(
             f"**{ctx.user.display_name}** used `/{ctx.command}`",
-            file=plot_bar_chart(
+            file=await plot_bar_chart(
                 message_counts,
                 x_label="Channel Name",
                 y_label=(
@@ -316,29 +348,23 @@ class StatsCommandsCog(TeXBotBaseCog):
 
         await ctx.defer(ephemeral=True)
 
+        stored_left_member_role_counts: Mapping[str, int] = {
+            left_member_role_count.role_name: left_member_role_count.count
+            async for left_member_role_count in LeftDiscordMemberRoleCount.objects.all()
+        }
+
         left_member_counts: dict[str, int] = {
-            "Total": await LeftDiscordMember.objects.acount()  # codespell:ignore acount
+            "Total": stored_left_member_role_counts.get(
+                LeftDiscordMemberRoleCount.TOTAL_ROLE_NAME, 0
+            )
         }
 
         role_name: str
         for role_name in settings["STATISTICS_ROLES"]:
             if discord.utils.get(main_guild.roles, name=role_name):
-                left_member_counts[f"@{role_name}"] = 0
-
-        left_member: LeftDiscordMember
-        async for left_member in LeftDiscordMember.objects.all():
-            for left_member_role in left_member.roles:
-                if left_member_role not in left_member_counts:
-                    continue
-
-                is_committee_role: bool = left_member_role == "@Committee"
-                if is_committee_role and "@Committee-Elect" in left_member.roles:
-                    continue
-
-                if left_member_role == "@Guest" and "@Member" in left_member.roles:
-                    continue
-
-                left_member_counts[left_member_role] += 1
+                left_member_counts[f"@{role_name}"] = stored_left_member_role_counts.get(
+                    f"@{role_name}", 0
+                )
 
         if math.ceil(max(left_member_counts.values()) / 15) < 1:
             await self.command_send_error(
@@ -350,7 +376,7 @@ class StatsCommandsCog(TeXBotBaseCog):
 
         await ctx.channel.send(
             f"**{ctx.user.display_name}** used `/{ctx.command}`",
-            file=plot_bar_chart(
+            file=await plot_bar_chart(
                 left_member_counts,
                 x_label="Role Name",
                 y_label=(
@@ -376,15 +402,192 @@ class StatsCommandsCog(TeXBotBaseCog):
 
     @TeXBotBaseCog.listener()
     @capture_guild_does_not_exist_error
-    async def on_member_leave(self, member: discord.Member) -> None:
+    async def on_member_remove(self, member: discord.Member) -> None:
         """Update the stats of the roles that members had when they left your Discord guild."""
         if member.guild != self.bot.main_guild or member.bot:
             return
 
-        await LeftDiscordMember.objects.acreate(  # type: ignore[misc]
-            roles={
-                f"@{role.name}"
-                for role in member.roles
-                if role.name.lower().strip("@").strip() != "everyone"
-            }
+        left_member_roles: AbstractSet[str] = {
+            f"@{role.name}"
+            for role in member.roles
+            if role.name.lower().strip("@").strip() != "everyone"
+        }
+
+        await LeftDiscordMember.objects.acreate(roles=left_member_roles)  # type: ignore[misc]
+        await LeftDiscordMemberRoleCount.aincrement_role_counts(left_member_roles)
+
+
+class MessageActivityIndexTaskCog(TeXBotBaseCog):
+    """
+    Cog class that defines the message activity indexing listener & task.
+
+    Messages sent in guest-accessible channels are counted per Discord member, per channel
+    & per day, so that the "/stats self" command does not need to crawl any message history.
+    Messages sent while TeX-Bot is running are counted by the on_message listener,
+    and any earlier messages are counted by backfilling each channel's message history once.
+
+    Only the number of messages sent is counted, so editing a message does not change it.
+    Deleted messages are not removed from the counts
+    (unlike crawling the message history, which only finds messages that still exist).
+    """
+
+    @override
+    def __init__(self, bot: "TeXBot") -> None:
+        """Start all task managers when this cog is initialised."""
+        # NOTE: Messages sent after this point are counted by the listener, all earlier messages are counted by the backfill
+        self._live_indexing_start: datetime.datetime = discord.utils.utcnow()
+        self._message_activity_buffer: MessageActivityBuffer = MessageActivityBuffer()
+        self._backfilled_channel_ids: set[int] = set()
+        self._message_activity_pruned_date: datetime.date | None = None
+
+        _ = self.index_message_activity.start()
+
+        super().__init__(bot)
+
+    @override
+    def cog_unload(self) -> None:
+        """
+        Unload-hook that ends all running tasks whenever the tasks cog is unloaded.
+
+        This may be run dynamically or when the bot closes.
+        """
+        self.index_message_activity.cancel()
+
+    @TeXBotBaseCog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        """Count each message sent in a guest-accessible channel of your Discord guild."""
+        if message.author.bot or message.created_at < self._live_indexing_start:
+            return
+
+        if not isinstance(message.channel, discord.TextChannel):
+            return
+
+        if message.channel.guild.id != settings["_DISCORD_MAIN_GUILD_ID"]:
+            return
+
+        try:
+            guest_role: discord.Role = await self.bot.guest_role
+        except GuestRoleDoesNotExistError:
+            return
+
+        channel_is_guest_accessible: bool = message.channel.permissions_for(
+            guest_role
+        ).is_superset(discord.Permissions(send_messages=True))
+        if not channel_is_guest_accessible:
+            return
+
+        self._message_activity_buffer.count_message(
+            message.author.id, message.channel.id, message.created_at
+        )
+
+    async def _backfill_channel(self, channel: discord.TextChannel) -> None:
+        """Count the messages sent in the given channel before the listener started."""
+        indexed_channel: (
+            MessageActivityIndexedChannel | None
+        ) = await MessageActivityIndexedChannel.objects.filter(
+            _channel_id=str(channel.id)
+        ).afirst()
+
+        backfill_after: datetime.datetime = (
+            discord.utils.utcnow() - settings["STATISTICS_DAYS"]
+        )
+        if indexed_channel is not None and indexed_channel.indexed_until > backfill_after:
+            backfill_after = indexed_channel.indexed_until
+
+        if backfill_after < self._live_indexing_start:
+            backfill_buffer: MessageActivityBuffer = MessageActivityBuffer()
+
+            message: discord.Message
+            async for message in channel.history(
+                limit=None, after=backfill_after, before=self._live_indexing_start
+            ):
+                if message.author.bot:
+                    continue
+
+                backfill_buffer.count_message(
+                    message.author.id, channel.id, message.created_at
+                )
+
+            await DiscordMemberMessageActivity.arecord_message_counts(
+                backfill_buffer.pop_channels({channel.id})[0],
+                {channel.id: self._live_indexing_start},
+            )
+
+        self._backfilled_channel_ids.add(channel.id)
+
+    @tasks.loop(minutes=1)
+    @functools.partial(
+        ErrorCaptureDecorators.capture_error_and_close,
+        error_type=GuestRoleDoesNotExistError,
+        close_func=ErrorCaptureDecorators.critical_error_close_func,
+    )
+    @capture_guild_does_not_exist_error
+    @background_database_priority
+    @profile_database_queries
+    async def index_message_activity(self) -> None:
+        """
+        Recurring task to store the buffered message activity in the database.
+
+        Any guest-accessible channels that have not yet had their message history backfilled
+        are backfilled first, and message activity older than the statistics period
+        is removed once per day.
+        """
+        # NOTE: Shortcut accessors are placed at the top of the function so that the exceptions they raise are displayed before any further errors may be sent
+        main_guild: discord.Guild = self.bot.main_guild
+        guest_role: discord.Role = await self.bot.guest_role
+
+        statistics_start_date: datetime.date = (
+            discord.utils.utcnow() - settings["STATISTICS_DAYS"]
+        ).date()
+        if self._message_activity_pruned_date != statistics_start_date:
+            await DiscordMemberMessageActivity.objects.filter(
+                date__lt=statistics_start_date
+            ).adelete()
+            self._message_activity_pruned_date = statistics_start_date
+
+        channel: discord.TextChannel
+        for channel in main_guild.text_channels:
+            if channel.id in self._backfilled_channel_ids:
+                continue
+
+            channel_is_guest_accessible: bool = channel.permissions_for(
+                guest_role
+            ).is_superset(discord.Permissions(send_messages=True))
+            if not channel_is_guest_accessible:
+                continue
+
+            backfill_error: discord.HTTPException | DatabaseError | ValidationError
+            try:
+                await self._backfill_channel(channel)
+            except (discord.HTTPException, DatabaseError, ValidationError) as backfill_error:
+                logger.warning(
+                    "Failed to backfill the message activity of channel %s: %s",
+                    channel.name,
+                    backfill_error,
+                )
+
+        message_counts: Mapping[tuple[int, int, datetime.date], int]
+        channels_indexed_until: Mapping[int, datetime.datetime]
+        message_counts, channels_indexed_until = self._message_activity_buffer.pop_channels(
+            self._backfilled_channel_ids
         )
+        if not message_counts:
+            return
+
+        record_error: DatabaseError | ValidationError
+        try:
+            await DiscordMemberMessageActivity.arecord_message_counts(
+                message_counts, channels_indexed_until
+            )
+        except (DatabaseError, ValidationError) as record_error:
+            # NOTE: The message counts are kept in the buffer, so they are stored by the next run of this task
+            self._message_activity_buffer.restore(message_counts, channels_indexed_until)
+            logger.warning(
+                "Failed to store the buffered message activity, it will be retried: %s",
+                record_error,
+            )
+
+    @index_message_activity.before_loop
+    async def before_tasks(self) -> None:
+        """Pre-execution hook, preventing any tasks from executing before the bot is ready."""
+        await self.bot.wait_until_ready()
@@ -0,0 +1,85 @@
+"""Contains classes relating to indexing the message activity of each Discord member."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Mapping, Sequence
+    from collections.abc import Set as AbstractSet
+
+__all__: "Sequence[str]" = ("MessageActivityBuffer",)
+
+
+class MessageActivityBuffer:
+    """
+    In-memory buffer of message counts that have not yet been stored in the database.
+
+    Message counts are keyed by (Discord member ID, channel ID, date),
+    matching the granularity of the stored DiscordMemberMessageActivity objects.
+    """
+
+    def __init__(self) -> None:
+        """Initialise a new empty buffer of message counts."""
+        self._message_counts: dict[tuple[int, int, datetime.date], int] = {}
+        self._channels_counted_until: dict[int, datetime.datetime] = {}
+
+    def count_message(
+        self, author_id: int, channel_id: int, created_at: "datetime.datetime"
+    ) -> None:
+        """Count a single message sent by the given author in the given channel."""
+        message_count_key: tuple[int, int, datetime.date] = (
+            author_id,
+            channel_id,
+            created_at.date(),
+        )
+        self._message_counts[message_count_key] = (
+            self._message_counts.get(message_count_key, 0) + 1
+        )
+
+        counted_until: datetime.datetime | None = self._channels_counted_until.get(channel_id)
+        if counted_until is None or counted_until < created_at:
+            self._channels_counted_until[channel_id] = created_at
+
+    def pop_channels(
+        self, channel_ids: "AbstractSet[int]"
+    ) -> tuple[
+        "Mapping[tuple[int, int, datetime.date], int]", "Mapping[int, datetime.datetime]"
+    ]:
+        """
+        Remove & return the buffered message counts of the given channels.
+
+        Also returns the datetime of the latest counted message in each of those channels.
+        """
+        popped_message_counts: dict[tuple[int, int, datetime.date], int] = {
+            message_count_key: self._message_counts.pop(message_count_key)
+            for message_count_key in tuple(self._message_counts)
+            if message_count_key[1] in channel_ids
+        }
+        popped_channels_counted_until: dict[int, datetime.datetime] = {
+            channel_id: self._channels_counted_until.pop(channel_id)
+            for channel_id in channel_ids & self._channels_counted_until.keys()
+        }
+
+        return popped_message_counts, popped_channels_counted_until
+
+    def restore(
+        self,
+        message_counts: "Mapping[tuple[int, int, datetime.date], int]",
+        channels_counted_until: "Mapping[int, datetime.datetime]",
+    ) -> None:
+        """Add previously popped message counts back into the buffer."""
+        message_count_key: tuple[int, int, datetime.date]
+        message_count: int
+        for message_count_key, message_count in message_counts.items():
+            self._message_counts[message_count_key] = (
+                self._message_counts.get(message_count_key, 0) + message_count
+            )
+
+        channel_id: int
+        counted_until: datetime.datetime
+        for channel_id, counted_until in channels_counted_until.items():
+            existing_counted_until: datetime.datetime | None = (
+                self._channels_counted_until.get(channel_id)
+            )
+            if existing_counted_until is None or existing_counted_until < counted_until:
+                self._channels_counted_until[channel_id] = counted_until
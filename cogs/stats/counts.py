@@ -7,10 +7,120 @@ import discord
 from config import settings
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterable, Mapping, Sequence
+    from array import array
+    from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+    from typing import Final
 
 
-__all__: "Sequence[str]" = ("get_channel_message_counts", "get_server_message_counts")
+__all__: "Sequence[str]" = (
+    "RoleBucketCounter",
+    "get_channel_message_counts",
+    "get_server_message_counts",
+)
+
+
+class RoleBucketCounter:
+    """
+    Counter of messages sent by authors with each of the statistics roles.
+
+    Each statistics role is assigned a bucket index once, when the counter is created.
+    The bucket indexes that a message author's roles count towards are only calculated
+    the first time that a given set of role IDs is seen (with the exclusion rules applied),
+    so counting each subsequent message only increments a list of integers.
+    """
+
+    TOTAL_BUCKET_NAME: "Final[str]" = "Total"
+
+    def __init__(
+        self, guild_roles: "Iterable[discord.Role]", statistics_role_names: "Iterable[str]"
+    ) -> None:
+        """Initialise the statistics role buckets, from the roles within the guild."""
+        guild_roles = tuple(guild_roles)
+
+        self._bucket_names: list[str] = [self.TOTAL_BUCKET_NAME]
+
+        statistics_role_name: str
+        for statistics_role_name in statistics_role_names:
+            if discord.utils.get(guild_roles, name=statistics_role_name):
+                self._bucket_names.append(f"@{statistics_role_name}")
+
+        bucket_indexes: Mapping[str, int] = {
+            bucket_name: bucket_index
+            for bucket_index, bucket_name in enumerate(self._bucket_names)
+        }
+
+        self._role_id_bucket_indexes: dict[int, int] = {}
+        self._role_id_excluded_bucket_indexes: dict[int, int] = {}
+
+        # NOTE: Authors with both the @Committee & @Committee-Elect roles are only counted as @Committee-Elect, and those with both the @Member & @Guest roles are only counted as @Member
+        excluding_role_names: Mapping[str, str] = {
+            "Committee-Elect": "@Committee",
+            "Member": "@Guest",
+        }
+
+        guild_role: discord.Role
+        for guild_role in guild_roles:
+            if f"@{guild_role.name}" in bucket_indexes:
+                self._role_id_bucket_indexes[guild_role.id] = bucket_indexes[
+                    f"@{guild_role.name}"
+                ]
+
+            excluded_bucket_name: str | None = excluding_role_names.get(guild_role.name)
+            if excluded_bucket_name is not None and excluded_bucket_name in bucket_indexes:
+                self._role_id_excluded_bucket_indexes[guild_role.id] = bucket_indexes[
+                    excluded_bucket_name
+                ]
+
+        self._counts: list[int] = [0] * len(self._bucket_names)
+        self._role_ids_bucket_indexes_cache: dict[bytes, tuple[int, ...]] = {}
+
+    def _get_bucket_indexes(self, author: discord.Member) -> "Sequence[int]":
+        # NOTE: Member role IDs are always stored sorted, so their raw bytes uniquely identify the set of roles that the author had when the message was sent
+        author_role_ids: array[int] = author._roles  # noqa: SLF001
+        role_ids_key: bytes = author_role_ids.tobytes()
+
+        bucket_indexes: tuple[int, ...] | None = self._role_ids_bucket_indexes_cache.get(
+            role_ids_key
+        )
+        if bucket_indexes is not None:
+            return bucket_indexes
+
+        author_bucket_indexes: set[int] = {
+            self._role_id_bucket_indexes[role_id]
+            for role_id in author_role_ids
+            if role_id in self._role_id_bucket_indexes
+        }
+        author_bucket_indexes.difference_update(
+            self._role_id_excluded_bucket_indexes[role_id]
+            for role_id in author_role_ids
+            if role_id in self._role_id_excluded_bucket_indexes
+        )
+
+        bucket_indexes = tuple(author_bucket_indexes)
+        self._role_ids_bucket_indexes_cache[role_ids_key] = bucket_indexes
+        return bucket_indexes
+
+    def count_message(self, author: discord.Member | discord.User) -> None:
+        """Count a single message sent by the given author."""
+        counts: list[int] = self._counts
+        counts[0] += 1
+
+        if isinstance(author, discord.User):
+            return
+
+        bucket_index: int
+        for bucket_index in self._get_bucket_indexes(author):
+            counts[bucket_index] += 1
+
+    def get_counts(self) -> "Mapping[str, int]":
+        """
+        Return the message counts for each role.
+
+        The mapping has the role name (prefixed by `@`) as the key and the number of messages
+        sent by users with that role as the value.
+        The mapping also includes a "Total" key for the total number of messages.
+        """
+        return dict(zip(self._bucket_names, self._counts, strict=True))
 
 
 async def get_channel_message_counts(channel: discord.TextChannel) -> "Mapping[str, int]":
@@ -21,12 +131,9 @@ async def get_channel_message_counts(channel: discord.TextChannel) -> "Mapping[s
     and the number of messages sent by users with that role as the value.
     The mapping also includes a "Total" key for the total number of messages.
     """
-    message_counts: dict[str, int] = {"Total": 0}
-
-    role_name: str
-    for role_name in settings["STATISTICS_ROLES"]:
-        if discord.utils.get(channel.guild.roles, name=role_name):
-            message_counts[f"@{role_name}"] = 0
+    role_bucket_counter: RoleBucketCounter = RoleBucketCounter(
+        channel.guild.roles, statistics_role_names=settings["STATISTICS_ROLES"]
+    )
 
     message_history_period: AsyncIterable[discord.Message] = channel.history(
         after=discord.utils.utcnow() - settings["STATISTICS_DAYS"]
@@ -36,28 +143,9 @@ async def get_channel_message_counts(channel: discord.TextChannel) -> "Mapping[s
         if message.author.bot:
             continue
 
-        message_counts["Total"] += 1
-
-        if isinstance(message.author, discord.User):
-            continue
-
-        author_role_names: set[str] = {
-            author_role.name for author_role in message.author.roles
-        }
-
-        author_role_name: str
-        for author_role_name in author_role_names:
-            if f"@{author_role_name}" in message_counts:
-                is_author_role_name: bool = author_role_name == "Committee"
-                if is_author_role_name and "Committee-Elect" in author_role_names:
-                    continue
-
-                if author_role_name == "Guest" and "Member" in author_role_names:
-                    continue
-
-                message_counts[f"@{author_role_name}"] += 1
+        role_bucket_counter.count_message(message.author)
 
-    return message_counts
+    return role_bucket_counter.get_counts()
 
 
 async def get_server_message_counts(
@@ -73,12 +161,10 @@ async def get_server_message_counts(
     name as a key and the number of messages sent in that channel as the value.
     The "roles" sub-mapping also includes a "Total" key for the total number of messages.
     """
-    message_counts: dict[str, dict[str, int]] = {"roles": {"Total": 0}, "channels": {}}
-
-    role_name: str
-    for role_name in settings["STATISTICS_ROLES"]:
-        if discord.utils.get(guild.roles, name=role_name):
-            message_counts["roles"][f"@{role_name}"] = 0
+    role_bucket_counter: RoleBucketCounter = RoleBucketCounter(
+        guild.roles, statistics_role_names=settings["STATISTICS_ROLES"]
+    )
+    channel_message_counts: dict[str, int] = {}
 
     channel: discord.TextChannel
     for channel in guild.text_channels:
@@ -88,7 +174,7 @@ async def get_server_message_counts(
         if not member_has_access_to_channel:
             continue
 
-        message_counts["channels"][f"#{channel.name}"] = 0
+        channel_message_count: int = 0
 
         message_history_period: AsyncIterable[discord.Message] = channel.history(
             after=discord.utils.utcnow() - settings["STATISTICS_DAYS"]
@@ -98,26 +184,9 @@ async def get_server_message_counts(
             if message.author.bot:
                 continue
 
-            message_counts["channels"][f"#{channel.name}"] += 1
-            message_counts["roles"]["Total"] += 1
-
-            if isinstance(message.author, discord.User):
-                continue
-
-            author_role_names: set[str] = {
-                author_role.name for author_role in message.author.roles
-            }
-
-            author_role_name: str
-            for author_role_name in author_role_names:
-                if f"@{author_role_name}" in message_counts["roles"]:
-                    is_author_role_committee: bool = author_role_name == "Committee"
-                    if is_author_role_committee and "Committee-Elect" in author_role_names:
-                        continue
-
-                    if author_role_name == "Guest" and "Member" in author_role_names:
-                        continue
+            channel_message_count += 1
+            role_bucket_counter.count_message(message.author)
 
-                    message_counts["roles"][f"@{author_role_name}"] += 1
+        channel_message_counts[f"#{channel.name}"] = channel_message_count
 
-    return message_counts
+    return {"roles": role_bucket_counter.get_counts(), "channels": channel_message_counts}
@@ -5,14 +5,17 @@ import math
 from typing import TYPE_CHECKING
 
 import discord
-import matplotlib.pyplot
-import mplcyberpunk
+
+from utils.chart_cache import get_rendered_chart_cache
 
 if TYPE_CHECKING:
     from collections.abc import Collection, Mapping, Sequence
+    from typing import Final
 
     from matplotlib.text import Text as Plot_Text
 
+    from utils.chart_cache import RenderedChartCache
+
 __all__: "Sequence[str]" = ("amount_of_time_formatter", "plot_bar_chart")
 
 
@@ -33,7 +36,7 @@ def amount_of_time_formatter(value: float, time_scale: str) -> str:
     return f"{value:.2f} {time_scale}s"
 
 
-def plot_bar_chart(
+async def plot_bar_chart(
     data: "Mapping[str, int]",
     x_label: str,
     y_label: str,
@@ -42,8 +45,34 @@ def plot_bar_chart(
     description: str,
     extra_text: str = "",
 ) -> discord.File:
-    """Generate an image of a plot bar chart from the given data and format variables."""
-    matplotlib.pyplot.style.use("cyberpunk")
+    """
+    Generate an image of a plot bar chart from the given data and format variables.
+
+    Rendered images are cached by the hash of their content,
+    so re-plotting unchanged data re-uses the previously rendered image.
+    """
+    PLOT_STYLE: Final[str] = "cyberpunk"
+
+    rendered_chart_cache: RenderedChartCache = get_rendered_chart_cache()
+
+    chart_cache_key: str = rendered_chart_cache.generate_key(
+        data,
+        x_label=x_label,
+        y_label=y_label,
+        title=title,
+        extra_text=extra_text,
+        style=PLOT_STYLE,
+    )
+
+    cached_plot_bytes: bytes | None = await rendered_chart_cache.aget(chart_cache_key)
+    if cached_plot_bytes is not None:
+        return discord.File(io.BytesIO(cached_plot_bytes), filename, description=description)
+
+    # NOTE: matplotlib & mplcyberpunk are slow to import & use lots of memory, so they are only imported once a chart actually needs rendering
+    import matplotlib.pyplot
+    import mplcyberpunk
+
+    matplotlib.pyplot.style.use(PLOT_STYLE)
 
     max_data_value: int = max(data.values()) + 1
 
@@ -116,6 +145,8 @@ def plot_bar_chart(
     matplotlib.pyplot.close()
     plot_file.seek(0)
 
+    await rendered_chart_cache.aset(chart_cache_key, plot_file.getvalue())
+
     discord_plot_file: discord.File = discord.File(
         plot_file, filename, description=description
     )
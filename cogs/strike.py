@@ -1,14 +1,11 @@
 """Contains cog classes for any strike interactions."""
 
-import asyncio
 import contextlib
 import datetime
 import logging
-import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import discord
-from asyncstdlib.builtins import any as asyncany
 from discord.ui import View
 
 from config import settings
@@ -19,19 +16,21 @@ from exceptions import (
     StrikeTrackingError,
 )
 from utils import CommandChecks, TeXBotBaseCog
+from utils.audit_log_buffer import AuditLogEntryBuffer
 from utils.error_capture_decorators import (
     capture_guild_does_not_exist_error,
     capture_strike_tracking_error,
 )
 from utils.message_sender_components import ChannelMessageSender, ResponseMessageSender
 
+from .delete_scheduled_messages import schedule_message_deletion
+
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
-    from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final
 
-    from utils import TeXBotApplicationContext, TeXBotAutocompleteContext
+    from utils import TeXBot, TeXBotApplicationContext, TeXBotAutocompleteContext
     from utils.message_sender_components import MessageSavingSenderComponent
 
 __all__: "Sequence[str]" = (
@@ -228,6 +227,10 @@ class BaseStrikeCog(TeXBotBaseCog):
 
     SUGGESTED_ACTIONS: "Final[Mapping[int, str]]" = {1: "time-out", 2: "kick", 3: "ban"}  # noqa: RUF012
 
+    CONFIRMATION_MESSAGE_DELETE_AFTER: "Final[datetime.timedelta]" = datetime.timedelta(
+        minutes=2
+    )
+
     async def _send_strike_user_message(
         self, strike_user: discord.User | discord.Member, member_strikes: DiscordMemberStrikes
     ) -> None:
@@ -274,16 +277,24 @@ class BaseStrikeCog(TeXBotBaseCog):
             content=confirm_strike_message, view=ConfirmStrikeMemberView()
         )
 
-        button_interaction: discord.Interaction = await self.bot.wait_for(
-            "interaction",
-            check=lambda interaction: (
-                interaction.type == discord.InteractionType.component  # noqa: CAR180
-                and interaction.user == interaction_user
-                and interaction.channel == button_callback_channel
-                and "custom_id" in interaction.data
-                and interaction.data["custom_id"] in {"yes_strike_member", "no_strike_member"}
-            ),
-        )
+        try:
+            button_interaction: discord.Interaction = (
+                await self.bot.wait_for_component_interaction(
+                    {"yes_strike_member", "no_strike_member"},
+                    button_callback_channel.id,
+                    user_id=interaction_user.id,
+                )
+            )
+        except TimeoutError:
+            await message_sender_component.edit(
+                content=(
+                    "Timed out waiting for confirmation, so did not perform "
+                    f"{self.SUGGESTED_ACTIONS[actual_strike_amount]} action "
+                    f"on {strike_user.mention}."
+                ),
+                view=None,
+            )
+            return
 
         if button_interaction.data["custom_id"] == "no_strike_member":  # type: ignore[index, typeddict-item]
             await button_interaction.edit_original_response(
@@ -372,8 +383,17 @@ class BaseStrikeCog(TeXBotBaseCog):
                     }"""
                 )
             )
-            await asyncio.sleep(118)
-            await message_sender_component.delete()
+            if isinstance(message_sender_component.sent_message, discord.Message):
+                await schedule_message_deletion(
+                    self.bot,
+                    message_sender_component.sent_message,
+                    delete_after=self.CONFIRMATION_MESSAGE_DELETE_AFTER,
+                )
+            elif message_sender_component.sent_message is not None:
+                # NOTE: Interaction responses can only be deleted while their interaction token is valid, so their deletion cannot be stored
+                await message_sender_component.sent_message.delete_original_response(
+                    delay=self.CONFIRMATION_MESSAGE_DELETE_AFTER.total_seconds()
+                )
             return
 
         if not isinstance(strike_user, discord.Member):
@@ -410,9 +430,7 @@ class BaseStrikeCog(TeXBotBaseCog):
 
         member_strikes: DiscordMemberStrikes = (
             await DiscordMemberStrikes.objects.aget_or_create(
-                discord_member=(
-                    await DiscordMember.objects.aget_or_create(discord_id=strike_member.id)
-                )[0]
+                discord_member=await DiscordMember.aget_or_create_cached(strike_member.id)
             )
         )[0]
 
@@ -434,6 +452,109 @@ class ManualModerationCog(BaseStrikeCog):
     will be run to confirm the actions are tracked.
     """
 
+    AUDIT_LOG_ENTRY_MAX_WAIT_SECONDS: "Final[float]" = 5.0
+
+    @override
+    def __init__(self, bot: "TeXBot") -> None:
+        """Initialise a new cog instance, with empty caches of audit log entries & bans."""
+        self._audit_log_entry_buffer: AuditLogEntryBuffer = AuditLogEntryBuffer()
+        self._banned_user_ids: set[int] = set()
+
+        super().__init__(bot)
+
+    @TeXBotBaseCog.listener()
+    async def on_raw_audit_log_entry(
+        self, audit_log_entry: discord.RawAuditLogEntryEvent
+    ) -> None:
+        """
+        Store each audit log entry created in your group's Discord guild.
+
+        The raw event is used because the resolved "audit_log_entry" event
+        is only dispatched when the user that created the entry is cached.
+        """
+        if audit_log_entry.guild_id != settings["_DISCORD_MAIN_GUILD_ID"]:
+            return
+
+        self._audit_log_entry_buffer.add(audit_log_entry)
+
+    async def _get_applied_action(
+        self, strike_user: discord.User | discord.Member, *actions: discord.AuditLogAction
+    ) -> tuple[discord.AuditLogAction, int | None]:
+        """
+        Return the action applied to the given user, and the ID of the user who applied it.
+
+        Any of the given actions are matched,
+        but only a single shared waiting window is used for all of them.
+        """
+        audit_log_entries_after: datetime.datetime = (
+            discord.utils.utcnow() - datetime.timedelta(minutes=1)
+        )
+
+        raw_audit_log_entry: (
+            discord.RawAuditLogEntryEvent | None
+        ) = await self._audit_log_entry_buffer.wait_for(
+            strike_user.id,
+            *actions,
+            after=audit_log_entries_after,
+            max_wait_seconds=self.AUDIT_LOG_ENTRY_MAX_WAIT_SECONDS,
+        )
+        if raw_audit_log_entry is not None:
+            return raw_audit_log_entry.action_type, raw_audit_log_entry.user_id
+
+        # NOTE: The audit log is only queried over REST if the gateway event containing the audit log entry was missed (E.g. during a reconnect)
+        action: discord.AuditLogAction
+        for action in actions:
+            audit_log_entry: discord.AuditLogEntry
+            async for audit_log_entry in self.bot.main_guild.audit_logs(
+                after=audit_log_entries_after, action=action
+            ):
+                # NOTE: IDs are checked here rather than the objects themselves as the audit log provides an unusual object type in some cases.
+                if audit_log_entry.target.id == strike_user.id:
+                    return (
+                        audit_log_entry.action,
+                        audit_log_entry.user.id if audit_log_entry.user else None,
+                    )
+
+        logger.debug("Printing 5 most recent audit logs:")
+        debug_audit_log_entry: discord.AuditLogEntry
+        async for debug_audit_log_entry in self.bot.main_guild.audit_logs(limit=5):
+            logger.debug(debug_audit_log_entry)
+
+        IRRETRIEVABLE_AUDIT_LOG_MESSAGE: Final[str] = (
+            "Unable to retrieve audit log entry of "
+            f"{' or '.join(repr(str(action)) for action in actions)} action "
+            f"on user {str(strike_user)!r}"
+        )
+        raise NoAuditLogsStrikeTrackingError(IRRETRIEVABLE_AUDIT_LOG_MESSAGE)
+
+    async def _get_user(self, user_id: int) -> discord.User | discord.Member:
+        """Return the given user, preferring their cached member object in your guild."""
+        cached_user: discord.User | discord.Member | None = self.bot.main_guild.get_member(
+            user_id
+        ) or self.bot.get_user(user_id)
+        if cached_user is not None:
+            return cached_user
+
+        return await self.bot.fetch_user(user_id)
+
+    async def _is_user_banned(self, user: discord.User | discord.Member) -> bool:
+        """
+        Return whether the given user is banned from your group's Discord guild.
+
+        Bans received while TeX-Bot is running are cached,
+        so only bans applied before then require a request to Discord.
+        """
+        if user.id in self._banned_user_ids:
+            return True
+
+        try:
+            _ = await self.bot.main_guild.fetch_ban(user)
+        except discord.NotFound:
+            return False
+
+        self._banned_user_ids.add(user.id)
+        return True
+
     async def get_confirmation_message_channel(
         self, user: discord.User | discord.Member
     ) -> discord.DMChannel | discord.TextChannel:
@@ -492,37 +613,21 @@ class ManualModerationCog(BaseStrikeCog):
 
     @capture_strike_tracking_error
     async def _confirm_manual_add_strike(  # noqa: PLR0915
-        self, strike_user: discord.User | discord.Member, action: discord.AuditLogAction
+        self, strike_user: discord.User | discord.Member, *actions: discord.AuditLogAction
     ) -> None:
         # NOTE: Shortcut accessors are placed at the top of the function so that the exceptions they raise are displayed before any further errors may be sent
         main_guild: discord.Guild = self.bot.main_guild
         committee_role: discord.Role = await self.bot.committee_role
 
-        try:
-            audit_log_entry: discord.AuditLogEntry = await anext(
-                _audit_log_entry
-                async for _audit_log_entry in main_guild.audit_logs(
-                    after=discord.utils.utcnow() - datetime.timedelta(minutes=1), action=action
-                )
-                if _audit_log_entry.target.id
-                == strike_user.id  # NOTE: IDs are checked here rather than the objects themselves as the audit log provides an unusual object type in some cases.
-            )
-        except (StopIteration, StopAsyncIteration):
-            logger.debug("Printing 5 most recent audit logs:")
-            debug_audit_log_entry: discord.AuditLogEntry
-            async for debug_audit_log_entry in main_guild.audit_logs(limit=5):
-                logger.debug(debug_audit_log_entry)
-
-            IRRETRIEVABLE_AUDIT_LOG_MESSAGE: Final[str] = (
-                f"Unable to retrieve audit log entry of {str(action)!r} action "
-                f"on user {str(strike_user)!r}"
-            )
-            raise NoAuditLogsStrikeTrackingError(IRRETRIEVABLE_AUDIT_LOG_MESSAGE) from None
-
-        if not audit_log_entry.user:
+        action: discord.AuditLogAction
+        applied_action_user_id: int | None
+        action, applied_action_user_id = await self._get_applied_action(strike_user, *actions)
+        if applied_action_user_id is None:
             raise StrikeTrackingError
 
-        applied_action_user: discord.User | discord.Member = audit_log_entry.user
+        applied_action_user: discord.User | discord.Member = await self._get_user(
+            applied_action_user_id
+        )
 
         if applied_action_user == self.bot.user:
             return
@@ -541,9 +646,7 @@ class ManualModerationCog(BaseStrikeCog):
 
         member_strikes: DiscordMemberStrikes = (
             await DiscordMemberStrikes.objects.aget_or_create(
-                discord_member=(
-                    await DiscordMember.objects.aget_or_create(discord_id=strike_user.id)
-                )[0]
+                discord_member=await DiscordMember.aget_or_create_cached(strike_user.id)
             )
         )[0]
 
@@ -584,21 +687,31 @@ class ManualModerationCog(BaseStrikeCog):
                 )
                 return
 
-            out_of_sync_ban_button_interaction: discord.Interaction = await self.bot.wait_for(
-                "interaction",
-                check=lambda interaction: (
-                    interaction.type == discord.InteractionType.component  # noqa: CAR180
-                    and (
-                        (interaction.user == applied_action_user)
-                        if not applied_action_user.bot
-                        else (committee_role in interaction.user.roles)
+            try:
+                out_of_sync_ban_button_interaction: discord.Interaction = (
+                    await self.bot.wait_for_component_interaction(
+                        {"yes_out_of_sync_ban_member", "no_out_of_sync_ban_member"},
+                        confirmation_message_channel.id,
+                        user_id=(
+                            applied_action_user.id if not applied_action_user.bot else None
+                        ),
+                        check=(
+                            (lambda interaction: committee_role in interaction.user.roles)
+                            if applied_action_user.bot
+                            else None
+                        ),
                     )
-                    and interaction.channel == confirmation_message_channel
-                    and "custom_id" in interaction.data
-                    and interaction.data["custom_id"]
-                    in {"yes_out_of_sync_ban_member", "no_out_of_sync_ban_member"}
-                ),
-            )
+                )
+            except TimeoutError:
+                await out_of_sync_ban_confirmation_message.edit(
+                    content=(
+                        "Timed out waiting for confirmation, so did not perform ban action "
+                        f"upon {strike_user.mention}. "
+                        "(This manual moderation action has not been tracked.)"
+                    ),
+                    view=None,
+                )
+                return
 
             if (
                 out_of_sync_ban_button_interaction.data["custom_id"]  # type: ignore[index, typeddict-item]
@@ -617,8 +730,11 @@ class ManualModerationCog(BaseStrikeCog):
                     ),
                     view=None,
                 )
-                await asyncio.sleep(118)
-                await out_of_sync_ban_confirmation_message.delete()
+                await schedule_message_deletion(
+                    self.bot,
+                    out_of_sync_ban_confirmation_message,
+                    delete_after=self.CONFIRMATION_MESSAGE_DELETE_AFTER,
+                )
                 return
 
             if (
@@ -646,8 +762,11 @@ class ManualModerationCog(BaseStrikeCog):
                     ),
                     view=None,
                 )
-                await asyncio.sleep(118)
-                await out_of_sync_ban_confirmation_message.delete()
+                await schedule_message_deletion(
+                    self.bot,
+                    out_of_sync_ban_confirmation_message,
+                    delete_after=self.CONFIRMATION_MESSAGE_DELETE_AFTER,
+                )
                 return
 
             raise ValueError
@@ -681,24 +800,29 @@ class ManualModerationCog(BaseStrikeCog):
             )
             return
 
-        button_interaction: discord.Interaction = await self.bot.wait_for(
-            "interaction",
-            check=lambda interaction: (
-                interaction.type == discord.InteractionType.component  # noqa: CAR180
-                and (
-                    (interaction.user == applied_action_user)
-                    if not applied_action_user.bot
-                    else (committee_role in interaction.user.roles)
+        try:
+            button_interaction: discord.Interaction = (
+                await self.bot.wait_for_component_interaction(
+                    {"yes_manual_moderation_action", "no_manual_moderation_action"},
+                    confirmation_message_channel.id,
+                    user_id=applied_action_user.id if not applied_action_user.bot else None,
+                    check=(
+                        (lambda interaction: committee_role in interaction.user.roles)
+                        if applied_action_user.bot
+                        else None
+                    ),
                 )
-                and interaction.channel == confirmation_message_channel
-                and "custom_id" in interaction.data
-                and interaction.data["custom_id"]
-                in {
-                    "yes_manual_moderation_action",
-                    "no_manual_moderation_action",
-                }
-            ),
-        )
+            )
+        except TimeoutError:
+            await confirmation_message.edit(
+                content=(
+                    "Timed out waiting for confirmation, so did not increase "
+                    f"{strike_user.mention}'s strikes. "
+                    "(This manual moderation action has not been tracked.)"
+                ),
+                view=None,
+            )
+            return
 
         if button_interaction.data["custom_id"] == "no_manual_moderation_action":  # type: ignore[index, typeddict-item]
             await confirmation_message.edit(
@@ -715,8 +839,11 @@ class ManualModerationCog(BaseStrikeCog):
                 ),
                 view=None,
             )
-            await asyncio.sleep(118)
-            await confirmation_message.delete()
+            await schedule_message_deletion(
+                self.bot,
+                confirmation_message,
+                delete_after=self.CONFIRMATION_MESSAGE_DELETE_AFTER,
+            )
             return
 
         if button_interaction.data["custom_id"] == "yes_manual_moderation_action":  # type: ignore[index, typeddict-item]
@@ -748,20 +875,10 @@ class ManualModerationCog(BaseStrikeCog):
         if not after.timed_out or before.timed_out == after.timed_out:
             return
 
-        audit_log_entry: discord.AuditLogEntry
-        async for audit_log_entry in main_guild.audit_logs(limit=5):
-            FOUND_CORRECT_AUDIT_LOG_ENTRY: bool = audit_log_entry.target.id == after.id and (
-                audit_log_entry.action
-                == discord.AuditLogAction.auto_moderation_user_communication_disabled
-            )
-            if FOUND_CORRECT_AUDIT_LOG_ENTRY:
-                await self._confirm_manual_add_strike(
-                    strike_user=after, action=audit_log_entry.action
-                )
-                return
-
         await self._confirm_manual_add_strike(
-            strike_user=after, action=discord.AuditLogAction.member_update
+            after,
+            discord.AuditLogAction.auto_moderation_user_communication_disabled,
+            discord.AuditLogAction.member_update,
         )
 
     @TeXBotBaseCog.listener()
@@ -772,17 +889,15 @@ class ManualModerationCog(BaseStrikeCog):
         main_guild: discord.Guild = self.bot.main_guild
 
         MEMBER_REMOVED_BECAUSE_OF_MANUALLY_APPLIED_KICK: Final[bool] = bool(
-            member.guild == self.bot.main_guild
+            member.guild == main_guild
             and not member.bot
-            and not await asyncany(ban.user == member async for ban in main_guild.bans())
+            and not await self._is_user_banned(member)
         )
         if not MEMBER_REMOVED_BECAUSE_OF_MANUALLY_APPLIED_KICK:
             return
 
         with contextlib.suppress(NoAuditLogsStrikeTrackingError):
-            await self._confirm_manual_add_strike(
-                strike_user=member, action=discord.AuditLogAction.kick
-            )
+            await self._confirm_manual_add_strike(member, discord.AuditLogAction.kick)
 
     @TeXBotBaseCog.listener()
     @capture_guild_does_not_exist_error
@@ -790,12 +905,24 @@ class ManualModerationCog(BaseStrikeCog):
         self, guild: discord.Guild, user: discord.User | discord.Member
     ) -> None:
         """Flag manually applied ban and track strikes accordingly."""
-        if guild != self.bot.main_guild or user.bot:
+        if guild != self.bot.main_guild:
             return
 
-        await self._confirm_manual_add_strike(
-            strike_user=user, action=discord.AuditLogAction.ban
-        )
+        self._banned_user_ids.add(user.id)
+
+        if user.bot:
+            return
+
+        await self._confirm_manual_add_strike(user, discord.AuditLogAction.ban)
+
+    @TeXBotBaseCog.listener()
+    @capture_guild_does_not_exist_error
+    async def on_member_unban(self, guild: discord.Guild, user: discord.User) -> None:
+        """Remove the lifted ban from the cache of banned users."""
+        if guild != self.bot.main_guild:
+            return
+
+        self._banned_user_ids.discard(user.id)
 
 
 class StrikeCommandsCog(BaseStrikeCog):
@@ -804,31 +931,20 @@ class StrikeCommandsCog(BaseStrikeCog):
     @staticmethod
     async def autocomplete_get_members(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of available selectable members.
+        Autocomplete callable that generates the list of matching selectable members.
 
         This list of selectable members is used in any of the "strike" slash-command options
         that have a member input-type.
         """
         try:
-            main_guild: discord.Guild = ctx.bot.main_guild
+            return ctx.bot.search_main_guild_member_choices(
+                ctx.value or "",
+                member_filter=lambda member: not member.bot,
+            )
         except GuildDoesNotExistError:
-            return set()
-
-        members: set[discord.Member] = {
-            member for member in main_guild.members if not member.bot
-        }
-
-        if not ctx.value or re.fullmatch(r"\A@.*\Z", ctx.value):
-            return {
-                discord.OptionChoice(name=f"@{member.name}", value=str(member.id))
-                for member in members
-            }
-
-        return {
-            discord.OptionChoice(name=member.name, value=str(member.id)) for member in members
-        }
+            return []
 
     @discord.slash_command(
         name="strike",
@@ -841,7 +957,7 @@ class StrikeCommandsCog(BaseStrikeCog):
         name="user",
         description="The user to give a strike to.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_members),
+        autocomplete=autocomplete_get_members,
         required=True,
         parameter_name="str_strike_member_id",
     )
@@ -872,7 +988,7 @@ class StrikeCommandsCog(BaseStrikeCog):
         name="user",
         description="The user to check the number of strikes for.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_members),
+        autocomplete=autocomplete_get_members,
         required=True,
         parameter_name="str_strike_member_id",
     )
@@ -916,7 +1032,7 @@ class StrikeCommandsCog(BaseStrikeCog):
         name="user",
         description="The user to remove a strike from.",
         input_type=str,
-        autocomplete=discord.utils.basic_autocomplete(autocomplete_get_members),
+        autocomplete=autocomplete_get_members,
         required=True,
         parameter_name="str_strike_member_id",
     )
@@ -943,9 +1059,7 @@ class StrikeCommandsCog(BaseStrikeCog):
         try:
             discord_member_strikes: DiscordMemberStrikes = (
                 await DiscordMemberStrikes.objects.aget(
-                    discord_member=(
-                        await DiscordMember.objects.aget_or_create(discord_id=strike_member.id)
-                    )[0]
+                    discord_member=await DiscordMember.aget_or_create_cached(strike_member.id)
                 )
             )
         except DiscordMemberStrikes.DoesNotExist:
@@ -13,6 +13,7 @@ import json
 import logging
 import os
 import re
+import time
 from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, final
@@ -31,9 +32,11 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from collections.abc import Set as AbstractSet
     from logging import Logger
+    from types import ModuleType
     from typing import IO, Any, ClassVar, Final, LiteralString
 
 __all__: "Sequence[str]" = (
+    "DATABASE_PERFORMANCE_PROFILE_CHOICES",
     "DEFAULT_STATISTICS_ROLES",
     "FALSE_VALUES",
     "LOG_LEVEL_CHOICES",
@@ -77,6 +80,10 @@ LOG_LEVEL_CHOICES: "Final[Sequence[LiteralString]]" = (
     "ERROR",
     "CRITICAL",
 )
+DATABASE_PERFORMANCE_PROFILE_CHOICES: "Final[Sequence[LiteralString]]" = (
+    "TUNED",
+    "DEFAULT",
+)
 
 logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
 discord_logger: "Final[Logger]" = logging.getLogger("discord")
@@ -882,6 +889,55 @@ class Settings(abc.ABC):
 
         cls._settings["STATISTICS_ROLES"] = statistics_roles or DEFAULT_STATISTICS_ROLES
 
+    @classmethod
+    def _setup_statistics_chart_cache_directory(cls) -> None:
+        raw_statistics_chart_cache_directory: str = os.getenv(
+            "STATISTICS_CHART_CACHE_DIRECTORY", default=""
+        ).strip()
+
+        if not raw_statistics_chart_cache_directory:
+            cls._settings["STATISTICS_CHART_CACHE_DIRECTORY"] = None
+            return
+
+        statistics_chart_cache_directory: Path = Path(raw_statistics_chart_cache_directory)
+        if not statistics_chart_cache_directory.is_absolute():
+            statistics_chart_cache_directory = PROJECT_ROOT / statistics_chart_cache_directory
+
+        if statistics_chart_cache_directory.exists() and (
+            not statistics_chart_cache_directory.is_dir()
+        ):
+            INVALID_STATISTICS_CHART_CACHE_DIRECTORY_MESSAGE: Final[str] = (
+                "STATISTICS_CHART_CACHE_DIRECTORY must be a path to a directory."
+            )
+            raise ImproperlyConfiguredError(INVALID_STATISTICS_CHART_CACHE_DIRECTORY_MESSAGE)
+
+        cls._settings["STATISTICS_CHART_CACHE_DIRECTORY"] = statistics_chart_cache_directory
+
+    @classmethod
+    def _setup_statistics_chart_cache_max_disk_size(cls) -> None:
+        INVALID_STATISTICS_CHART_CACHE_MAX_DISK_SIZE_MESSAGE: Final[str] = (
+            "STATISTICS_CHART_CACHE_MAX_DISK_SIZE must be a positive number of megabytes."
+        )
+
+        e: ValueError
+        try:
+            raw_statistics_chart_cache_max_disk_size: float = float(
+                os.getenv("STATISTICS_CHART_CACHE_MAX_DISK_SIZE", default="64").strip()
+            )
+        except ValueError as e:
+            raise ImproperlyConfiguredError(
+                INVALID_STATISTICS_CHART_CACHE_MAX_DISK_SIZE_MESSAGE
+            ) from e
+
+        if raw_statistics_chart_cache_max_disk_size <= 0:
+            raise ImproperlyConfiguredError(
+                INVALID_STATISTICS_CHART_CACHE_MAX_DISK_SIZE_MESSAGE
+            )
+
+        cls._settings["STATISTICS_CHART_CACHE_MAX_DISK_SIZE"] = int(
+            raw_statistics_chart_cache_max_disk_size * 1024 * 1024
+        )
+
     @classmethod
     def _setup_membership_dependent_roles(cls) -> None:
         raw_membership_dependent_roles: str = os.getenv(
@@ -964,6 +1020,84 @@ class Settings(abc.ABC):
             raw_auto_add_committee_to_threads in TRUE_VALUES
         )
 
+    @classmethod
+    def _setup_database_performance_profile(cls) -> None:
+        raw_database_performance_profile: str = (
+            os.getenv("DATABASE_PERFORMANCE_PROFILE", default="TUNED").upper().strip()
+        )
+
+        if raw_database_performance_profile not in DATABASE_PERFORMANCE_PROFILE_CHOICES:
+            INVALID_DATABASE_PERFORMANCE_PROFILE_MESSAGE: Final[str] = (
+                "DATABASE_PERFORMANCE_PROFILE must be one of "
+                f"{
+                    ','.join(
+                        f'{profile_choice!r}'
+                        for profile_choice in DATABASE_PERFORMANCE_PROFILE_CHOICES[:-1]
+                    )
+                } or {DATABASE_PERFORMANCE_PROFILE_CHOICES[-1]!r}."
+            )
+            raise ImproperlyConfiguredError(INVALID_DATABASE_PERFORMANCE_PROFILE_MESSAGE)
+
+        cls._settings["DATABASE_PERFORMANCE_PROFILE"] = raw_database_performance_profile
+
+    @classmethod
+    def _setup_database_busy_timeout(cls) -> None:
+        INVALID_DATABASE_BUSY_TIMEOUT_MESSAGE: Final[str] = (
+            "DATABASE_BUSY_TIMEOUT must be a positive number of seconds."
+        )
+
+        e: ValueError
+        try:
+            raw_database_busy_timeout: float = float(
+                os.getenv("DATABASE_BUSY_TIMEOUT", default="5").strip()
+            )
+        except ValueError as e:
+            raise ImproperlyConfiguredError(INVALID_DATABASE_BUSY_TIMEOUT_MESSAGE) from e
+
+        if raw_database_busy_timeout <= 0:
+            raise ImproperlyConfiguredError(INVALID_DATABASE_BUSY_TIMEOUT_MESSAGE)
+
+        cls._settings["DATABASE_BUSY_TIMEOUT"] = raw_database_busy_timeout
+
+    @classmethod
+    def _setup_database_query_profiling(cls) -> None:
+        raw_database_query_profiling: str = (
+            os.getenv("DATABASE_QUERY_PROFILING", default="False").lower().strip()
+        )
+
+        if raw_database_query_profiling not in TRUE_VALUES | FALSE_VALUES:
+            INVALID_DATABASE_QUERY_PROFILING_MESSAGE: Final[str] = (
+                "DATABASE_QUERY_PROFILING must be a boolean value."
+            )
+            raise ImproperlyConfiguredError(INVALID_DATABASE_QUERY_PROFILING_MESSAGE)
+
+        cls._settings["DATABASE_QUERY_PROFILING"] = raw_database_query_profiling in TRUE_VALUES
+
+    @classmethod
+    def _setup_database_n_plus_one_warning_threshold(cls) -> None:
+        INVALID_DATABASE_N_PLUS_ONE_WARNING_THRESHOLD_MESSAGE: Final[str] = (
+            "DATABASE_N_PLUS_ONE_WARNING_THRESHOLD must be a non-negative whole number."
+        )
+
+        e: ValueError
+        try:
+            raw_database_n_plus_one_warning_threshold: int = int(
+                os.getenv("DATABASE_N_PLUS_ONE_WARNING_THRESHOLD", default="10").strip()
+            )
+        except ValueError as e:
+            raise ImproperlyConfiguredError(
+                INVALID_DATABASE_N_PLUS_ONE_WARNING_THRESHOLD_MESSAGE
+            ) from e
+
+        if raw_database_n_plus_one_warning_threshold < 0:
+            raise ImproperlyConfiguredError(
+                INVALID_DATABASE_N_PLUS_ONE_WARNING_THRESHOLD_MESSAGE
+            )
+
+        cls._settings["DATABASE_N_PLUS_ONE_WARNING_THRESHOLD"] = (
+            raw_database_n_plus_one_warning_threshold
+        )
+
     @classmethod
     def _setup_env_variables(cls) -> None:
         """
@@ -1005,10 +1139,16 @@ class Settings(abc.ABC):
             cls._setup_advanced_send_get_roles_reminders_interval()
             cls._setup_statistics_days()
             cls._setup_statistics_roles()
+            cls._setup_statistics_chart_cache_directory()
+            cls._setup_statistics_chart_cache_max_disk_size()
             cls._setup_membership_dependent_roles()
             cls._setup_moderation_document_url()
             cls._setup_strike_performed_manually_warning_location()
             cls._setup_auto_add_committee_to_threads()
+            cls._setup_database_performance_profile()
+            cls._setup_database_busy_timeout()
+            cls._setup_database_query_profiling()
+            cls._setup_database_n_plus_one_warning_threshold()
         except ImproperlyConfiguredError as improper_config_error:
             webhook_config_logger.error(improper_config_error.message)  # noqa: TRY400
             raise improper_config_error from improper_config_error
@@ -1040,7 +1180,28 @@ def run_setup() -> None:
 
     logger.debug("Begin database setup")
 
-    importlib.import_module("db")
-    importlib.import_module("django.core.management").call_command("migrate")
+    database_setup_start_time: float = time.perf_counter()
+
+    db: ModuleType = importlib.import_module("db")
+
+    DATABASE_SCHEMA_IS_CURRENT: Final[bool] = db.is_database_schema_current()
+    if not DATABASE_SCHEMA_IS_CURRENT:
+        # NOTE: Django's management machinery & every migration module are only imported when the database schema may be out of date
+        importlib.import_module("django.core.management").call_command("migrate")
+
+    db.check_database_settings()
+
+    if settings["DATABASE_QUERY_PROFILING"]:
+        importlib.import_module("utils.query_profiler").query_profiler.install(
+            n_plus_one_warning_threshold=settings["DATABASE_N_PLUS_ONE_WARNING_THRESHOLD"]
+        )
 
-    logger.debug("Database setup completed")
+    logger.debug(
+        "Database setup completed in %.0fms (%s)",
+        (time.perf_counter() - database_setup_start_time) * 1000,
+        (
+            "schema already current, migrations skipped"
+            if DATABASE_SCHEMA_IS_CURRENT
+            else "migrations applied"
+        ),
+    )
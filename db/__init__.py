@@ -1,14 +1,37 @@
 """Contains the entire package required to run Django's ORM as a database connector."""
 
+import functools
+import hashlib
+import importlib.util
+import logging
 import os
+import pkgutil
 from typing import TYPE_CHECKING
 
 import django
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, connection
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Mapping, Sequence
+    from collections.abc import Set as AbstractSet
+    from importlib.machinery import ModuleSpec
+    from logging import Logger
+    from typing import Final
 
-__all__: "Sequence[str]" = ()
+    from django.apps import AppConfig
+
+__all__: "Sequence[str]" = (
+    "check_database_settings",
+    "get_migration_set_hash",
+    "is_database_schema_current",
+)
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+SQLITE_SYNCHRONOUS_LEVEL_NAMES: "Final[Sequence[str]]" = ("OFF", "NORMAL", "FULL", "EXTRA")
 
 
 os.environ["DJANGO_SETTINGS_MODULE"] = "db._settings"
@@ -20,3 +43,134 @@ try:
 except RuntimeError as django_setup_error:
     if "populate() isn't reentrant" not in str(django_setup_error):
         raise
+
+
+def check_database_settings() -> "Mapping[str, str | int]":
+    """
+    Report the SQLite settings that are actually in effect on the database connection.
+
+    A warning is logged for each pragma of the configured performance profile
+    that SQLite did not apply
+    (E.g. WAL journal mode is not supported on some network filesystems).
+    """
+    expected_pragmas: Mapping[str, str | int] = settings.SQLITE_PERFORMANCE_PROFILE_PRAGMAS[
+        settings.DATABASE_PERFORMANCE_PROFILE
+    ]
+
+    effective_pragmas: dict[str, str | int] = {}
+
+    with connection.cursor() as cursor:
+        pragma_name: str
+        for pragma_name in ("journal_mode", "synchronous", "mmap_size", "cache_size"):
+            cursor.execute(f"PRAGMA {pragma_name}")
+            effective_pragmas[pragma_name] = cursor.fetchone()[0]
+
+        cursor.execute("PRAGMA busy_timeout")
+        effective_pragmas["busy_timeout"] = cursor.fetchone()[0]
+
+    effective_pragmas["synchronous"] = SQLITE_SYNCHRONOUS_LEVEL_NAMES[
+        int(effective_pragmas["synchronous"])
+    ]
+
+    expected_pragma_value: str | int
+    for pragma_name, expected_pragma_value in expected_pragmas.items():
+        if str(effective_pragmas[pragma_name]).upper() != str(expected_pragma_value).upper():
+            logger.warning(
+                "SQLite pragma %s is %s, instead of %s as set by the %s database profile",
+                pragma_name,
+                effective_pragmas[pragma_name],
+                expected_pragma_value,
+                settings.DATABASE_PERFORMANCE_PROFILE,
+            )
+
+    logger.debug(
+        "Database settings in effect (%s profile, %s connections): %s",
+        settings.DATABASE_PERFORMANCE_PROFILE,
+        "persistent" if settings.DATABASES["default"]["CONN_MAX_AGE"] is None else "per-use",
+        ", ".join(
+            f"{pragma_name}={pragma_value}"
+            for pragma_name, pragma_value in effective_pragmas.items()
+        ),
+    )
+
+    return effective_pragmas
+
+
+def _hash_migration_names(migration_names: "Iterable[tuple[str, str]]") -> str:
+    return hashlib.sha256(
+        "\n".join(
+            f"{app_label}.{migration_name}"
+            for app_label, migration_name in sorted(migration_names)
+        ).encode()
+    ).hexdigest()
+
+
+@functools.cache
+def _get_migration_names() -> "AbstractSet[tuple[str, str]]":
+    """
+    Return the app label & name of every migration file of every installed app.
+
+    The migration files are only listed, not imported,
+    so this is much faster than loading Django's migration graph.
+    """
+    migration_names: set[tuple[str, str]] = set()
+
+    app_config: AppConfig
+    for app_config in apps.get_app_configs():
+        migrations_module_spec: ModuleSpec | None = importlib.util.find_spec(
+            f"{app_config.name}.migrations"
+        )
+        if (
+            migrations_module_spec is None
+            or migrations_module_spec.submodule_search_locations is None
+        ):
+            continue
+
+        migration_names.update(
+            (app_config.label, migration_module_info.name)
+            for migration_module_info in pkgutil.iter_modules(
+                migrations_module_spec.submodule_search_locations
+            )
+            if not migration_module_info.ispkg
+            and not migration_module_info.name.startswith("_")
+        )
+
+    return frozenset(migration_names)
+
+
+@functools.cache
+def get_migration_set_hash() -> str:
+    """
+    Return a hash identifying the set of migrations shipped with every installed app.
+
+    The hash is only computed once, because the shipped migrations cannot change at run-time.
+    """
+    return _hash_migration_names(_get_migration_names())
+
+
+def is_database_schema_current() -> bool:
+    """
+    Return whether exactly the shipped set of migrations has been applied to the database.
+
+    The hash of the migrations recorded as applied in the database
+    is compared with the hash of the shipped migration files,
+    so that running all of Django's migration machinery can be skipped on most startups.
+    Any difference (including migrations applied to the database that are no longer shipped)
+    means that the database schema is not known to be current.
+    """
+    migrated_app_labels: AbstractSet[str] = {
+        app_label for app_label, _ in _get_migration_names()
+    }
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT app, name FROM django_migrations")
+            applied_migration_names: set[tuple[str, str]] = {
+                (app_label, migration_name)
+                for app_label, migration_name in cursor.fetchall()
+                if app_label in migrated_app_labels
+            }
+    except DatabaseError:
+        return False
+
+    return _hash_migration_names(applied_migration_names) == get_migration_set_hash()
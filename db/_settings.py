@@ -33,11 +33,15 @@ IMPORTED_BY_MYPY_OR_PYTEST: "Final[bool]" = any(
 )
 if IMPORTED_BY_MYPY_OR_PYTEST:
     SECRET_KEY = "unsecure-secret-key"  # noqa: S105
+    DATABASE_PERFORMANCE_PROFILE: str = "TUNED"
+    DATABASE_BUSY_TIMEOUT: float = 5
 else:
     from config import settings
 
     # SECURITY WARNING: keep the secret key used in production secret!
     SECRET_KEY = settings.DISCORD_BOT_TOKEN
+    DATABASE_PERFORMANCE_PROFILE = settings.DATABASE_PERFORMANCE_PROFILE
+    DATABASE_BUSY_TIMEOUT = settings.DATABASE_BUSY_TIMEOUT
 
 
 # Application Definition
@@ -52,8 +56,36 @@ MIDDLEWARE: "Final[Sequence[str]]" = ["django.middleware.common.CommonMiddleware
 
 # Database Settings
 
+# NOTE: These pragmas are applied to every new SQLite connection. WAL journal mode allows reads to continue while another connection is writing (SOURCE: https://sqlite.org/wal.html)
+SQLITE_PERFORMANCE_PROFILE_PRAGMAS: "Final[Mapping[str, Mapping[str, str | int]]]" = {
+    "TUNED": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # NOTE: Negative cache sizes are measured in KiB
+    },
+    "DEFAULT": {},
+}
+
+IS_DATABASE_PROFILE_TUNED: "Final[bool]" = DATABASE_PERFORMANCE_PROFILE == "TUNED"
+
 DATABASES: "Final[Mapping[str, object]]" = {  # SOURCE: https://docs.djangoproject.com/en/stable/ref/settings#databases
-    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": BASE_DIR / "core.db"}
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "core.db",
+        "OPTIONS": {
+            "timeout": DATABASE_BUSY_TIMEOUT,
+            "init_command": ";".join(
+                f"PRAGMA {pragma_name}={pragma_value}"
+                for pragma_name, pragma_value in SQLITE_PERFORMANCE_PROFILE_PRAGMAS[
+                    DATABASE_PERFORMANCE_PROFILE
+                ].items()
+            ),
+            # NOTE: Taking the write lock when each transaction begins lets the busy timeout apply, instead of failing when a read lock cannot be upgraded
+            "transaction_mode": "IMMEDIATE" if IS_DATABASE_PROFILE_TUNED else None,
+        },
+        "CONN_MAX_AGE": None if IS_DATABASE_PROFILE_TUNED else 0,
+    }
 }
 
 DEFAULT_AUTO_FIELD: "Final[str]" = "django.db.models.BigAutoField"  # SOURCE: https://docs.djangoproject.com/en/stable/ref/settings#default-auto-field
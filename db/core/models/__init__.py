@@ -1,20 +1,26 @@
 """Model classes that store extra information between individual event handling call-backs."""
 
+import functools
 import hashlib
 import re
+import threading
 from typing import TYPE_CHECKING, override
 
 import discord
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, RegexValidator
-from django.db import models
+from django.db import models, transaction
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from django_stubs_ext.db.models import TypedModelMeta
 
+from db.executor import database_executor
+
 from .utils import AsyncBaseModel, DiscordMember
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    import datetime
+    from collections.abc import Iterable, Mapping, Sequence
     from collections.abc import Set as AbstractSet
     from typing import ClassVar, Final
 
@@ -25,11 +31,15 @@ if TYPE_CHECKING:
 __all__: "Sequence[str]" = (
     "AssignedCommitteeAction",
     "DiscordMember",
+    "DiscordMemberMessageActivity",
     "DiscordMemberStrikes",
     "DiscordReminder",
     "GroupMadeMember",
     "IntroductionReminderOptOutMember",
     "LeftDiscordMember",
+    "LeftDiscordMemberRoleCount",
+    "MessageActivityIndexedChannel",
+    "ScheduledMessageDeletion",
     "SentGetRolesReminderMember",
     "SentOneOffIntroductionReminderMember",
 )
@@ -70,6 +80,9 @@ class AssignedCommitteeAction(AsyncBaseModel):
                 fields=["discord_member", "description"], name="unique_user_action"
             ),
         )
+        indexes: "ClassVar[list[models.Index] | tuple[models.Index, ...]]" = (
+            models.Index(fields=["discord_member", "status"], name="user_action_status_idx"),
+        )
 
     @override
     def __repr__(self) -> str:
@@ -79,6 +92,63 @@ class AssignedCommitteeAction(AsyncBaseModel):
     def __str__(self) -> str:
         return f"{self.discord_member}: {self.description}"
 
+    @classmethod
+    def bulk_create_for_discord_members(
+        cls, discord_member_ids: "Iterable[str | int]", description: str
+    ) -> "AbstractSet[str]":
+        """
+        Assign an action with the given description to each given Discord member at once.
+
+        All the actions are validated in memory, then created within a single transaction.
+        Discord members that already have an action with the given description
+        are not assigned a new one, and their IDs are returned instead.
+        """
+        with transaction.atomic():
+            action_discord_member_ids: set[str] = {
+                str(discord_member_id) for discord_member_id in discord_member_ids
+            }
+            discord_member_primary_keys: Mapping[str, int] = (
+                DiscordMember.get_or_create_primary_keys(action_discord_member_ids)
+            )
+
+            existing_action_discord_member_ids: set[str] = set(
+                cls.objects.filter(
+                    discord_member_id__in=discord_member_primary_keys.values(),
+                    description=description,
+                ).values_list("discord_member__discord_id", flat=True)
+            )
+
+            new_actions: list[AssignedCommitteeAction] = [
+                cls(
+                    discord_member_id=discord_member_primary_keys[discord_member_id],
+                    description=description,
+                )
+                for discord_member_id in (
+                    action_discord_member_ids - existing_action_discord_member_ids
+                )
+            ]
+
+            new_action: AssignedCommitteeAction
+            for new_action in new_actions:
+                new_action.clean_fields(exclude={"discord_member"})
+
+            cls.objects.bulk_create(new_actions)
+
+        return existing_action_discord_member_ids
+
+    @classmethod
+    async def abulk_create_for_discord_members(
+        cls, discord_member_ids: "Iterable[str | int]", description: str
+    ) -> "AbstractSet[str]":
+        """
+        Asynchronously assign an action with the given description to each Discord member.
+
+        The IDs of the Discord members that already had such an action are returned.
+        """
+        return await database_executor.run(
+            cls.bulk_create_for_discord_members, discord_member_ids, description
+        )
+
 
 class IntroductionReminderOptOutMember(AsyncBaseModel):
     """
@@ -250,11 +320,118 @@ class GroupMadeMember(AsyncBaseModel):
 
         return hashlib.sha256(str(group_member_id).encode()).hexdigest()
 
+    @classmethod
+    async def ais_hashed_group_member_id_used(cls, hashed_group_member_id: str) -> bool:
+        """
+        Return whether the given hashed group member ID has already been used to make a member.
+
+        The used hashed group member IDs are held in memory,
+        so the database is only queried the first time this is called
+        (or the first time after the index of used IDs has been cleared).
+        """
+        return hashed_group_member_id in await _used_hashed_group_member_ids.aget()
+
+    @classmethod
+    async def aget_claimed_count(cls) -> int:
+        """Return the number of group memberships that have been used to make a member."""
+        return len(await _used_hashed_group_member_ids.aget())
+
+    @classmethod
+    def clear_used_hashed_group_member_ids(cls) -> None:
+        """
+        Clear the in-memory index of used hashed group member IDs.
+
+        This must be called after deleting `GroupMadeMember` objects,
+        so that the index is reloaded from the database when it is next used.
+        """
+        _used_hashed_group_member_ids.clear()
+
     @classmethod
     @override
     def _get_proxy_field_names(cls) -> "AbstractSet[str]":
         return {*super()._get_proxy_field_names(), "group_member_id"}
 
+    @classmethod
+    @override
+    def _resolve_field_name(cls, field_name: str) -> str:
+        return (
+            "hashed_group_member_id"
+            if field_name == "group_member_id"
+            else super()._resolve_field_name(field_name)
+        )
+
+
+class _UsedHashedGroupMemberIDIndex:
+    """
+    Thread-safe, lazily loaded set of every hashed group member ID stored in the database.
+
+    IDs are added as each new `GroupMadeMember` is committed,
+    so the set only needs to be loaded from the database once.
+    """
+
+    def __init__(self) -> None:
+        self._hashed_group_member_ids: set[str] | None = None
+        self._lock: threading.Lock = threading.Lock()
+        self._generation: int = 0
+
+    def _load(self) -> "AbstractSet[str]":
+        with self._lock:
+            generation: int = self._generation
+
+        hashed_group_member_ids: set[str] = set(
+            GroupMadeMember.objects.values_list("hashed_group_member_id", flat=True)
+        )
+
+        with self._lock:
+            # NOTE: The loaded set is only kept if the index was not cleared while loading, otherwise it may contain deleted IDs
+            if self._hashed_group_member_ids is None and self._generation == generation:
+                self._hashed_group_member_ids = hashed_group_member_ids
+
+            return hashed_group_member_ids
+
+    async def aget(self) -> "AbstractSet[str]":
+        """Return the set of used hashed group member IDs, loading it if needed."""
+        hashed_group_member_ids: AbstractSet[str] | None = self._hashed_group_member_ids
+        if hashed_group_member_ids is not None:
+            return hashed_group_member_ids
+
+        return await database_executor.run(self._load)
+
+    def add(self, hashed_group_member_id: str) -> None:
+        """Add the given newly stored hashed group member ID to the set, if it is loaded."""
+        with self._lock:
+            # NOTE: Added IDs must invalidate any set that is still being loaded, because the load's query may have run before the ID was committed
+            self._generation += 1
+
+            if self._hashed_group_member_ids is not None:
+                self._hashed_group_member_ids.add(hashed_group_member_id)
+
+    def clear(self) -> None:
+        """Discard the loaded set, so that it is reloaded from the database when next used."""
+        with self._lock:
+            self._generation += 1
+            self._hashed_group_member_ids = None
+
+
+_used_hashed_group_member_ids: "Final[_UsedHashedGroupMemberIDIndex]" = (
+    _UsedHashedGroupMemberIDIndex()
+)
+
+
+@receiver(models.signals.post_save, sender=GroupMadeMember)
+def _add_used_hashed_group_member_id(
+    instance: GroupMadeMember,
+    *,
+    created: bool,
+    **_kwargs: object,
+) -> None:
+    if created:
+        transaction.on_commit(
+            functools.partial(
+                _used_hashed_group_member_ids.add, instance.hashed_group_member_id
+            )
+        )
+
 
 class DiscordReminder(AsyncBaseModel):
     """Represents a reminder that a Discord member has requested to be sent to them."""
@@ -432,6 +609,94 @@ class LeftDiscordMember(AsyncBaseModel):
         return {*super()._get_proxy_field_names(), "roles"}
 
 
+class LeftDiscordMemberRoleCount(AsyncBaseModel):
+    """
+    Represents the number of Discord members that had a role when they left your guild.
+
+    These counts are kept up to date whenever a Discord member leaves your group's Discord
+    guild, so the stats commands do not need to scan every stored LeftDiscordMember.
+    The total number of Discord members that have left is stored with the role name "Total".
+    """
+
+    INSTANCES_NAME_PLURAL: str = "Left Discord Member Role Counts"
+
+    TOTAL_ROLE_NAME: "Final[str]" = "Total"
+
+    role_name = models.CharField(
+        _("Role Name"),
+        unique=True,
+        null=False,
+        blank=False,
+        max_length=101,
+    )
+
+    count = models.PositiveIntegerField(
+        _("Number of Discord members that had this role when they left"),
+        null=False,
+        blank=True,
+        validators=[MinValueValidator(0)],
+        default=0,
+    )
+
+    class Meta(TypedModelMeta):  # noqa: D106
+        verbose_name: "ClassVar[StrOrPromise]" = _(
+            "Number of Discord Members that had a Role "
+            "when they left your group's Discord guild"
+        )
+        verbose_name_plural: "ClassVar[StrOrPromise]" = _(
+            "Numbers of Discord Members that had each Role "
+            "when they left your group's Discord guild"
+        )
+
+    @override
+    def __str__(self) -> str:
+        return f"{self.role_name}: {self.count}"
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self._meta.verbose_name}: {self.role_name!r}, {self.count!r}>"
+
+    @classmethod
+    def get_counted_role_names(cls, role_names: "AbstractSet[str]") -> "AbstractSet[str]":
+        """
+        Return the subset of a left Discord member's role names that should be counted.
+
+        Discord members with both the @Committee & @Committee-Elect roles are only counted
+        as @Committee-Elect, and those with both the @Member & @Guest roles are only counted
+        as @Member.
+        """
+        excluded_role_names: set[str] = set()
+
+        if "@Committee-Elect" in role_names:
+            excluded_role_names.add("@Committee")
+
+        if "@Member" in role_names:
+            excluded_role_names.add("@Guest")
+
+        return role_names - excluded_role_names
+
+    @classmethod
+    def increment_role_counts(cls, role_names: "AbstractSet[str]") -> None:
+        """Count a Discord member that left your group's Discord guild with the given roles."""
+        with transaction.atomic():
+            role_name: str
+            for role_name in {cls.TOTAL_ROLE_NAME, *cls.get_counted_role_names(role_names)}:
+                role_count_was_incremented: bool = bool(
+                    cls.objects.filter(role_name=role_name).update(count=models.F("count") + 1)
+                )
+                if not role_count_was_incremented:
+                    cls.objects.create(role_name=role_name, count=1)
+
+    @classmethod
+    async def aincrement_role_counts(cls, role_names: "AbstractSet[str]") -> None:
+        """
+        Asynchronously count a Discord member that left with the given roles.
+
+        All the role counts are incremented within a single database transaction.
+        """
+        await database_executor.run(cls.increment_role_counts, role_names)
+
+
 class DiscordMemberStrikes(AsyncBaseModel):
     """
     Represents a Discord member that has been given one or more strikes.
@@ -482,3 +747,308 @@ class DiscordMemberStrikes(AsyncBaseModel):
     @override
     def __repr__(self) -> str:
         return f"<{self._meta.verbose_name}: {self.discord_member}, {self.strikes!r}>"
+
+
+class DiscordMemberMessageActivity(AsyncBaseModel):
+    """
+    Represents the number of messages a Discord member sent in a channel on a single day.
+
+    Storing this allows the stats commands to count the messages sent by a single Discord
+    member, without needing to crawl the message history of every channel.
+    """
+
+    INSTANCES_NAME_PLURAL: str = "Discord Member Message Activity objects"
+
+    discord_member = models.ForeignKey(
+        DiscordMember,
+        on_delete=models.CASCADE,
+        related_name="message_activity",
+        verbose_name=_("Discord Member"),
+        blank=False,
+        null=False,
+        unique=False,
+    )
+    _channel_id = models.CharField(
+        _("Discord Channel ID of the channel that the messages were sent in"),
+        unique=False,
+        null=False,
+        blank=False,
+        max_length=30,
+        validators=[
+            RegexValidator(
+                r"\A\d{17,20}\Z",
+                _(
+                    "channel_id must be a valid Discord channel ID (see https://docs.pycord.dev/en/stable/api/abcs.html#discord.abc.Snowflake.id)"
+                ),
+            )
+        ],
+    )
+    date = models.DateField(_("Date (in UTC) that the messages were sent on"))
+    message_count = models.PositiveIntegerField(
+        _("Number of messages sent"),
+        null=False,
+        blank=True,
+        validators=[MinValueValidator(0)],
+        default=0,
+    )
+
+    @property
+    def channel_id(self) -> int:  # noqa: D102
+        return int(self._channel_id)
+
+    @channel_id.setter
+    def channel_id(self, channel_id: str | int) -> None:
+        self._channel_id = str(channel_id)
+
+    class Meta(TypedModelMeta):  # noqa: D106
+        verbose_name: "ClassVar[StrOrPromise]" = _(
+            "Number of Messages a Discord Member sent in a Channel on a Day"
+        )
+        verbose_name_plural: "ClassVar[StrOrPromise]" = _(
+            "Numbers of Messages Discord Members sent in each Channel on each Day"
+        )
+        constraints: "ClassVar[list[BaseConstraint] | tuple[BaseConstraint, ...]]" = (
+            models.UniqueConstraint(
+                fields=["discord_member", "_channel_id", "date"],
+                name="unique_member_channel_date",
+            ),
+        )
+
+    @override
+    def __str__(self) -> str:
+        return f"{self.discord_member}: {self.channel_id}, {self.date}, {self.message_count}"
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"<{self._meta.verbose_name}: {self.discord_member}, "
+            f"{self.channel_id!r}, {self.date!r}, {self.message_count!r}>"
+        )
+
+    @classmethod
+    def record_message_counts(
+        cls,
+        message_counts: "Mapping[tuple[int, int, datetime.date], int]",
+        channels_indexed_until: "Mapping[int, datetime.datetime]",
+    ) -> None:
+        """
+        Add the given message counts to the stored activity, within a single transaction.
+
+        The message counts are keyed by (Discord member ID, channel ID, date).
+        The stored point in time up to which each channel's messages have been counted
+        is also moved forward to the given datetime.
+        """
+        with transaction.atomic():
+            discord_member_primary_keys: Mapping[str, int] = (
+                DiscordMember.get_or_create_primary_keys(
+                    {str(discord_member_id) for discord_member_id, _, _ in message_counts}
+                )
+            )
+
+            new_message_counts: dict[tuple[int, str, datetime.date], int] = {
+                (discord_member_primary_keys[str(discord_member_id)], str(channel_id), date): (
+                    message_count
+                )
+                for (discord_member_id, channel_id, date), message_count in (
+                    message_counts.items()
+                )
+            }
+
+            # NOTE: The stored activity of every given member, channel & date is fetched in a single query, so this can also fetch some unrelated activity, which is ignored
+            incremented_message_activity: list[DiscordMemberMessageActivity] = []
+
+            message_activity: DiscordMemberMessageActivity
+            for message_activity in cls.objects.filter(
+                discord_member_id__in={key[0] for key in new_message_counts},
+                _channel_id__in={key[1] for key in new_message_counts},
+                date__in={key[2] for key in new_message_counts},
+            ):
+                message_count: int | None = new_message_counts.pop(
+                    (
+                        message_activity.discord_member_id,
+                        str(message_activity.channel_id),
+                        message_activity.date,
+                    ),
+                    None,
+                )
+                if message_count is not None:
+                    message_activity.message_count += message_count
+                    incremented_message_activity.append(message_activity)
+
+            conflicts: Sequence[tuple[DiscordMemberMessageActivity, ValidationError]] = [
+                *cls.bulk_update(incremented_message_activity, ("message_count",)).conflicts,
+                *cls.bulk_create(
+                    {
+                        "discord_member_id": discord_member_primary_key,
+                        "channel_id": channel_id,
+                        "date": date,
+                        "message_count": message_count,
+                    }
+                    for (discord_member_primary_key, channel_id, date), message_count in (
+                        new_message_counts.items()
+                    )
+                ).conflicts,
+            ]
+            if conflicts:
+                raise conflicts[0][1]
+
+            channel_id: int
+            indexed_until: datetime.datetime
+            for channel_id, indexed_until in channels_indexed_until.items():
+                indexed_channel: MessageActivityIndexedChannel
+                indexed_channel, _ = MessageActivityIndexedChannel.objects.get_or_create(
+                    _channel_id=str(channel_id), defaults={"indexed_until": indexed_until}
+                )
+                if indexed_channel.indexed_until < indexed_until:
+                    indexed_channel.update(indexed_until=indexed_until)
+
+    @classmethod
+    async def arecord_message_counts(
+        cls,
+        message_counts: "Mapping[tuple[int, int, datetime.date], int]",
+        channels_indexed_until: "Mapping[int, datetime.datetime]",
+    ) -> None:
+        """Asynchronously add the given message counts to the stored activity."""
+        await database_executor.run(
+            cls.record_message_counts, message_counts, channels_indexed_until
+        )
+
+    @classmethod
+    @override
+    def _get_proxy_field_names(cls) -> "AbstractSet[str]":
+        return {*super()._get_proxy_field_names(), "channel_id"}
+
+
+class MessageActivityIndexedChannel(AsyncBaseModel):
+    """
+    Represents how far through a channel's message history the message activity is counted.
+
+    Every message sent in the channel up to (and including) the stored datetime has been
+    counted in the stored DiscordMemberMessageActivity objects.
+    """
+
+    INSTANCES_NAME_PLURAL: str = "Message Activity Indexed Channels"
+
+    _channel_id = models.CharField(
+        _("Discord Channel ID of the indexed channel"),
+        unique=True,
+        null=False,
+        blank=False,
+        max_length=30,
+        validators=[
+            RegexValidator(
+                r"\A\d{17,20}\Z",
+                _(
+                    "channel_id must be a valid Discord channel ID (see https://docs.pycord.dev/en/stable/api/abcs.html#discord.abc.Snowflake.id)"
+                ),
+            )
+        ],
+    )
+    indexed_until = models.DateTimeField(
+        _("Date & time that the channel's messages have been counted up to")
+    )
+
+    @property
+    def channel_id(self) -> int:  # noqa: D102
+        return int(self._channel_id)
+
+    @channel_id.setter
+    def channel_id(self, channel_id: str | int) -> None:
+        self._channel_id = str(channel_id)
+
+    class Meta(TypedModelMeta):  # noqa: D106
+        verbose_name: "ClassVar[StrOrPromise]" = _(
+            "Channel that has had its message activity counted"
+        )
+        verbose_name_plural: "ClassVar[StrOrPromise]" = _(
+            "Channels that have had their message activity counted"
+        )
+
+    @override
+    def __str__(self) -> str:
+        return f"{self.channel_id}: {self.indexed_until}"
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self._meta.verbose_name}: {self.channel_id!r}, {self.indexed_until!r}>"
+
+    @classmethod
+    @override
+    def _get_proxy_field_names(cls) -> "AbstractSet[str]":
+        return {*super()._get_proxy_field_names(), "channel_id"}
+
+
+class ScheduledMessageDeletion(AsyncBaseModel):
+    """Represents a message sent by TeX-Bot that needs to be deleted at a later time."""
+
+    INSTANCES_NAME_PLURAL: str = "Scheduled Message Deletions"
+
+    _channel_id = models.CharField(
+        _("Discord Channel ID of the channel that the message was sent in"),
+        unique=False,
+        null=False,
+        blank=False,
+        max_length=30,
+        validators=[
+            RegexValidator(
+                r"\A\d{17,20}\Z",
+                _(
+                    "channel_id must be a valid Discord channel ID (see https://docs.pycord.dev/en/stable/api/abcs.html#discord.abc.Snowflake.id)"
+                ),
+            )
+        ],
+    )
+    _message_id = models.CharField(
+        _("Discord Message ID of the message to delete"),
+        unique=True,
+        null=False,
+        blank=False,
+        max_length=30,
+        validators=[
+            RegexValidator(
+                r"\A\d{17,20}\Z",
+                _(
+                    "message_id must be a valid Discord message ID (see https://docs.pycord.dev/en/stable/api/abcs.html#discord.abc.Snowflake.id)"
+                ),
+            )
+        ],
+    )
+    delete_datetime = models.DateTimeField(
+        _("Date & time to delete the message"), unique=False, null=False, blank=False
+    )
+
+    @property
+    def channel_id(self) -> int:  # noqa: D102
+        return int(self._channel_id)
+
+    @channel_id.setter
+    def channel_id(self, channel_id: str | int) -> None:
+        self._channel_id = str(channel_id)
+
+    @property
+    def message_id(self) -> int:  # noqa: D102
+        return int(self._message_id)
+
+    @message_id.setter
+    def message_id(self, message_id: str | int) -> None:
+        self._message_id = str(message_id)
+
+    class Meta(TypedModelMeta):  # noqa: D106
+        verbose_name: "ClassVar[StrOrPromise]" = _("Scheduled deletion of a message")
+        verbose_name_plural: "ClassVar[StrOrPromise]" = _("Scheduled deletions of messages")
+
+    @override
+    def __str__(self) -> str:
+        return f"{self.message_id}: {self.delete_datetime}"
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"<{self._meta.verbose_name}: "
+            f"{self.channel_id!r}, {self.message_id!r}, {self.delete_datetime!r}>"
+        )
+
+    @classmethod
+    @override
+    def _get_proxy_field_names(cls) -> "AbstractSet[str]":
+        return {*super()._get_proxy_field_names(), "channel_id", "message_id"}
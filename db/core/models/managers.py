@@ -1,17 +1,22 @@
 """Model classes that store extra information between individual event handling call-backs."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
-from django.db.models import Manager
+from django.db import NotSupportedError
+from django.db.models import Manager, QuerySet
+from django.db.models.query import ModelIterable
+
+from db.executor import database_executor
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
+    from typing import Final
 
     from django.db.models import Model
 
     from . import DiscordMember  # noqa: F401
 
-__all__: "Sequence[str]" = ()
+__all__: "Sequence[str]" = ("DatabaseExecutorManager", "DatabaseExecutorQuerySet")
 
 
 class HashedDiscordMemberManager(Manager["DiscordMember"]):
@@ -20,3 +25,154 @@ class HashedDiscordMemberManager(Manager["DiscordMember"]):
 
 class RelatedDiscordMemberManager[T_Model: "Model"](Manager[T_Model]):
     pass
+
+
+class DatabaseExecutorQuerySet[T_Model: "Model"](QuerySet[T_Model]):
+    """
+    QuerySet whose asynchronous methods are run on the shared database executor.
+
+    Django's own asynchronous methods each run their synchronous counterpart
+    on a single thread shared with every other `sync_to_async` call.
+    Instead, these are queued in the lane of the current `database_task_priority`,
+    so background tasks can never hold up interactive commands.
+    """
+
+    @override
+    def __aiter__(self) -> "AsyncIterator[T_Model]":
+        async def generator() -> "AsyncIterator[T_Model]":
+            await database_executor.run(self._fetch_all)  # type: ignore[attr-defined]
+
+            item: T_Model
+            for item in self._result_cache:  # type: ignore[attr-defined]
+                yield item
+
+        return generator()
+
+    @override
+    async def aiterator(self, chunk_size: int = 2000) -> "AsyncIterator[T_Model]":  # type: ignore[override]
+        """
+        Asynchronously iterate over the objects of this QuerySet, in primary key order.
+
+        A database cursor cannot be shared between the executor's threads,
+        so each chunk is instead fetched by its own call,
+        starting after the primary key of the last object of the previous chunk.
+        """
+        if chunk_size <= 0:
+            INVALID_CHUNK_SIZE_MESSAGE: Final[str] = "Chunk size must be strictly positive."
+            raise ValueError(INVALID_CHUNK_SIZE_MESSAGE)
+
+        if (
+            self._iterable_class is not ModelIterable  # type: ignore[attr-defined]
+            or self.query.is_sliced
+            or self.query.order_by not in ((), ("pk",), (self.model._meta.pk.name,))
+        ):
+            UNSUPPORTED_QUERYSET_MESSAGE: Final[str] = (
+                "aiterator() can only iterate over unsliced querysets of model objects "
+                "in primary key order. Use `async for` to fetch every result at once instead."
+            )
+            raise NotSupportedError(UNSUPPORTED_QUERYSET_MESSAGE)
+
+        chunk_queryset: QuerySet[T_Model] = self.order_by("pk")
+        while True:
+            chunk: list[T_Model] = await database_executor.run(
+                list, chunk_queryset[:chunk_size]
+            )
+
+            item: T_Model
+            for item in chunk:
+                yield item
+
+            if len(chunk) < chunk_size:
+                return
+
+            chunk_queryset = self.order_by("pk").filter(pk__gt=chunk[-1].pk)
+
+    @override
+    async def aaggregate(self, *args: object, **kwargs: object) -> "dict[str, object]":
+        return await database_executor.run(self.aggregate, *args, **kwargs)  # type: ignore[arg-type]
+
+    @override
+    async def acount(self) -> int:
+        return await database_executor.run(self.count)
+
+    @override
+    async def aget(self, *args: object, **kwargs: object) -> T_Model:
+        return await database_executor.run(self.get, *args, **kwargs)  # type: ignore[arg-type]
+
+    @override
+    async def acreate(self, **kwargs: object) -> T_Model:
+        return await database_executor.run(self.create, **kwargs)
+
+    @override
+    async def abulk_create(  # type: ignore[override]
+        self, objs: "Iterable[T_Model]", *args: object, **kwargs: object
+    ) -> list[T_Model]:
+        return await database_executor.run(self.bulk_create, objs, *args, **kwargs)  # type: ignore[arg-type]
+
+    @override
+    async def abulk_update(  # type: ignore[override]
+        self, objs: "Iterable[T_Model]", *args: object, **kwargs: object
+    ) -> int:
+        return await database_executor.run(self.bulk_update, objs, *args, **kwargs)  # type: ignore[arg-type]
+
+    @override
+    async def aget_or_create(  # type: ignore[override]
+        self, defaults: "Mapping[str, object] | None" = None, **kwargs: object
+    ) -> tuple[T_Model, bool]:
+        return await database_executor.run(self.get_or_create, defaults, **kwargs)
+
+    @override
+    async def aupdate_or_create(  # type: ignore[override]
+        self,
+        defaults: "Mapping[str, object] | None" = None,
+        create_defaults: "Mapping[str, object] | None" = None,
+        **kwargs: object,
+    ) -> tuple[T_Model, bool]:
+        return await database_executor.run(
+            self.update_or_create, defaults, create_defaults, **kwargs
+        )
+
+    @override
+    async def aearliest(self, *fields: str) -> T_Model:  # type: ignore[override]
+        return await database_executor.run(self.earliest, *fields)
+
+    @override
+    async def alatest(self, *fields: str) -> T_Model:  # type: ignore[override]
+        return await database_executor.run(self.latest, *fields)
+
+    @override
+    async def afirst(self) -> T_Model | None:
+        return await database_executor.run(self.first)
+
+    @override
+    async def alast(self) -> T_Model | None:
+        return await database_executor.run(self.last)
+
+    @override
+    async def ain_bulk(  # type: ignore[override]
+        self, id_list: "Iterable[object] | None" = None, *, field_name: str = "pk"
+    ) -> "dict[object, T_Model]":
+        return await database_executor.run(self.in_bulk, id_list, field_name=field_name)
+
+    @override
+    async def adelete(self) -> tuple[int, dict[str, int]]:
+        return await database_executor.run(self.delete)
+
+    @override
+    async def aupdate(self, **kwargs: object) -> int:
+        return await database_executor.run(self.update, **kwargs)
+
+    @override
+    async def aexists(self) -> bool:
+        return await database_executor.run(self.exists)
+
+    @override
+    async def acontains(self, obj: T_Model) -> bool:
+        return await database_executor.run(self.contains, obj)
+
+    @override
+    async def aexplain(self, *, format: str | None = None, **options: object) -> str:
+        return await database_executor.run(self.explain, format=format, **options)
+
+
+DatabaseExecutorManager = Manager.from_queryset(DatabaseExecutorQuerySet)
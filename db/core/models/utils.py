@@ -1,22 +1,43 @@
 """Utility classes and functions."""
 
-from typing import TYPE_CHECKING, override
+import collections
+import functools
+import itertools
+import threading
+from typing import TYPE_CHECKING, NamedTuple, override
 
-from asgiref.sync import sync_to_async
-from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.validators import RegexValidator
-from django.db import models, transaction
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, models, transaction
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from django_stubs_ext.db.models import TypedModelMeta
 
+from db.executor import database_executor
+
+from .managers import DatabaseExecutorManager
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import AsyncIterator, Callable, Iterable, Mapping, Sequence
     from collections.abc import Set as AbstractSet
-    from typing import ClassVar, Final
+    from typing import ClassVar, Final, Self
 
     from django.db.models.base import ModelBase
 
-__all__: "Sequence[str]" = ("AsyncBaseModel", "DiscordMember")
+__all__: "Sequence[str]" = (
+    "AsyncBaseModel",
+    "BulkWriteResult",
+    "DiscordMember",
+    "DiscordMemberPrimaryKeyMap",
+    "discord_member_primary_keys",
+)
+
+
+class BulkWriteResult[M: "AsyncBaseModel"](NamedTuple):
+    """The objects written by a bulk write, and the objects rejected along with the reason."""
+
+    written: "Sequence[M]"
+    conflicts: "Sequence[tuple[M, ValidationError]]"
 
 
 class AsyncBaseModel(models.Model):
@@ -29,6 +50,14 @@ class AsyncBaseModel(models.Model):
 
     INSTANCES_NAME_PLURAL: str
 
+    # NOTE: When set, uniqueness is only checked by querying the database after the database itself has rejected a row, instead of before every save
+    DEFER_UNIQUENESS_VALIDATION_TO_DATABASE: "ClassVar[bool]" = True
+
+    BULK_WRITE_BATCH_SIZE: "ClassVar[int]" = 500
+    DELETE_ALL_CHUNK_SIZE: "ClassVar[int]" = 1000
+
+    objects = DatabaseExecutorManager()
+
     class Meta(TypedModelMeta):  # noqa: D106
         abstract: "ClassVar[bool]" = True
 
@@ -39,13 +68,12 @@ class AsyncBaseModel(models.Model):
             for field_name in set(kwargs.keys()) & self._get_proxy_field_names()
         }
 
-        with transaction.atomic():
-            super().__init__(*args, **kwargs)  # noqa: CAR151
+        super().__init__(*args, **kwargs)  # noqa: CAR151
 
-            field_name: str
-            value: object
-            for field_name, value in proxy_fields.items():
-                setattr(self, field_name, value)
+        field_name: str
+        value: object
+        for field_name, value in proxy_fields.items():
+            setattr(self, field_name, value)
 
     @override
     def save(
@@ -56,15 +84,75 @@ class AsyncBaseModel(models.Model):
         using: str | None = None,
         update_fields: "Iterable[str] | None" = None,
     ) -> None:
-        self.full_clean()
+        """
+        Validate this object, then save it to the database.
+
+        If uniqueness validation is deferred to the database,
+        only the validators that do not query the database are run before saving.
+        Any row that the database then rejects is reported by raising the same
+        `ValidationError` that fully validating it beforehand would have raised.
+        """
+        if not self.DEFER_UNIQUENESS_VALIDATION_TO_DATABASE:
+            self.full_clean()
+
+            return super().save(
+                force_insert=force_insert,
+                force_update=force_update,
+                using=using,
+                update_fields=update_fields,
+            )
+
+        self._clean_without_queries()
+
+        try:
+            with transaction.atomic(using=using):
+                return super().save(
+                    force_insert=force_insert,
+                    force_update=force_update,
+                    using=using,
+                    update_fields=update_fields,
+                )
+        except IntegrityError:
+            self.full_clean()
+            raise
 
-        return super().save(
+    @override
+    async def asave(
+        self,
+        *,
+        force_insert: bool | tuple["ModelBase", ...] = False,
+        force_update: bool = False,
+        using: str | None = None,
+        update_fields: "Iterable[str] | None" = None,
+    ) -> None:
+        """Asynchronously validate this object, then save it to the database."""
+        await database_executor.run(
+            self.save,
             force_insert=force_insert,
             force_update=force_update,
             using=using,
             update_fields=update_fields,
         )
 
+    setattr(asave, "alters_data", True)  # noqa: B010
+
+    @override
+    async def adelete(
+        self, using: str | None = None, *, keep_parents: bool = False
+    ) -> tuple[int, dict[str, int]]:
+        return await database_executor.run(self.delete, using, keep_parents)
+
+    setattr(adelete, "alters_data", True)  # noqa: B010
+
+    @override
+    async def arefresh_from_db(
+        self,
+        using: str | None = None,
+        fields: "Sequence[str] | None" = None,
+        from_queryset: "models.QuerySet[Self] | None" = None,
+    ) -> None:
+        await database_executor.run(self.refresh_from_db, using, fields, from_queryset)
+
     def update(
         self,
         *,
@@ -140,7 +228,8 @@ class AsyncBaseModel(models.Model):
         (or equivalent for non-SQL backends), respectively.
         Normally, they should not be set.
         """
-        await sync_to_async(self.update)(
+        await database_executor.run(
+            self.update,
             commit=commit,
             force_insert=force_insert,
             force_update=force_update,
@@ -151,6 +240,304 @@ class AsyncBaseModel(models.Model):
 
     setattr(aupdate, "alters_data", True)  # noqa: B010
 
+    def _clean_without_queries(self, exclude: "Iterable[str]" = ()) -> None:
+        """Run every validator of this object that does not need to query the database."""
+        self.full_clean(
+            exclude={
+                *exclude,
+                *(field.name for field in self._meta.concrete_fields if field.is_relation),
+            },
+            validate_unique=False,
+            validate_constraints=False,
+        )
+
+    @classmethod
+    def _resolve_field_name(cls, field_name: str) -> str:
+        """Return the name of the database field that the given (proxy) field is stored in."""
+        if field_name not in cls._get_proxy_field_names():
+            return field_name
+
+        return cls._meta.get_field(f"_{field_name}").name
+
+    @classmethod
+    def _build_bulk_instances(
+        cls, rows: "Iterable[Self | Mapping[str, object]]", *, exclude: "Iterable[str]" = ()
+    ) -> "tuple[list[Self], list[tuple[Self, ValidationError]]]":
+        """Build an object from each given row, then validate them all in memory."""
+        valid_instances: list[Self] = []
+        invalid_instances: list[tuple[Self, ValidationError]] = []
+
+        row: Self | Mapping[str, object]
+        for row in rows:
+            instance: Self = row if isinstance(row, cls) else cls(**row)  # type: ignore[arg-type]
+            try:
+                instance._clean_without_queries(exclude=exclude)
+            except ValidationError as validation_error:
+                invalid_instances.append((instance, validation_error))
+            else:
+                valid_instances.append(instance)
+
+        return valid_instances, invalid_instances
+
+    @classmethod
+    def _write_bulk_instances(
+        cls,
+        instances: "Sequence[Self]",
+        invalid_instances: "Sequence[tuple[Self, ValidationError]]",
+        write_batch: "Callable[[Sequence[Self]], object]",
+        *,
+        batch_size: int | None,
+    ) -> "BulkWriteResult[Self]":
+        """
+        Write the given objects in batches, all within a single transaction.
+
+        Each batch is written within its own savepoint.
+        If the database rejects any row of a batch,
+        the batch is rolled back & retried one row at a time,
+        so that only the rejected rows are reported as conflicts.
+        """
+        written_instances: list[Self] = []
+        conflicts: list[tuple[Self, ValidationError]] = list(invalid_instances)
+
+        with transaction.atomic():
+            batch: Sequence[Self]
+            for batch in itertools.batched(
+                instances, batch_size or cls.BULK_WRITE_BATCH_SIZE, strict=False
+            ):
+                try:
+                    with transaction.atomic():
+                        write_batch(batch)
+                except IntegrityError:
+                    instance: Self
+                    for instance in batch:
+                        try:
+                            with transaction.atomic():
+                                write_batch((instance,))
+                        except IntegrityError as integrity_error:
+                            conflict_error: ValidationError = instance._get_conflict_error(  # noqa: SLF001
+                                integrity_error
+                            )
+                            conflicts.append((instance, conflict_error))
+                        else:
+                            written_instances.append(instance)
+                else:
+                    written_instances.extend(batch)
+
+        return BulkWriteResult(written=written_instances, conflicts=conflicts)
+
+    def _get_conflict_error(self, integrity_error: IntegrityError) -> ValidationError:
+        """Return the validation error explaining why the database rejected this object."""
+        try:
+            self.full_clean()
+        except ValidationError as validation_error:
+            return validation_error
+
+        return ValidationError(str(integrity_error))
+
+    @classmethod
+    def bulk_create(
+        cls, rows: "Iterable[Self | Mapping[str, object]]", *, batch_size: int | None = None
+    ) -> "BulkWriteResult[Self]":
+        """
+        Validate & create many new objects, within a single transaction.
+
+        Each row can be either an unsaved object or a mapping of field names
+        (including proxy fields) to values.
+        Rows that are invalid, or that the database rejects, are not created
+        and are instead returned as conflicts, along with the reason they were rejected.
+        """
+        valid_instances: list[Self]
+        invalid_instances: list[tuple[Self, ValidationError]]
+        valid_instances, invalid_instances = cls._build_bulk_instances(rows)
+
+        return cls._write_bulk_instances(
+            valid_instances,
+            invalid_instances,
+            cls.objects.bulk_create,
+            batch_size=batch_size,
+        )
+
+    setattr(bulk_create, "alters_data", True)  # noqa: B010
+
+    @classmethod
+    async def abulk_create(
+        cls, rows: "Iterable[Self | Mapping[str, object]]", *, batch_size: int | None = None
+    ) -> "BulkWriteResult[Self]":
+        """Asynchronously validate & create many new objects, within a single transaction."""
+        return await database_executor.run(cls.bulk_create, list(rows), batch_size=batch_size)
+
+    setattr(abulk_create, "alters_data", True)  # noqa: B010
+
+    @classmethod
+    def bulk_upsert(
+        cls,
+        rows: "Iterable[Self | Mapping[str, object]]",
+        *,
+        unique_fields: "Iterable[str]",
+        update_fields: "Iterable[str]" = (),
+        batch_size: int | None = None,
+    ) -> "BulkWriteResult[Self]":
+        """
+        Validate & create many objects, updating any that already exist instead.
+
+        Rows that clash with an existing object on the given unique fields
+        update that object's given update fields.
+        If no update fields are given, existing objects are left unchanged.
+        """
+        resolved_unique_fields: Sequence[str] = [
+            cls._resolve_field_name(field_name) for field_name in unique_fields
+        ]
+        resolved_update_fields: Sequence[str] = [
+            cls._resolve_field_name(field_name) for field_name in update_fields
+        ]
+
+        valid_instances: list[Self]
+        invalid_instances: list[tuple[Self, ValidationError]]
+        valid_instances, invalid_instances = cls._build_bulk_instances(rows)
+
+        return cls._write_bulk_instances(
+            valid_instances,
+            invalid_instances,
+            (
+                functools.partial(
+                    cls.objects.bulk_create,
+                    update_conflicts=True,
+                    unique_fields=resolved_unique_fields,
+                    update_fields=resolved_update_fields,
+                )
+                if resolved_update_fields
+                else functools.partial(cls.objects.bulk_create, ignore_conflicts=True)
+            ),
+            batch_size=batch_size,
+        )
+
+    setattr(bulk_upsert, "alters_data", True)  # noqa: B010
+
+    @classmethod
+    async def abulk_upsert(
+        cls,
+        rows: "Iterable[Self | Mapping[str, object]]",
+        *,
+        unique_fields: "Iterable[str]",
+        update_fields: "Iterable[str]" = (),
+        batch_size: int | None = None,
+    ) -> "BulkWriteResult[Self]":
+        """Asynchronously validate & create many objects, updating any that already exist."""
+        return await database_executor.run(
+            cls.bulk_upsert,
+            list(rows),
+            unique_fields=tuple(unique_fields),
+            update_fields=tuple(update_fields),
+            batch_size=batch_size,
+        )
+
+    setattr(abulk_upsert, "alters_data", True)  # noqa: B010
+
+    @classmethod
+    def bulk_update(
+        cls,
+        instances: "Iterable[Self]",
+        fields: "Iterable[str]",
+        *,
+        batch_size: int | None = None,
+    ) -> "BulkWriteResult[Self]":
+        """
+        Validate & save the given fields of many existing objects, within a single transaction.
+
+        The given fields can include proxy fields.
+        Only the given fields are validated & saved.
+        """
+        resolved_fields: AbstractSet[str] = {
+            cls._resolve_field_name(field_name) for field_name in fields
+        }
+
+        valid_instances: list[Self]
+        invalid_instances: list[tuple[Self, ValidationError]]
+        valid_instances, invalid_instances = cls._build_bulk_instances(
+            instances,
+            exclude={
+                field.name
+                for field in cls._meta.concrete_fields
+                if field.name not in resolved_fields
+            },
+        )
+
+        return cls._write_bulk_instances(
+            valid_instances,
+            invalid_instances,
+            functools.partial(cls.objects.bulk_update, fields=list(resolved_fields)),
+            batch_size=batch_size,
+        )
+
+    setattr(bulk_update, "alters_data", True)  # noqa: B010
+
+    @classmethod
+    async def abulk_update(
+        cls,
+        instances: "Iterable[Self]",
+        fields: "Iterable[str]",
+        *,
+        batch_size: int | None = None,
+    ) -> "BulkWriteResult[Self]":
+        """Asynchronously validate & save the given fields of many existing objects."""
+        return await database_executor.run(
+            cls.bulk_update, list(instances), tuple(fields), batch_size=batch_size
+        )
+
+    setattr(abulk_update, "alters_data", True)  # noqa: B010
+
+    @classmethod
+    def delete_first_chunk(cls, chunk_size: int | None = None) -> int:
+        """
+        Delete the stored objects with the lowest primary keys, within a single transaction.
+
+        At most the given number of objects of this model are deleted,
+        and the number that were deleted is returned (0 once none are left).
+        """
+        chunk_size = chunk_size or cls.DELETE_ALL_CHUNK_SIZE
+
+        with transaction.atomic():
+            chunk_last_primary_keys: Sequence[object] = list(
+                cls._default_manager.order_by("pk").values_list("pk", flat=True)[
+                    chunk_size - 1 : chunk_size
+                ]
+            )
+            chunk: models.QuerySet[Self] = (
+                cls._default_manager.filter(pk__lte=chunk_last_primary_keys[0])
+                if chunk_last_primary_keys
+                else cls._default_manager.all()
+            )
+
+            # NOTE: When no signals or cascades apply to this model, Django deletes the chunk using a single raw DELETE statement. Otherwise, only the chunk's own related objects are collected into memory.
+            deleted_counts: Mapping[str, int]
+            _, deleted_counts = chunk.delete()
+
+            return deleted_counts.get(cls._meta.label, 0)
+
+    setattr(delete_first_chunk, "alters_data", True)  # noqa: B010
+
+    @classmethod
+    async def adelete_all_in_chunks(
+        cls, chunk_size: int | None = None
+    ) -> "AsyncIterator[int]":
+        """
+        Asynchronously delete every stored object, in chunks of consecutive primary keys.
+
+        Each chunk is deleted in its own transaction,
+        so other database writes can be made between chunks,
+        and the number of objects deleted in each chunk is yielded as it completes.
+        """
+        while True:
+            deleted_count: int = await database_executor.run(
+                cls.delete_first_chunk, chunk_size
+            )
+            if not deleted_count:
+                return
+
+            yield deleted_count
+
+    setattr(adelete_all_in_chunks, "alters_data", True)  # noqa: B010
+
     @classmethod
     def _get_proxy_field_names(cls) -> "AbstractSet[str]":
         """
@@ -163,6 +550,54 @@ class AsyncBaseModel(models.Model):
         return set()
 
 
+class DiscordMemberPrimaryKeyMap:
+    """
+    Bounded, least-recently-used map of Discord member IDs to `DiscordMember` primary keys.
+
+    This map is shared between the event loop & the database threads, so is thread-safe.
+    """
+
+    DEFAULT_MAX_SIZE: "Final[int]" = 4096
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Initialise a new empty map, that holds at most the given number of primary keys."""
+        self._max_size: int = max_size
+        self._primary_keys: collections.OrderedDict[str, int] = collections.OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of primary keys stored in this map."""
+        return len(self._primary_keys)
+
+    def get(self, discord_id: str) -> int | None:
+        """Return the primary key of the given Discord member, if it is stored."""
+        with self._lock:
+            primary_key: int | None = self._primary_keys.get(discord_id)
+            if primary_key is not None:
+                self._primary_keys.move_to_end(discord_id)
+
+            return primary_key
+
+    def add(self, discord_id: str, primary_key: int) -> None:
+        """Store the primary key of the given Discord member, evicting the oldest if full."""
+        with self._lock:
+            self._primary_keys[discord_id] = primary_key
+            self._primary_keys.move_to_end(discord_id)
+
+            while len(self._primary_keys) > self._max_size:
+                self._primary_keys.popitem(last=False)
+
+    def remove(self, discord_id: str) -> None:
+        """Remove the primary key of the given Discord member, if it is stored."""
+        with self._lock:
+            self._primary_keys.pop(discord_id, None)
+
+    def clear(self) -> None:
+        """Remove every stored primary key."""
+        with self._lock:
+            self._primary_keys.clear()
+
+
 class DiscordMember(AsyncBaseModel):
     """
     Common model to represent a Discord guild member.
@@ -207,3 +642,133 @@ class DiscordMember(AsyncBaseModel):
     @override
     def _get_proxy_field_names(cls) -> "AbstractSet[str]":
         return {*super()._get_proxy_field_names(), "member_id"}
+
+    @classmethod
+    @override
+    def _resolve_field_name(cls, field_name: str) -> str:
+        return (
+            "discord_id"
+            if field_name == "member_id"
+            else super()._resolve_field_name(field_name)
+        )
+
+    @classmethod
+    def _from_primary_key(cls, primary_key: int, discord_id: str) -> "DiscordMember":
+        """Return an instance of an existing Discord member, without querying the database."""
+        return cls.from_db(DEFAULT_DB_ALIAS, ("id", "discord_id"), (primary_key, discord_id))
+
+    @classmethod
+    def get_or_create_cached(cls, discord_id: str | int) -> "DiscordMember":
+        """
+        Return the Discord member with the given ID, creating them if they do not yet exist.
+
+        The primary keys of recently used Discord members are cached,
+        so the database is only queried for Discord members that have not been used recently.
+        """
+        discord_id = str(discord_id)
+
+        primary_key: int | None = discord_member_primary_keys.get(discord_id)
+        if primary_key is not None:
+            return cls._from_primary_key(primary_key, discord_id)
+
+        discord_member: DiscordMember = cls.objects.get_or_create(discord_id=discord_id)[0]
+
+        # NOTE: The primary key is only cached once it is committed, in case the transaction it was created within is rolled back
+        transaction.on_commit(
+            functools.partial(discord_member_primary_keys.add, discord_id, discord_member.pk)
+        )
+
+        return discord_member
+
+    @classmethod
+    def get_or_create_primary_keys(
+        cls, discord_ids: "Iterable[str | int]"
+    ) -> "Mapping[str, int]":
+        """
+        Return the primary key of each given Discord member, creating any that do not exist.
+
+        Only the Discord members whose primary keys are not cached are queried,
+        and all the missing Discord members are created in a single statement.
+        """
+        primary_keys: dict[str, int] = {}
+        uncached_discord_ids: set[str] = set()
+
+        discord_id: str
+        for discord_id in {str(discord_id) for discord_id in discord_ids}:
+            primary_key: int | None = discord_member_primary_keys.get(discord_id)
+            if primary_key is None:
+                uncached_discord_ids.add(discord_id)
+            else:
+                primary_keys[discord_id] = primary_key
+
+        if not uncached_discord_ids:
+            return primary_keys
+
+        with transaction.atomic():
+            fetched_primary_keys: dict[str, int] = dict(
+                cls.objects.filter(discord_id__in=uncached_discord_ids).values_list(
+                    "discord_id", "pk"
+                )
+            )
+
+            new_discord_members: list[DiscordMember] = [
+                cls(discord_id=discord_id)
+                for discord_id in uncached_discord_ids - fetched_primary_keys.keys()
+            ]
+            if new_discord_members:
+                new_discord_member: DiscordMember
+                for new_discord_member in new_discord_members:
+                    new_discord_member.clean_fields()
+
+                cls.objects.bulk_create(new_discord_members)
+                fetched_primary_keys.update(
+                    cls.objects.filter(
+                        discord_id__in=[
+                            new_discord_member.discord_id
+                            for new_discord_member in new_discord_members
+                        ]
+                    ).values_list("discord_id", "pk")
+                )
+
+            fetched_primary_key: int
+            for discord_id, fetched_primary_key in fetched_primary_keys.items():
+                transaction.on_commit(
+                    functools.partial(
+                        discord_member_primary_keys.add, discord_id, fetched_primary_key
+                    )
+                )
+
+        primary_keys.update(fetched_primary_keys)
+
+        return primary_keys
+
+    @classmethod
+    async def aget_or_create_primary_keys(
+        cls, discord_ids: "Iterable[str | int]"
+    ) -> "Mapping[str, int]":
+        """Asynchronously return the primary key of each given Discord member, creating any."""
+        return await database_executor.run(cls.get_or_create_primary_keys, list(discord_ids))
+
+    @classmethod
+    async def aget_or_create_cached(cls, discord_id: str | int) -> "DiscordMember":
+        """
+        Asynchronously return the Discord member with the given ID, creating them if needed.
+
+        Cached Discord members are returned without leaving the event loop.
+        """
+        primary_key: int | None = discord_member_primary_keys.get(str(discord_id))
+        if primary_key is not None:
+            return cls._from_primary_key(primary_key, str(discord_id))
+
+        return await database_executor.run(cls.get_or_create_cached, discord_id)
+
+
+discord_member_primary_keys: "Final[DiscordMemberPrimaryKeyMap]" = DiscordMemberPrimaryKeyMap()
+
+
+@receiver(models.signals.post_delete, sender=DiscordMember)
+def _remove_deleted_discord_member_primary_key(
+    instance: DiscordMember,
+    **_kwargs: object,
+) -> None:
+    discord_member_primary_keys.remove(instance.discord_id)
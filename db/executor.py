@@ -0,0 +1,252 @@
+"""Bounded pool of dedicated database threads, that runs ORM calls from asynchronous code."""
+
+import asyncio
+import collections
+import contextvars
+import enum
+import functools
+import statistics
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db import close_old_connections
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = (
+    "DatabaseExecutor",
+    "DatabaseExecutorMetrics",
+    "DatabaseTaskPriority",
+    "background_database_priority",
+    "database_executor",
+    "database_task_priority",
+)
+
+
+class DatabaseTaskPriority(enum.IntEnum):
+    """The lane that a database task is queued in. Interactive tasks are always run first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+database_task_priority: "Final[contextvars.ContextVar[DatabaseTaskPriority]]" = (
+    contextvars.ContextVar("database_task_priority", default=DatabaseTaskPriority.INTERACTIVE)
+)
+
+
+class DatabaseExecutorMetrics(NamedTuple):
+    """Snapshot of the queue depth & recent latencies (in milliseconds) of each lane."""
+
+    queue_depths: "Mapping[DatabaseTaskPriority, int]"
+    busy_thread_count: int
+    completed_task_counts: "Mapping[DatabaseTaskPriority, int]"
+    median_wait_durations: "Mapping[DatabaseTaskPriority, float]"
+    median_run_durations: "Mapping[DatabaseTaskPriority, float]"
+
+
+class _DatabaseTask:
+    """A queued call, along with the future that its result is returned through."""
+
+    __slots__ = ("call", "future", "loop", "queued_time")
+
+    def __init__(
+        self,
+        call: "Callable[[], object]",
+        future: "asyncio.Future[object]",
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.call: Callable[[], object] = call
+        self.future: asyncio.Future[object] = future
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.queued_time: float = time.perf_counter()
+
+
+class DatabaseExecutor:
+    """
+    Bounded pool of dedicated threads, that each run database calls on their own connection.
+
+    Calls are queued in one of two lanes, taken from the current `database_task_priority`.
+    Every thread takes interactive calls before background calls,
+    and one thread only ever runs interactive calls,
+    so a slow background task can never hold up every interactive command.
+    """
+
+    DEFAULT_THREAD_COUNT: "Final[int]" = 4
+    LATENCY_SAMPLE_COUNT: "Final[int]" = 1000
+
+    def __init__(self, thread_count: int = DEFAULT_THREAD_COUNT) -> None:
+        """Initialise a new database executor, whose threads are started when first used."""
+        if thread_count < 2:
+            INVALID_THREAD_COUNT_MESSAGE: Final[str] = (
+                "thread_count must be at least 2, so that one thread can be reserved "
+                "for interactive tasks."
+            )
+            raise ValueError(INVALID_THREAD_COUNT_MESSAGE)
+
+        self._thread_count: int = thread_count
+        self._threads: list[threading.Thread] = []
+        self._condition: threading.Condition = threading.Condition()
+        self._queues: Mapping[DatabaseTaskPriority, collections.deque[_DatabaseTask]] = {
+            priority: collections.deque() for priority in DatabaseTaskPriority
+        }
+        self._busy_thread_count: int = 0
+        self._completed_task_counts: dict[DatabaseTaskPriority, int] = dict.fromkeys(
+            DatabaseTaskPriority, 0
+        )
+        self._wait_durations: Mapping[DatabaseTaskPriority, collections.deque[float]] = {
+            priority: collections.deque(maxlen=self.LATENCY_SAMPLE_COUNT)
+            for priority in DatabaseTaskPriority
+        }
+        self._run_durations: Mapping[DatabaseTaskPriority, collections.deque[float]] = {
+            priority: collections.deque(maxlen=self.LATENCY_SAMPLE_COUNT)
+            for priority in DatabaseTaskPriority
+        }
+
+    def _start_threads(self) -> None:
+        thread_index: int
+        for thread_index in range(self._thread_count):
+            thread: threading.Thread = threading.Thread(
+                target=self._run_worker,
+                kwargs={"interactive_only": thread_index == 0},
+                name=f"TeX-Bot-database-{thread_index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _take_next_task(
+        self, *, interactive_only: bool
+    ) -> tuple[DatabaseTaskPriority, _DatabaseTask]:
+        """Wait for, then remove the next task that the calling thread is allowed to run."""
+        priorities: Sequence[DatabaseTaskPriority] = (
+            (DatabaseTaskPriority.INTERACTIVE,)
+            if interactive_only
+            else tuple(DatabaseTaskPriority)
+        )
+
+        with self._condition:
+            while True:
+                priority: DatabaseTaskPriority
+                for priority in priorities:
+                    if self._queues[priority]:
+                        self._busy_thread_count += 1
+                        return priority, self._queues[priority].popleft()
+
+                self._condition.wait()
+
+    def _run_worker(self, *, interactive_only: bool) -> None:
+        while True:
+            priority: DatabaseTaskPriority
+            task: _DatabaseTask
+            priority, task = self._take_next_task(interactive_only=interactive_only)
+
+            start_time: float = time.perf_counter()
+
+            set_future_outcome: Callable[[], None] | None = None
+            if not task.future.cancelled():
+                try:
+                    result: object = task.call()
+                except BaseException as error:  # noqa: BLE001
+                    set_future_outcome = functools.partial(
+                        self._set_future_exception, task, error
+                    )
+                else:
+                    set_future_outcome = functools.partial(
+                        self._set_future_result, task, result
+                    )
+                finally:
+                    # NOTE: Connections are kept open between tasks, unless they have errored or outlived their maximum age
+                    close_old_connections()
+
+            end_time: float = time.perf_counter()
+
+            with self._condition:
+                self._busy_thread_count -= 1
+                self._completed_task_counts[priority] += 1
+                self._wait_durations[priority].append((start_time - task.queued_time) * 1000)
+                self._run_durations[priority].append((end_time - start_time) * 1000)
+
+            # NOTE: The metrics are recorded before the result is returned, so that they already include every task that a caller has awaited
+            if set_future_outcome is not None:
+                task.loop.call_soon_threadsafe(set_future_outcome)
+
+    @staticmethod
+    def _set_future_result(task: _DatabaseTask, result: object) -> None:
+        if not task.future.done():
+            task.future.set_result(result)
+
+    @staticmethod
+    def _set_future_exception(task: _DatabaseTask, error: BaseException) -> None:
+        if not task.future.done():
+            task.future.set_exception(error)
+
+    async def run[**P, T](
+        self, func: "Callable[P, T]", /, *args: "P.args", **kwargs: "P.kwargs"
+    ) -> T:
+        """
+        Run the given synchronous database call on one of the database threads.
+
+        The call is queued in the lane of the current `database_task_priority`,
+        and is run within a copy of the current context.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[object] = loop.create_future()
+
+        with self._condition:
+            if not self._threads:
+                self._start_threads()
+
+            self._queues[database_task_priority.get()].append(
+                _DatabaseTask(
+                    functools.partial(contextvars.copy_context().run, func, *args, **kwargs),
+                    future,
+                    loop,
+                )
+            )
+            self._condition.notify_all()
+
+        return await future  # type: ignore[return-value]
+
+    def get_metrics(self) -> DatabaseExecutorMetrics:
+        """Return the current queue depth & recent latencies of each lane."""
+        with self._condition:
+            return DatabaseExecutorMetrics(
+                queue_depths={
+                    priority: len(queue) for priority, queue in self._queues.items()
+                },
+                busy_thread_count=self._busy_thread_count,
+                completed_task_counts=dict(self._completed_task_counts),
+                median_wait_durations={
+                    priority: statistics.median(wait_durations) if wait_durations else 0.0
+                    for priority, wait_durations in self._wait_durations.items()
+                },
+                median_run_durations={
+                    priority: statistics.median(run_durations) if run_durations else 0.0
+                    for priority, run_durations in self._run_durations.items()
+                },
+            )
+
+
+database_executor: "Final[DatabaseExecutor]" = DatabaseExecutor()
+
+
+def background_database_priority[**P, T](
+    func: "Callable[P, Awaitable[T]]",
+) -> "Callable[P, Awaitable[T]]":
+    """Run every database call made by the decorated coroutine in the background lane."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: "P.args", **kwargs: "P.kwargs") -> T:
+        token: contextvars.Token[DatabaseTaskPriority] = database_task_priority.set(
+            DatabaseTaskPriority.BACKGROUND
+        )
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            database_task_priority.reset(token)
+
+    return wrapper
@@ -0,0 +1,264 @@
+"""Event-loop native lookups of the marker models that record a single fact per member."""
+
+import contextlib
+import itertools
+import logging
+import sqlite3
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from db.core.models import (
+    DiscordMember,
+    IntroductionReminderOptOutMember,
+    SentGetRolesReminderMember,
+    SentOneOffIntroductionReminderMember,
+)
+from db.executor import database_executor
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+    from collections.abc import Set as AbstractSet
+    from logging import Logger
+    from typing import Final
+
+    from db.core.models.utils import AsyncBaseModel
+
+__all__: "Sequence[str]" = (
+    "DiscordMemberMarkBuffer",
+    "DiscordMemberMarkerStore",
+    "introduction_reminder_opt_out_markers",
+    "sent_get_roles_reminder_markers",
+    "sent_one_off_introduction_reminder_markers",
+)
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+
+class DiscordMemberMarkerStore:
+    """
+    Store of which Discord members have been marked by a single marker model.
+
+    Marker models only hold a one-to-one relation to a `DiscordMember`,
+    so checking a marker is a single indexed key lookup.
+    When the database uses WAL journal mode, readers are never blocked by a writer,
+    so these lookups are run directly from the event loop
+    on a dedicated read-only SQLite connection, with prepared (cached) statements,
+    instead of being sent to one of the database threads.
+    Writes are always batched & made through the Django model on a database thread,
+    and any read that cannot be made directly falls back to the Django model too.
+
+    The table & column names are taken from the Django models,
+    so the Django models remain the only definition of the database schema.
+    """
+
+    LOOKUP_BATCH_SIZE: "Final[int]" = 500
+    MARK_BATCH_SIZE: "Final[int]" = 50
+
+    # NOTE: Direct reads give up quickly instead of waiting, so the event loop is never held up by a locked database. Any read that gives up is retried on a database thread.
+    DIRECT_READ_BUSY_TIMEOUT: "Final[float]" = 0.05
+
+    _direct_read_connection: "sqlite3.Connection | None" = None
+
+    def __init__(self, marker_model: type["AsyncBaseModel"]) -> None:
+        """Initialise a new store of the markers saved by the given marker model."""
+        self.marker_model: type[AsyncBaseModel] = marker_model
+
+        quote_name: Callable[[str], str] = connection.ops.quote_name
+        discord_member_id_column: str = quote_name(
+            DiscordMember._meta.get_field("discord_id").column
+        )
+
+        # NOTE: Only table & column names from the Django models are interpolated, every looked-up value is a bound parameter
+        self._select_marked_statement_prefix: str = (
+            f"SELECT discord_member.{discord_member_id_column} "  # noqa: S608
+            f"FROM {quote_name(marker_model._meta.db_table)} AS marker "
+            f"INNER JOIN {quote_name(DiscordMember._meta.db_table)} AS discord_member "
+            f"ON marker.{quote_name(marker_model._meta.get_field('discord_member').column)} "
+            f"= discord_member.{quote_name(DiscordMember._meta.pk.column)} "
+            f"WHERE discord_member.{discord_member_id_column} IN "
+        )
+
+    @staticmethod
+    def is_direct_read_enabled() -> bool:
+        """Return whether marker lookups can be made directly from the event loop."""
+        return connection.vendor == "sqlite" and settings.IS_DATABASE_PROFILE_TUNED
+
+    @classmethod
+    def _get_direct_read_connection(cls) -> sqlite3.Connection:
+        if cls._direct_read_connection is None:
+            cls._direct_read_connection = sqlite3.connect(
+                f"file:{connection.settings_dict['NAME']}?mode=ro",
+                timeout=cls.DIRECT_READ_BUSY_TIMEOUT,
+                uri=True,
+                isolation_level=None,
+            )
+            cls._direct_read_connection.execute("PRAGMA query_only=ON")
+
+        return cls._direct_read_connection
+
+    @classmethod
+    def close_direct_read_connection(cls) -> None:
+        """Close the read-only SQLite connection used for direct lookups, if it is open."""
+        if cls._direct_read_connection is None:
+            return
+
+        cls._direct_read_connection.close()
+        cls._direct_read_connection = None
+
+    def _get_select_marked_statement(self, lookup_count: int) -> str:
+        return f"{self._select_marked_statement_prefix}({', '.join('?' * lookup_count)})"
+
+    def _get_marked_discord_ids_directly(
+        self, discord_ids: "Sequence[str]"
+    ) -> "AbstractSet[str]":
+        direct_read_connection: sqlite3.Connection = self._get_direct_read_connection()
+
+        marked_discord_ids: set[str] = set()
+
+        discord_ids_batch: Sequence[str]
+        for discord_ids_batch in itertools.batched(
+            discord_ids, self.LOOKUP_BATCH_SIZE, strict=False
+        ):
+            marked_discord_ids.update(
+                discord_id
+                for (discord_id,) in direct_read_connection.execute(
+                    self._get_select_marked_statement(len(discord_ids_batch)),
+                    discord_ids_batch,
+                )
+            )
+
+        return marked_discord_ids
+
+    def get_marked_discord_ids(self, discord_ids: "Iterable[str | int]") -> "AbstractSet[str]":
+        """Return which of the given Discord members are marked, using the Django model."""
+        return set(
+            self.marker_model._default_manager.filter(
+                discord_member__discord_id__in=[str(discord_id) for discord_id in discord_ids]
+            ).values_list("discord_member__discord_id", flat=True)
+        )
+
+    async def aget_marked_discord_ids(
+        self, discord_ids: "Iterable[str | int]"
+    ) -> "AbstractSet[str]":
+        """Return which of the given Discord members are marked, in batched lookups."""
+        lookup_discord_ids: Sequence[str] = list(
+            {str(discord_id) for discord_id in discord_ids}
+        )
+        if not lookup_discord_ids:
+            return set()
+
+        if self.is_direct_read_enabled():
+            try:
+                return self._get_marked_discord_ids_directly(lookup_discord_ids)
+            except sqlite3.Error as direct_read_error:
+                logger.debug(
+                    "Direct lookup of %s failed (%s), so the Django model was used instead",
+                    self.marker_model._meta.verbose_name_plural,
+                    direct_read_error,
+                )
+
+        return await database_executor.run(self.get_marked_discord_ids, lookup_discord_ids)
+
+    async def acontains(self, discord_id: str | int) -> bool:
+        """Return whether the given Discord member is marked."""
+        return bool(await self.aget_marked_discord_ids((discord_id,)))
+
+    def mark(self, discord_ids: "Iterable[str | int]") -> None:
+        """Mark every given Discord member, within a single transaction."""
+        with transaction.atomic():
+            self.marker_model.bulk_upsert(
+                [
+                    {"discord_member_id": discord_member_primary_key}
+                    for discord_member_primary_key in (
+                        DiscordMember.get_or_create_primary_keys(discord_ids).values()
+                    )
+                ],
+                unique_fields=("discord_member",),
+            )
+
+    async def amark(self, discord_ids: "Iterable[str | int]") -> None:
+        """Asynchronously mark every given Discord member, within a single transaction."""
+        marked_discord_ids: Sequence[str | int] = list(discord_ids)
+        if marked_discord_ids:
+            await database_executor.run(self.mark, marked_discord_ids)
+
+    @contextlib.asynccontextmanager
+    async def abuffer_marks(
+        self, batch_size: int = MARK_BATCH_SIZE
+    ) -> "AsyncIterator[DiscordMemberMarkBuffer]":
+        """
+        Provide a buffer of Discord members to mark, that is written in bounded batches.
+
+        Any Discord members still buffered are marked on exit, even if an error was raised.
+        If marking them then also fails, that failure is only logged,
+        so the original error is the one that is raised.
+        """
+        mark_buffer: DiscordMemberMarkBuffer = DiscordMemberMarkBuffer(self, batch_size)
+
+        try:
+            yield mark_buffer
+        except BaseException:
+            try:
+                await mark_buffer.aflush()
+            except Exception:
+                logger.exception(
+                    "Failed to record %s buffered %s",
+                    len(mark_buffer),
+                    self.marker_model._meta.verbose_name_plural,
+                )
+            raise
+
+        await mark_buffer.aflush()
+
+    def unmark(self, discord_ids: "Iterable[str | int]") -> None:
+        """Remove the marker of every given Discord member, if they are marked."""
+        self.marker_model._default_manager.filter(
+            discord_member__discord_id__in=[str(discord_id) for discord_id in discord_ids]
+        ).delete()
+
+    async def aunmark(self, discord_ids: "Iterable[str | int]") -> None:
+        """Asynchronously remove the marker of every given Discord member."""
+        unmarked_discord_ids: Sequence[str | int] = list(discord_ids)
+        if unmarked_discord_ids:
+            await database_executor.run(self.unmark, unmarked_discord_ids)
+
+
+class DiscordMemberMarkBuffer:
+    """Buffer of Discord members to mark, that is written every time a batch fills up."""
+
+    def __init__(self, marker_store: DiscordMemberMarkerStore, batch_size: int) -> None:
+        """Initialise a new empty buffer, of the markers to save in the given store."""
+        self.marker_store: DiscordMemberMarkerStore = marker_store
+        self.batch_size: int = batch_size
+
+        self._buffered_discord_ids: list[str | int] = []
+
+    def __len__(self) -> int:
+        """Return the number of Discord members buffered to be marked."""
+        return len(self._buffered_discord_ids)
+
+    async def aadd(self, discord_id: str | int) -> None:
+        """Buffer the given Discord member to be marked, marking the batch if it is full."""
+        self._buffered_discord_ids.append(discord_id)
+
+        if len(self._buffered_discord_ids) >= self.batch_size:
+            await self.aflush()
+
+    async def aflush(self) -> None:
+        """Mark every buffered Discord member, within a single transaction."""
+        await self.marker_store.amark(self._buffered_discord_ids)
+        self._buffered_discord_ids.clear()
+
+
+introduction_reminder_opt_out_markers: "Final[DiscordMemberMarkerStore]" = (
+    DiscordMemberMarkerStore(IntroductionReminderOptOutMember)
+)
+sent_get_roles_reminder_markers: "Final[DiscordMemberMarkerStore]" = DiscordMemberMarkerStore(
+    SentGetRolesReminderMember
+)
+sent_one_off_introduction_reminder_markers: "Final[DiscordMemberMarkerStore]" = (
+    DiscordMemberMarkerStore(SentOneOffIntroductionReminderMember)
+)
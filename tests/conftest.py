@@ -0,0 +1,39 @@
+"""Shared fixtures for the TeX-Bot-Py-V2 test suite."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+
+from db.core.models import GroupMadeMember
+from db.core.models.utils import discord_member_primary_keys
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+__all__: "Sequence[str]" = ()
+
+
+@pytest.fixture(scope="session")
+def _migrated_database(tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Point the database settings at a new temporary database, then migrate it."""
+    database_path: Path = tmp_path_factory.mktemp("database") / "core.db"
+    settings.DATABASES["default"]["NAME"] = database_path
+    connection.settings_dict["NAME"] = database_path
+
+    call_command("migrate", verbosity=0)
+
+
+@pytest.fixture()
+def database(_migrated_database: None) -> "Iterator[None]":
+    """Provide an empty migrated database, that is emptied again after each test."""
+    yield
+
+    call_command("flush", interactive=False, verbosity=0)
+
+    # NOTE: Flushing the database does not send any deletion signals, so the in-memory caches of stored objects must be cleared separately
+    discord_member_primary_keys.clear()
+    GroupMadeMember.clear_used_hashed_group_member_ids()
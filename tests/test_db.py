@@ -0,0 +1,764 @@
+"""Test suite for db package."""
+
+import asyncio
+import datetime
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import NotSupportedError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from db.core.models import (
+    AssignedCommitteeAction,
+    DiscordMember,
+    DiscordMemberMessageActivity,
+    GroupMadeMember,
+    MessageActivityIndexedChannel,
+    SentGetRolesReminderMember,
+)
+from db.core.models.utils import DiscordMemberPrimaryKeyMap, discord_member_primary_keys
+from db.executor import (
+    DatabaseExecutor,
+    DatabaseTaskPriority,
+    background_database_priority,
+    database_executor,
+)
+from db.marker_store import sent_get_roles_reminder_markers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from typing import Final
+
+    from db.core.models.utils import BulkWriteResult
+    from db.executor import DatabaseExecutorMetrics
+
+__all__: "Sequence[str]" = ()
+
+
+CHANNEL_ID: "Final[int]" = 100_000_000_000_000_000
+FIRST_DISCORD_MEMBER_ID: "Final[int]" = 200_000_000_000_000_000
+DATE: "Final[datetime.date]" = datetime.date(2024, 1, 1)
+INDEXED_UNTIL: "Final[datetime.datetime]" = datetime.datetime(2024, 1, 2, tzinfo=datetime.UTC)
+
+
+@pytest.mark.usefixtures("database")
+class TestRecordMessageCounts:
+    """Test case to unit-test storing buffered message counts."""
+
+    @staticmethod
+    def _get_stored_message_counts() -> "Mapping[tuple[str, str, datetime.date], int]":
+        return {
+            (discord_member_id, channel_id, date): message_count
+            for discord_member_id, channel_id, date, message_count in (
+                DiscordMemberMessageActivity.objects.values_list(
+                    "discord_member__discord_id", "_channel_id", "date", "message_count"
+                )
+            )
+        }
+
+    def test_new_message_counts_are_created(self) -> None:
+        """Test that message counts with no stored activity are stored as given."""
+        DiscordMemberMessageActivity.record_message_counts(
+            {(FIRST_DISCORD_MEMBER_ID, CHANNEL_ID, DATE): 3}, {CHANNEL_ID: INDEXED_UNTIL}
+        )
+
+        assert self._get_stored_message_counts() == {
+            (str(FIRST_DISCORD_MEMBER_ID), str(CHANNEL_ID), DATE): 3
+        }
+        assert MessageActivityIndexedChannel.objects.get().indexed_until == INDEXED_UNTIL
+
+    def test_existing_message_counts_are_incremented(self) -> None:
+        """Test that message counts are added to the matching stored activity only."""
+        OTHER_DATE: Final[datetime.date] = DATE + datetime.timedelta(days=1)
+
+        DiscordMemberMessageActivity.record_message_counts(
+            {
+                (FIRST_DISCORD_MEMBER_ID, CHANNEL_ID, DATE): 3,
+                (FIRST_DISCORD_MEMBER_ID + 1, CHANNEL_ID, OTHER_DATE): 5,
+            },
+            {},
+        )
+        DiscordMemberMessageActivity.record_message_counts(
+            {
+                (FIRST_DISCORD_MEMBER_ID, CHANNEL_ID, DATE): 2,
+                (FIRST_DISCORD_MEMBER_ID, CHANNEL_ID, OTHER_DATE): 1,
+            },
+            {},
+        )
+
+        assert self._get_stored_message_counts() == {
+            (str(FIRST_DISCORD_MEMBER_ID), str(CHANNEL_ID), DATE): 5,
+            (str(FIRST_DISCORD_MEMBER_ID), str(CHANNEL_ID), OTHER_DATE): 1,
+            (str(FIRST_DISCORD_MEMBER_ID + 1), str(CHANNEL_ID), OTHER_DATE): 5,
+        }
+
+    @staticmethod
+    def test_query_count_does_not_grow_with_message_counts() -> None:
+        """Test that storing more message counts does not make more queries."""
+        query_counts: list[int] = []
+
+        member_count: int
+        for member_count in (5, 50):
+            message_counts: Mapping[tuple[int, int, datetime.date], int] = {
+                (FIRST_DISCORD_MEMBER_ID + index, CHANNEL_ID, DATE): 1
+                for index in range(member_count)
+            }
+            DiscordMemberMessageActivity.record_message_counts(message_counts, {})
+
+            with CaptureQueriesContext(connection) as captured_queries:
+                DiscordMemberMessageActivity.record_message_counts(message_counts, {})
+
+            query_counts.append(len(captured_queries))
+
+        assert query_counts[0] == query_counts[1]
+
+
+class TestDatabaseExecutor:
+    """Test case to unit-test running database calls in prioritised lanes."""
+
+    TIMEOUT: "Final[float]" = 5
+
+    @classmethod
+    async def _wait_for_busy_threads(cls, executor: DatabaseExecutor, count: int) -> None:
+        async with asyncio.timeout(cls.TIMEOUT):
+            while executor.get_metrics().busy_thread_count < count:  # noqa: ASYNC110
+                await asyncio.sleep(0.01)
+
+    @classmethod
+    def _create_blocking_call(cls, release_event: threading.Event) -> "Callable[[], bool]":
+        return lambda: release_event.wait(cls.TIMEOUT)
+
+    @staticmethod
+    @background_database_priority
+    async def _run_in_background[T](executor: DatabaseExecutor, func: "Callable[[], T]") -> T:
+        return await executor.run(func)
+
+    def test_interactive_calls_are_run_before_background_calls(self) -> None:
+        """Test that queued interactive calls are taken before earlier background calls."""
+        executor: DatabaseExecutor = DatabaseExecutor(thread_count=2)
+        first_release_event: threading.Event = threading.Event()
+        second_release_event: threading.Event = threading.Event()
+        run_order: list[DatabaseTaskPriority] = []
+
+        async def run_calls() -> None:
+            blocking_tasks: Sequence[asyncio.Task[bool]] = [
+                asyncio.create_task(executor.run(self._create_blocking_call(release_event)))
+                for release_event in (first_release_event, second_release_event)
+            ]
+            await self._wait_for_busy_threads(executor, 2)
+
+            background_task: asyncio.Task[None] = asyncio.create_task(
+                self._run_in_background(
+                    executor, lambda: run_order.append(DatabaseTaskPriority.BACKGROUND)
+                )
+            )
+            interactive_task: asyncio.Task[None] = asyncio.create_task(
+                executor.run(lambda: run_order.append(DatabaseTaskPriority.INTERACTIVE))
+            )
+            await asyncio.sleep(0.01)
+
+            metrics: DatabaseExecutorMetrics = executor.get_metrics()
+            assert metrics.queue_depths == {
+                DatabaseTaskPriority.INTERACTIVE: 1,
+                DatabaseTaskPriority.BACKGROUND: 1,
+            }
+
+            first_release_event.set()
+            await interactive_task
+            second_release_event.set()
+            await asyncio.gather(background_task, *blocking_tasks)
+
+        asyncio.run(run_calls())
+
+        assert run_order == [DatabaseTaskPriority.INTERACTIVE, DatabaseTaskPriority.BACKGROUND]
+
+    def test_interactive_calls_are_not_blocked_by_background_calls(self) -> None:
+        """Test that one thread is kept free for interactive calls, however many are queued."""
+        executor: DatabaseExecutor = DatabaseExecutor(thread_count=2)
+        release_event: threading.Event = threading.Event()
+
+        async def run_calls() -> str:
+            background_tasks: Sequence[asyncio.Task[bool]] = [
+                asyncio.create_task(
+                    self._run_in_background(
+                        executor, self._create_blocking_call(release_event)
+                    )
+                )
+                for _ in range(3)
+            ]
+            await self._wait_for_busy_threads(executor, 1)
+
+            try:
+                async with asyncio.timeout(self.TIMEOUT):
+                    return await executor.run(lambda: threading.current_thread().name)
+            finally:
+                release_event.set()
+                await asyncio.gather(*background_tasks)
+
+        assert asyncio.run(run_calls()) == "TeX-Bot-database-0"
+
+    def test_metrics_count_completed_calls_of_each_lane(self) -> None:
+        """Test that the completed calls & their latencies are recorded in their own lane."""
+        executor: DatabaseExecutor = DatabaseExecutor(thread_count=2)
+
+        async def run_calls() -> None:
+            await executor.run(int)
+            await executor.run(int)
+            await self._run_in_background(executor, int)
+
+        asyncio.run(run_calls())
+
+        metrics: DatabaseExecutorMetrics = executor.get_metrics()
+        assert metrics.completed_task_counts == {
+            DatabaseTaskPriority.INTERACTIVE: 2,
+            DatabaseTaskPriority.BACKGROUND: 1,
+        }
+        assert metrics.busy_thread_count == 0
+        assert all(duration >= 0 for duration in metrics.median_run_durations.values())
+
+    @staticmethod
+    def test_at_least_two_threads_are_required() -> None:
+        """Test that an executor cannot be created without a spare interactive thread."""
+        with pytest.raises(ValueError, match="thread_count"):
+            DatabaseExecutor(thread_count=1)
+
+    @staticmethod
+    @pytest.mark.usefixtures("database")
+    def test_asynchronous_queries_are_run_by_the_database_executor() -> None:
+        """Test that the asynchronous methods of every model's manager use the executor."""
+
+        async def run_queries() -> int:
+            await DiscordMember.objects.acreate(discord_id=FIRST_DISCORD_MEMBER_ID)
+            return await DiscordMember.objects.acount()
+
+        completed_task_count: int = sum(
+            database_executor.get_metrics().completed_task_counts.values()
+        )
+
+        assert asyncio.run(run_queries()) == 1
+        assert (
+            sum(database_executor.get_metrics().completed_task_counts.values())
+            == completed_task_count + 2
+        )
+
+
+@pytest.mark.usefixtures("database")
+class TestSaveValidation:
+    """Test case to unit-test that rows rejected by the database raise validation errors."""
+
+    @staticmethod
+    def test_duplicate_unique_field_raises_validation_error() -> None:
+        """Test that a duplicate unique field is reported against that field."""
+        DiscordMember.objects.create(discord_id=FIRST_DISCORD_MEMBER_ID)
+
+        with pytest.raises(ValidationError) as validation_error_info:
+            DiscordMember.objects.create(discord_id=FIRST_DISCORD_MEMBER_ID)
+
+        assert validation_error_info.value.message_dict == {
+            "discord_id": ["Discord member with this Discord Member ID already exists."]
+        }
+        assert DiscordMember.objects.count() == 1
+
+    @staticmethod
+    def test_duplicate_unique_constraint_raises_validation_error() -> None:
+        """Test that violating a unique constraint is reported as a non-field error."""
+        discord_member: DiscordMember = DiscordMember.objects.create(
+            discord_id=FIRST_DISCORD_MEMBER_ID
+        )
+        AssignedCommitteeAction.objects.create(
+            discord_member=discord_member, description="Book a room"
+        )
+
+        with pytest.raises(ValidationError) as validation_error_info:
+            AssignedCommitteeAction.objects.create(
+                discord_member=discord_member, description="Book a room"
+            )
+
+        assert validation_error_info.value.message_dict == {
+            "__all__": [
+                (
+                    "Assigned Committee Action with this Discord Member and Description "
+                    "already exists."
+                )
+            ]
+        }
+        assert AssignedCommitteeAction.objects.count() == 1
+
+    @staticmethod
+    def test_missing_foreign_key_raises_validation_error() -> None:
+        """Test that relating to an object that does not exist raises a validation error."""
+        MISSING_PRIMARY_KEY: Final[int] = 999
+
+        with pytest.raises(ValidationError) as validation_error_info:
+            AssignedCommitteeAction.objects.create(
+                discord_member_id=MISSING_PRIMARY_KEY, description="Book a room"
+            )
+
+        assert set(validation_error_info.value.message_dict) == {"discord_member"}
+        assert not AssignedCommitteeAction.objects.exists()
+
+    @staticmethod
+    def test_validation_before_saving_is_kept_when_not_deferred(
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that models not deferring uniqueness are fully validated before saving."""
+        monkeypatch.setattr(DiscordMember, "DEFER_UNIQUENESS_VALIDATION_TO_DATABASE", False)
+        DiscordMember.objects.create(discord_id=FIRST_DISCORD_MEMBER_ID)
+
+        with (
+            CaptureQueriesContext(connection) as captured_queries,
+            pytest.raises(ValidationError) as validation_error_info,
+        ):
+            DiscordMember.objects.create(discord_id=FIRST_DISCORD_MEMBER_ID)
+
+        assert set(validation_error_info.value.message_dict) == {"discord_id"}
+        assert not any(
+            captured_query["sql"].startswith("INSERT") for captured_query in captured_queries
+        )
+
+
+@pytest.mark.usefixtures("database")
+class TestDeleteAllInChunks:
+    """Test case to unit-test deleting every stored object in chunks."""
+
+    @staticmethod
+    def test_every_object_is_deleted_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that every chunk is counted, and that deletion signals are still sent."""
+        monkeypatch.setattr(DiscordMember, "DELETE_ALL_CHUNK_SIZE", 3)
+
+        discord_member_ids: Sequence[int] = [
+            FIRST_DISCORD_MEMBER_ID + index for index in range(7)
+        ]
+        primary_keys: Mapping[str, int] = DiscordMember.get_or_create_primary_keys(
+            discord_member_ids
+        )
+        AssignedCommitteeAction.objects.create(
+            discord_member_id=primary_keys[str(discord_member_ids[0])],
+            description="Book a room",
+        )
+
+        async def delete_all_discord_members() -> "Sequence[int]":
+            return [
+                deleted_count async for deleted_count in DiscordMember.adelete_all_in_chunks()
+            ]
+
+        assert asyncio.run(delete_all_discord_members()) == [3, 3, 1]
+        assert not DiscordMember.objects.exists()
+        assert not AssignedCommitteeAction.objects.exists()
+        assert len(discord_member_primary_keys) == 0
+
+    @staticmethod
+    def test_given_chunk_size_is_used() -> None:
+        """Test that the given chunk size overrides the model's default chunk size."""
+        DiscordMember.get_or_create_primary_keys(
+            FIRST_DISCORD_MEMBER_ID + index for index in range(5)
+        )
+
+        assert DiscordMember.delete_first_chunk(chunk_size=2) == 2
+        assert DiscordMember.objects.count() == 3
+        assert len(discord_member_primary_keys) == 3
+
+
+@pytest.mark.usefixtures("database")
+class TestUsedHashedGroupMemberIDs:
+    """Test case to unit-test the in-memory index of used hashed group member IDs."""
+
+    FIRST_GROUP_MEMBER_ID: "Final[int]" = 1_000_000
+
+    @classmethod
+    def _is_used(cls, group_member_id: int) -> bool:
+        return asyncio.run(
+            GroupMadeMember.ais_hashed_group_member_id_used(
+                GroupMadeMember.hash_group_member_id(group_member_id)
+            )
+        )
+
+    def test_committed_group_made_member_is_only_added_after_commit(self) -> None:
+        """Test that a loaded index only includes newly made members once committed."""
+        assert asyncio.run(GroupMadeMember.aget_claimed_count()) == 0
+
+        with transaction.atomic():
+            GroupMadeMember.objects.create(group_member_id=self.FIRST_GROUP_MEMBER_ID)
+
+            assert not self._is_used(self.FIRST_GROUP_MEMBER_ID)
+
+        assert self._is_used(self.FIRST_GROUP_MEMBER_ID)
+
+    def test_rolled_back_group_made_member_is_not_added(self) -> None:
+        """Test that a made member whose transaction was rolled back is never included."""
+        ROLLBACK_MESSAGE: Final[str] = "Roll back the made member."
+
+        assert asyncio.run(GroupMadeMember.aget_claimed_count()) == 0
+
+        @transaction.atomic
+        def create_then_roll_back() -> None:
+            GroupMadeMember.objects.create(group_member_id=self.FIRST_GROUP_MEMBER_ID)
+            raise RuntimeError(ROLLBACK_MESSAGE)
+
+        with pytest.raises(RuntimeError, match=ROLLBACK_MESSAGE):
+            create_then_roll_back()
+
+        assert not self._is_used(self.FIRST_GROUP_MEMBER_ID)
+        assert asyncio.run(GroupMadeMember.aget_claimed_count()) == 0
+
+    def test_clearing_the_index_forces_a_reload(self) -> None:
+        """Test that rows stored without signals are only included after clearing the index."""
+        assert not self._is_used(self.FIRST_GROUP_MEMBER_ID)
+
+        # NOTE: The manager's bulk_create() does not send post_save signals, so the loaded index is not updated
+        GroupMadeMember.objects.bulk_create(
+            [GroupMadeMember(group_member_id=self.FIRST_GROUP_MEMBER_ID)]
+        )
+
+        assert not self._is_used(self.FIRST_GROUP_MEMBER_ID)
+
+        GroupMadeMember.clear_used_hashed_group_member_ids()
+
+        assert self._is_used(self.FIRST_GROUP_MEMBER_ID)
+
+    def test_claimed_count_matches_stored_group_made_members(self) -> None:
+        """Test that the claimed count is the number of stored made members."""
+        GroupMadeMember.objects.create(group_member_id=self.FIRST_GROUP_MEMBER_ID)
+
+        assert asyncio.run(GroupMadeMember.aget_claimed_count()) == 1
+
+        index: int
+        for index in range(1, 4):
+            GroupMadeMember.objects.create(group_member_id=self.FIRST_GROUP_MEMBER_ID + index)
+
+        assert asyncio.run(GroupMadeMember.aget_claimed_count()) == (
+            GroupMadeMember.objects.count()
+        )
+        assert GroupMadeMember.objects.count() == 4
+
+
+@pytest.mark.usefixtures("database")
+class TestDatabaseExecutorQuerySet:
+    """Test case to unit-test running asynchronous QuerySet methods on the executor."""
+
+    @staticmethod
+    def test_aiterator_fetches_one_chunk_per_call() -> None:
+        """Test that every object is iterated over in order, fetching one chunk per call."""
+        DiscordMember.objects.bulk_create(
+            DiscordMember(discord_id=str(FIRST_DISCORD_MEMBER_ID + index))
+            for index in range(5)
+        )
+
+        async def iterate_discord_members() -> "Sequence[str]":
+            return [
+                discord_member.discord_id
+                async for discord_member in DiscordMember.objects.aiterator(chunk_size=2)
+            ]
+
+        completed_task_count: int = sum(
+            database_executor.get_metrics().completed_task_counts.values()
+        )
+
+        assert asyncio.run(iterate_discord_members()) == [
+            str(FIRST_DISCORD_MEMBER_ID + index) for index in range(5)
+        ]
+        assert (
+            sum(database_executor.get_metrics().completed_task_counts.values())
+            == completed_task_count + 3
+        )
+
+    @staticmethod
+    def test_aiterator_rejects_querysets_it_cannot_page() -> None:
+        """Test that querysets that cannot be paged by primary key are not iterated over."""
+
+        async def iterate_discord_member_ids() -> "Sequence[object]":
+            return [
+                discord_id
+                async for discord_id in DiscordMember.objects.values_list(
+                    "discord_id", flat=True
+                ).aiterator()
+            ]
+
+        with pytest.raises(NotSupportedError):
+            asyncio.run(iterate_discord_member_ids())
+
+
+class TestDiscordMemberPrimaryKeyMap:
+    """Test case to unit-test the bounded cache of Discord member primary keys."""
+
+    @staticmethod
+    def test_least_recently_used_primary_key_is_evicted() -> None:
+        """Test that adding to a full map evicts the primary key that was used longest ago."""
+        primary_key_map: DiscordMemberPrimaryKeyMap = DiscordMemberPrimaryKeyMap(max_size=2)
+        primary_key_map.add("1", 1)
+        primary_key_map.add("2", 2)
+
+        assert primary_key_map.get("1") == 1
+
+        primary_key_map.add("3", 3)
+
+        assert len(primary_key_map) == 2
+        assert primary_key_map.get("2") is None
+        assert primary_key_map.get("1") == 1
+        assert primary_key_map.get("3") == 3
+
+    @staticmethod
+    def test_removed_primary_key_is_not_returned() -> None:
+        """Test that removing a primary key, stored or not, leaves the others in the map."""
+        primary_key_map: DiscordMemberPrimaryKeyMap = DiscordMemberPrimaryKeyMap()
+        primary_key_map.add("1", 1)
+        primary_key_map.add("2", 2)
+
+        primary_key_map.remove("1")
+        primary_key_map.remove("3")
+
+        assert primary_key_map.get("1") is None
+        assert primary_key_map.get("2") == 2
+
+
+@pytest.mark.usefixtures("database")
+class TestGetOrCreateCachedDiscordMember:
+    """Test case to unit-test caching the primary keys of stored Discord members."""
+
+    @staticmethod
+    def test_committed_primary_key_is_cached() -> None:
+        """Test that a Discord member's primary key is cached once it has been committed."""
+        discord_member: DiscordMember = DiscordMember.get_or_create_cached(
+            FIRST_DISCORD_MEMBER_ID
+        )
+
+        assert discord_member_primary_keys.get(str(FIRST_DISCORD_MEMBER_ID)) == (
+            discord_member.pk
+        )
+
+        with CaptureQueriesContext(connection) as captured_queries:
+            cached_discord_member: DiscordMember = DiscordMember.get_or_create_cached(
+                FIRST_DISCORD_MEMBER_ID
+            )
+
+        assert len(captured_queries) == 0
+        assert cached_discord_member.pk == discord_member.pk
+        assert cached_discord_member.discord_id == str(FIRST_DISCORD_MEMBER_ID)
+
+    @staticmethod
+    def test_primary_key_is_only_cached_after_commit() -> None:
+        """Test that primary keys are not cached until their transaction is committed."""
+        with transaction.atomic():
+            DiscordMember.get_or_create_cached(FIRST_DISCORD_MEMBER_ID)
+            DiscordMember.get_or_create_primary_keys([FIRST_DISCORD_MEMBER_ID + 1])
+
+            assert len(discord_member_primary_keys) == 0
+
+        assert discord_member_primary_keys.get(str(FIRST_DISCORD_MEMBER_ID)) is not None
+        assert discord_member_primary_keys.get(str(FIRST_DISCORD_MEMBER_ID + 1)) is not None
+
+    @staticmethod
+    def test_rolled_back_primary_key_is_not_cached() -> None:
+        """Test that the primary key of a Discord member that was rolled back is not cached."""
+        ROLLBACK_MESSAGE: Final[str] = "Roll back the created Discord members."
+
+        @transaction.atomic
+        def create_then_roll_back() -> None:
+            DiscordMember.get_or_create_cached(FIRST_DISCORD_MEMBER_ID)
+            DiscordMember.get_or_create_primary_keys([FIRST_DISCORD_MEMBER_ID + 1])
+            raise RuntimeError(ROLLBACK_MESSAGE)
+
+        with pytest.raises(RuntimeError, match=ROLLBACK_MESSAGE):
+            create_then_roll_back()
+
+        assert len(discord_member_primary_keys) == 0
+        assert not DiscordMember.objects.exists()
+
+    @staticmethod
+    def test_deleted_primary_key_is_removed() -> None:
+        """Test that deleting a Discord member removes their primary key from the cache."""
+        DiscordMember.get_or_create_cached(FIRST_DISCORD_MEMBER_ID)
+        DiscordMember.get_or_create_cached(FIRST_DISCORD_MEMBER_ID + 1)
+
+        DiscordMember.objects.filter(discord_id=FIRST_DISCORD_MEMBER_ID).delete()
+
+        assert discord_member_primary_keys.get(str(FIRST_DISCORD_MEMBER_ID)) is None
+        assert discord_member_primary_keys.get(str(FIRST_DISCORD_MEMBER_ID + 1)) is not None
+
+        recreated_discord_member: DiscordMember = DiscordMember.get_or_create_cached(
+            FIRST_DISCORD_MEMBER_ID
+        )
+
+        assert DiscordMember.objects.filter(pk=recreated_discord_member.pk).exists()
+
+
+@pytest.mark.usefixtures("database")
+class TestBulkWrites:
+    """Test case to unit-test validating & writing many objects in batches."""
+
+    @staticmethod
+    def _get_stored_indexed_until() -> "Mapping[int, datetime.datetime]":
+        return {
+            indexed_channel.channel_id: indexed_channel.indexed_until
+            for indexed_channel in MessageActivityIndexedChannel.objects.all()
+        }
+
+    def test_invalid_and_rejected_rows_are_reported_as_conflicts(self) -> None:
+        """Test that only the rows that are invalid or rejected by the database are skipped."""
+        MessageActivityIndexedChannel.objects.create(
+            channel_id=CHANNEL_ID, indexed_until=INDEXED_UNTIL
+        )
+
+        bulk_write_result: BulkWriteResult[MessageActivityIndexedChannel] = (
+            MessageActivityIndexedChannel.bulk_create(
+                [
+                    {"channel_id": CHANNEL_ID + 1, "indexed_until": INDEXED_UNTIL},
+                    {"channel_id": "not a channel ID", "indexed_until": INDEXED_UNTIL},
+                    {"channel_id": CHANNEL_ID, "indexed_until": INDEXED_UNTIL},
+                ]
+            )
+        )
+
+        assert [instance.channel_id for instance in bulk_write_result.written] == [
+            CHANNEL_ID + 1
+        ]
+        assert [
+            set(validation_error.message_dict)
+            for _, validation_error in bulk_write_result.conflicts
+        ] == [{"_channel_id"}, {"_channel_id"}]
+        assert bulk_write_result.conflicts[1][0].channel_id == CHANNEL_ID
+        assert self._get_stored_indexed_until().keys() == {CHANNEL_ID, CHANNEL_ID + 1}
+
+    def test_rejected_batch_is_retried_one_row_at_a_time(self) -> None:
+        """Test that the other rows of a rejected batch are still written, in their place."""
+        MessageActivityIndexedChannel.objects.create(
+            channel_id=CHANNEL_ID, indexed_until=INDEXED_UNTIL
+        )
+
+        bulk_write_result: BulkWriteResult[MessageActivityIndexedChannel] = (
+            MessageActivityIndexedChannel.bulk_create(
+                [
+                    {"channel_id": CHANNEL_ID + 1, "indexed_until": INDEXED_UNTIL},
+                    {"channel_id": CHANNEL_ID, "indexed_until": INDEXED_UNTIL},
+                    {"channel_id": CHANNEL_ID + 2, "indexed_until": INDEXED_UNTIL},
+                ],
+                batch_size=2,
+            )
+        )
+
+        assert [instance.channel_id for instance in bulk_write_result.written] == [
+            CHANNEL_ID + 1,
+            CHANNEL_ID + 2,
+        ]
+        assert [instance.channel_id for instance, _ in bulk_write_result.conflicts] == [
+            CHANNEL_ID
+        ]
+        assert self._get_stored_indexed_until().keys() == {
+            CHANNEL_ID,
+            CHANNEL_ID + 1,
+            CHANNEL_ID + 2,
+        }
+
+    def test_upsert_updates_existing_rows_by_proxy_field(self) -> None:
+        """Test that upserted rows clashing on a proxy field update the existing object."""
+        LATER_INDEXED_UNTIL: Final[datetime.datetime] = INDEXED_UNTIL + datetime.timedelta(
+            days=1
+        )
+
+        MessageActivityIndexedChannel.objects.create(
+            channel_id=CHANNEL_ID, indexed_until=INDEXED_UNTIL
+        )
+
+        bulk_write_result: BulkWriteResult[MessageActivityIndexedChannel] = (
+            MessageActivityIndexedChannel.bulk_upsert(
+                [
+                    {"channel_id": CHANNEL_ID, "indexed_until": LATER_INDEXED_UNTIL},
+                    {"channel_id": CHANNEL_ID + 1, "indexed_until": INDEXED_UNTIL},
+                ],
+                unique_fields=("channel_id",),
+                update_fields=("indexed_until",),
+            )
+        )
+
+        assert not bulk_write_result.conflicts
+        assert self._get_stored_indexed_until() == {
+            CHANNEL_ID: LATER_INDEXED_UNTIL,
+            CHANNEL_ID + 1: INDEXED_UNTIL,
+        }
+
+    def test_update_only_saves_valid_given_proxy_fields(self) -> None:
+        """Test that only the given (proxy) fields are saved, unless they are rejected."""
+        LATER_INDEXED_UNTIL: Final[datetime.datetime] = INDEXED_UNTIL + datetime.timedelta(
+            days=1
+        )
+
+        indexed_channels: Sequence[MessageActivityIndexedChannel] = (
+            MessageActivityIndexedChannel.bulk_create(
+                [
+                    {"channel_id": CHANNEL_ID + index, "indexed_until": INDEXED_UNTIL}
+                    for index in range(3)
+                ]
+            ).written
+        )
+
+        indexed_channels[0].channel_id = CHANNEL_ID + 10
+        indexed_channels[0].indexed_until = LATER_INDEXED_UNTIL
+        indexed_channels[1].channel_id = "not a channel ID"  # type: ignore[assignment]
+        indexed_channels[2].channel_id = CHANNEL_ID + 1
+
+        bulk_write_result: BulkWriteResult[MessageActivityIndexedChannel] = (
+            MessageActivityIndexedChannel.bulk_update(indexed_channels, ("channel_id",))
+        )
+
+        assert bulk_write_result.written == [indexed_channels[0]]
+        assert [instance for instance, _ in bulk_write_result.conflicts] == [
+            indexed_channels[1],
+            indexed_channels[2],
+        ]
+        assert self._get_stored_indexed_until() == {
+            CHANNEL_ID + 1: INDEXED_UNTIL,
+            CHANNEL_ID + 2: INDEXED_UNTIL,
+            CHANNEL_ID + 10: INDEXED_UNTIL,
+        }
+
+
+@pytest.mark.usefixtures("database")
+class TestDiscordMemberMarkBuffer:
+    """Test case to unit-test marking Discord members in bounded batches."""
+
+    @staticmethod
+    def test_full_batches_are_marked_before_exit() -> None:
+        """Test that each full batch is marked as soon as it fills, and the rest on exit."""
+        marked_counts: list[int] = []
+
+        async def mark_discord_members() -> None:
+            async with sent_get_roles_reminder_markers.abuffer_marks(
+                batch_size=2
+            ) as mark_buffer:
+                index: int
+                for index in range(3):
+                    await mark_buffer.aadd(FIRST_DISCORD_MEMBER_ID + index)
+                    marked_counts.append(await SentGetRolesReminderMember.objects.acount())
+
+        asyncio.run(mark_discord_members())
+
+        assert marked_counts == [0, 2, 2]
+        assert sent_get_roles_reminder_markers.get_marked_discord_ids(
+            FIRST_DISCORD_MEMBER_ID + index for index in range(3)
+        ) == {str(FIRST_DISCORD_MEMBER_ID + index) for index in range(3)}
+
+    @staticmethod
+    def test_original_error_is_raised_when_final_batch_fails() -> None:
+        """Test that failing to mark the final batch does not hide the error that ended it."""
+        ORIGINAL_ERROR_MESSAGE: Final[str] = "The run failed part-way through."
+
+        async def mark_discord_members() -> None:
+            async with sent_get_roles_reminder_markers.abuffer_marks() as mark_buffer:
+                await mark_buffer.aadd("not a Discord member ID")
+                raise RuntimeError(ORIGINAL_ERROR_MESSAGE)
+
+        with pytest.raises(RuntimeError, match=ORIGINAL_ERROR_MESSAGE):
+            asyncio.run(mark_discord_members())
+
+    @staticmethod
+    def test_final_batch_error_is_raised_after_success() -> None:
+        """Test that failing to mark the final batch is raised when nothing else failed."""
+
+        async def mark_discord_members() -> None:
+            async with sent_get_roles_reminder_markers.abuffer_marks() as mark_buffer:
+                await mark_buffer.aadd("not a Discord member ID")
+
+        with pytest.raises(ValidationError):
+            asyncio.run(mark_discord_members())
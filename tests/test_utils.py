@@ -1,13 +1,25 @@
 """Test suite for utils package."""
 
+import asyncio
+import os
 import random
 import re
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
+import discord
+import pytest
+
 import utils
+from utils.audit_log_buffer import AuditLogEntryBuffer
+from utils.chart_cache import RenderedChartCache
+from utils.member_search_index import MemberSearchIndex
+from utils.query_profiler import QueryProfile, QueryProfiler, get_query_fingerprint
+from utils.timer_wheel import TimerWheel
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from pathlib import Path
     from typing import Final
 
 __all__: "Sequence[str]" = ()
@@ -107,3 +119,395 @@ class TestGenerateInviteURL:
             ),
             invite_url,
         )
+
+
+class TestRenderedChartCache:
+    """Test case to unit-test the cache of rendered chart images."""
+
+    @staticmethod
+    def _generate_key(data: dict[str, int], title: str = "Title") -> str:
+        return RenderedChartCache.generate_key(
+            data, x_label="X", y_label="Y", title=title, extra_text="", style="cyberpunk"
+        )
+
+    def test_key_depends_on_content(self) -> None:
+        """Test that equal chart content gives equal keys, and any difference changes it."""
+        assert self._generate_key({"a": 1, "b": 2}) == self._generate_key({"a": 1, "b": 2})
+        assert self._generate_key({"a": 1, "b": 2}) != self._generate_key({"a": 1, "b": 3})
+        assert self._generate_key({"a": 1}) != self._generate_key({"a": 1}, title="Other")
+
+    def test_key_depends_on_bar_order(self) -> None:
+        """Test that the order of the data items changes the key, as it orders the bars."""
+        assert self._generate_key({"a": 1, "b": 2}) != self._generate_key({"b": 2, "a": 1})
+
+    @staticmethod
+    def test_memory_tier_evicts_least_recently_used() -> None:
+        """Test that the in-memory tier only keeps the most recently used images."""
+        rendered_chart_cache: RenderedChartCache = RenderedChartCache(None, max_disk_size=0)
+
+        async def _fill_cache() -> None:
+            index: int
+            for index in range(RenderedChartCache.MAX_MEMORY_ENTRIES):
+                await rendered_chart_cache.aset(str(index), b"image")
+
+            assert await rendered_chart_cache.aget("0") == b"image"
+
+            await rendered_chart_cache.aset("new", b"image")
+
+            assert await rendered_chart_cache.aget("0") == b"image"
+            assert await rendered_chart_cache.aget("1") is None
+            assert await rendered_chart_cache.aget("new") == b"image"
+
+        asyncio.run(_fill_cache())
+
+    @staticmethod
+    def test_disk_tier_is_read_after_memory_eviction(tmp_path: "Path") -> None:
+        """Test that images evicted from memory are still read from the disk tier."""
+        disk_cache_directory: Path = tmp_path / "charts"
+
+        async def _fill_cache() -> None:
+            await RenderedChartCache(disk_cache_directory, max_disk_size=1024).aset(
+                "key", b"image"
+            )
+
+            assert (
+                await RenderedChartCache(disk_cache_directory, max_disk_size=1024).aget("key")
+                == b"image"
+            )
+
+        asyncio.run(_fill_cache())
+
+    @staticmethod
+    def test_disk_tier_evicts_least_recently_used(tmp_path: "Path") -> None:
+        """Test that the disk tier removes the oldest images once it is over its size."""
+        IMAGE_SIZE: Final[int] = 100
+
+        rendered_chart_cache: RenderedChartCache = RenderedChartCache(
+            tmp_path, max_disk_size=IMAGE_SIZE * 2
+        )
+
+        async def _fill_cache() -> None:
+            index: int
+            key: str
+            for index, key in enumerate(("oldest", "middle")):
+                await rendered_chart_cache.aset(key, b"x" * IMAGE_SIZE)
+                os.utime(tmp_path / f"{key}.png", (index, index))
+
+            await rendered_chart_cache.aset("newest", b"x" * IMAGE_SIZE)
+
+        asyncio.run(_fill_cache())
+
+        assert sorted(cached_image.stem for cached_image in tmp_path.glob("*.png")) == [
+            "middle",
+            "newest",
+        ]
+
+
+class TestAuditLogEntryBuffer:
+    """Test case to unit-test the buffer of audit log entries received from the gateway."""
+
+    TARGET_ID: "Final[int]" = 100_000_000_000_000_000
+
+    @classmethod
+    def _create_audit_log_entry(
+        cls, entry_id: int, action: discord.AuditLogAction
+    ) -> discord.RawAuditLogEntryEvent:
+        return discord.RawAuditLogEntryEvent(
+            {  # type: ignore[typeddict-item]
+                "id": str(entry_id),
+                "guild_id": "1",
+                "user_id": "2",
+                "target_id": str(cls.TARGET_ID),
+                "action_type": action.value,
+            }
+        )
+
+    def test_get_returns_newest_matching_entry(self) -> None:
+        """Test that the newest entry of any of the given actions is returned."""
+        audit_log_entry_buffer: AuditLogEntryBuffer = AuditLogEntryBuffer()
+        audit_log_entry_buffer.add(
+            self._create_audit_log_entry(1, discord.AuditLogAction.kick)
+        )
+        audit_log_entry_buffer.add(self._create_audit_log_entry(2, discord.AuditLogAction.ban))
+
+        newest_audit_log_entry: discord.RawAuditLogEntryEvent | None = (
+            audit_log_entry_buffer.get(
+                self.TARGET_ID, discord.AuditLogAction.kick, discord.AuditLogAction.ban
+            )
+        )
+
+        assert newest_audit_log_entry is not None
+        assert newest_audit_log_entry.id == 2
+        assert audit_log_entry_buffer.get(self.TARGET_ID, discord.AuditLogAction.unban) is None
+
+    def test_oldest_entries_are_evicted(self) -> None:
+        """Test that adding an entry to a full buffer evicts the oldest entry."""
+        audit_log_entry_buffer: AuditLogEntryBuffer = AuditLogEntryBuffer(max_entries=1)
+        audit_log_entry_buffer.add(
+            self._create_audit_log_entry(1, discord.AuditLogAction.kick)
+        )
+        audit_log_entry_buffer.add(self._create_audit_log_entry(2, discord.AuditLogAction.ban))
+
+        assert audit_log_entry_buffer.get(self.TARGET_ID, discord.AuditLogAction.kick) is None
+        assert (
+            audit_log_entry_buffer.get(self.TARGET_ID, discord.AuditLogAction.ban) is not None
+        )
+
+    def test_wait_for_is_woken_by_new_entry(self) -> None:
+        """Test that waiting for an entry returns as soon as a matching entry is added."""
+        audit_log_entry_buffer: AuditLogEntryBuffer = AuditLogEntryBuffer()
+
+        async def _wait_for_entry() -> discord.RawAuditLogEntryEvent | None:
+            asyncio.get_running_loop().call_soon(
+                audit_log_entry_buffer.add,
+                self._create_audit_log_entry(1, discord.AuditLogAction.ban),
+            )
+            return await audit_log_entry_buffer.wait_for(
+                self.TARGET_ID, discord.AuditLogAction.ban, max_wait_seconds=5
+            )
+
+        audit_log_entry: discord.RawAuditLogEntryEvent | None = asyncio.run(_wait_for_entry())
+
+        assert audit_log_entry is not None
+        assert audit_log_entry.id == 1
+
+
+class TestTimerWheel:
+    """Test case to unit-test the hashed timer wheel."""
+
+    @staticmethod
+    def test_items_become_due_at_their_timestamp() -> None:
+        """Test that items are only returned once the wheel advances past their timestamp."""
+        timer_wheel: TimerWheel[str] = TimerWheel(0, slot_count=8)
+        timer_wheel.schedule("first", 3)
+        timer_wheel.schedule("second", 5)
+
+        assert timer_wheel.advance(2) == []
+        assert timer_wheel.advance(3) == ["first"]
+        assert len(timer_wheel) == 1
+        assert timer_wheel.advance(10) == ["second"]
+        assert len(timer_wheel) == 0
+
+    @staticmethod
+    def test_items_wait_for_full_rotations() -> None:
+        """Test that items due after more than one rotation are not returned early."""
+        timer_wheel: TimerWheel[str] = TimerWheel(0, slot_count=4)
+        timer_wheel.schedule("later", 9)
+
+        assert timer_wheel.advance(8) == []
+        assert timer_wheel.advance(9) == ["later"]
+
+    @staticmethod
+    def test_past_items_are_due_on_next_advance() -> None:
+        """Test that items scheduled in the past become due when the wheel is next advanced."""
+        timer_wheel: TimerWheel[str] = TimerWheel(100)
+        timer_wheel.schedule("overdue", 50)
+
+        assert timer_wheel.advance(100) == ["overdue"]
+
+    @staticmethod
+    def test_contains_only_pending_items() -> None:
+        """Test that an item is only contained until it becomes due."""
+        timer_wheel: TimerWheel[tuple[int, int]] = TimerWheel(0)
+        timer_wheel.schedule((1, 2), 1)
+
+        assert (1, 2) in timer_wheel
+        assert (2, 1) not in timer_wheel
+
+        timer_wheel.advance(1)
+
+        assert (1, 2) not in timer_wheel
+
+    @staticmethod
+    def test_invalid_arguments_are_rejected() -> None:
+        """Test that a non-positive tick length or slot count is rejected."""
+        with pytest.raises(ValueError, match="tick_seconds"):
+            TimerWheel(0, tick_seconds=0)
+
+        with pytest.raises(ValueError, match="slot_count"):
+            TimerWheel(0, slot_count=0)
+
+
+class _FakeGuild:
+    """Stand-in for a guild, holding only its cache of members."""
+
+    def __init__(self, members: "Sequence[SimpleNamespace]") -> None:
+        self.members: Sequence[SimpleNamespace] = members
+
+    def get_member(self, member_id: int) -> SimpleNamespace | None:
+        return next((member for member in self.members if member.id == member_id), None)
+
+
+class TestMemberSearchIndex:
+    """Test case to unit-test the search index of a guild's member names."""
+
+    @staticmethod
+    def _create_member(
+        member_id: int, name: str, display_name: str | None = None
+    ) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=member_id, name=name, display_name=display_name or name, global_name=None
+        )
+
+    def _search(
+        self, members: "Sequence[SimpleNamespace]", query: str, **kwargs: object
+    ) -> "Sequence[int]":
+        member_search_index: MemberSearchIndex = MemberSearchIndex()
+        member_search_index.rebuild(members)  # type: ignore[arg-type]
+
+        return [
+            member.id
+            for member in member_search_index.search(
+                _FakeGuild(members),  # type: ignore[arg-type]
+                query,
+                member_filter=lambda _: True,
+                **kwargs,  # type: ignore[arg-type]
+            )
+        ]
+
+    def test_prefix_matches_come_before_substring_matches(self) -> None:
+        """Test that names starting with the query are returned before names containing it."""
+        members: Sequence[SimpleNamespace] = [
+            self._create_member(1, "zz_alice"),
+            self._create_member(2, "alice"),
+            self._create_member(3, "bob"),
+        ]
+
+        assert self._search(members, "ALI") == [2, 1]
+
+    def test_matches_any_name_once(self) -> None:
+        """Test that members are matched by their display name, and only returned once."""
+        members: Sequence[SimpleNamespace] = [self._create_member(1, "carol", "caroline")]
+
+        assert self._search(members, "car") == [1]
+        assert self._search(members, "line") == [1]
+
+    def test_short_queries_only_match_prefixes(self) -> None:
+        """Test that queries shorter than a trigram do not match names by substring."""
+        members: Sequence[SimpleNamespace] = [
+            self._create_member(1, "dave"),
+            self._create_member(2, "eve"),
+        ]
+
+        assert self._search(members, "ev") == [2]
+        assert self._search(members, "") == [1, 2]
+
+    def test_results_are_limited(self) -> None:
+        """Test that at most the given number of members are returned."""
+        members: Sequence[SimpleNamespace] = [
+            self._create_member(index, f"member{index}") for index in range(10)
+        ]
+
+        assert len(self._search(members, "member", max_results=3)) == 3
+        assert len(self._search(members, "ember", max_results=3)) == 3
+
+    def test_updated_and_removed_members_are_reindexed(self) -> None:
+        """Test that adding & removing single members keeps both indexes up to date."""
+        members: list[SimpleNamespace] = [self._create_member(1, "frank")]
+
+        member_search_index: MemberSearchIndex = MemberSearchIndex()
+        member_search_index.rebuild(members)  # type: ignore[arg-type]
+
+        members[0] = self._create_member(1, "grace")
+        member_search_index.add_member(members[0])  # type: ignore[arg-type]
+
+        def _search(query: str) -> "Sequence[int]":
+            return [
+                member.id
+                for member in member_search_index.search(
+                    _FakeGuild(members),  # type: ignore[arg-type]
+                    query,
+                    member_filter=lambda _: True,
+                )
+            ]
+
+        assert _search("fra") == []
+        assert _search("race") == [1]
+
+        member_search_index.remove_member(1)
+
+        assert _search("race") == []
+        assert len(member_search_index) == 0
+
+
+class TestGetQueryFingerprint:
+    """Test case to unit-test the get_query_fingerprint function."""
+
+    @staticmethod
+    def test_literal_values_are_removed() -> None:
+        """Test that queries differing only by their literal values share a fingerprint."""
+        assert get_query_fingerprint(
+            "SELECT * FROM member WHERE id = 12 AND name = 'O''Brien'"
+        ) == get_query_fingerprint("SELECT * FROM member WHERE id = 345 AND name = 'Ann'")
+        assert get_query_fingerprint("SELECT * FROM member WHERE id = 12") == (
+            "SELECT * FROM member WHERE id = ?"
+        )
+
+    @staticmethod
+    def test_parameter_list_lengths_are_removed() -> None:
+        """Test that queries differing only by the length of a parameter list match."""
+        assert (
+            get_query_fingerprint("SELECT * FROM member WHERE id IN (%s, %s, %s)")
+            == get_query_fingerprint("SELECT * FROM member WHERE id IN (%s,%s)")
+            == "SELECT * FROM member WHERE id IN (%s, ...)"
+        )
+        assert get_query_fingerprint("SELECT * FROM member WHERE id IN (?, ?)") == (
+            "SELECT * FROM member WHERE id IN (?, ...)"
+        )
+
+    @staticmethod
+    def test_whitespace_is_normalised() -> None:
+        """Test that queries differing only by their whitespace share a fingerprint."""
+        assert get_query_fingerprint("SELECT *\n  FROM member") == "SELECT * FROM member"
+
+
+class TestQueryProfiler:
+    """Test case to unit-test collecting the totals of finished query profiles."""
+
+    SQL: "Final[str]" = "SELECT * FROM member WHERE id = %s"
+
+    @classmethod
+    def _create_query_profile(cls, query_count: int) -> QueryProfile:
+        query_profile: QueryProfile = QueryProfile("task")
+
+        index: int
+        for index in range(query_count):
+            query_profile.record(cls.SQL, float(index))
+
+        return query_profile
+
+    def test_statistics_are_totalled_by_name(self) -> None:
+        """Test that every non-empty profile is added to the totals of its name."""
+        query_profiler: QueryProfiler = QueryProfiler()
+
+        query_profiler.report(self._create_query_profile(2))
+        query_profiler.report(self._create_query_profile(3))
+        query_profiler.report(self._create_query_profile(0))
+
+        assert query_profiler.get_statistics() == {
+            "task": (2, 5, 4.0, 3),
+        }
+
+    @pytest.mark.parametrize(
+        ("n_plus_one_warning_threshold", "query_count", "is_warning_logged"),
+        ((0, 50, False), (3, 3, False), (3, 4, True)),
+    )
+    def test_n_plus_one_warning_is_logged_above_threshold(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        n_plus_one_warning_threshold: int,
+        query_count: int,
+        *,
+        is_warning_logged: bool,
+    ) -> None:
+        """Test that repeated queries are only warned about beyond a positive threshold."""
+        query_profiler: QueryProfiler = QueryProfiler()
+        query_profiler.n_plus_one_warning_threshold = n_plus_one_warning_threshold
+
+        with caplog.at_level("WARNING", logger="TeX-Bot"):
+            query_profiler.report(self._create_query_profile(query_count))
+
+        assert (
+            any("Possible N+1 query pattern" in message for message in caplog.messages)
+            == is_warning_logged
+        )
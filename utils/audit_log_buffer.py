@@ -0,0 +1,168 @@
+"""Bounded in-memory buffer of the audit log entries received from the gateway."""
+
+import asyncio
+import collections
+import logging
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+__all__: "Sequence[str]" = ("AuditLogEntryBuffer",)
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+type _AuditLogEntryKey = tuple[int, discord.AuditLogAction]
+
+
+class AuditLogEntryBuffer:
+    """
+    Ring buffer of the most recently created audit log entries.
+
+    Entries are stored as the raw gateway payloads,
+    because Pycord only dispatches a resolved `discord.AuditLogEntry`
+    when the user that created the entry is cached.
+    Entries are indexed by their (target ID, action) pair,
+    so the entry that caused a gateway event can be looked up without querying
+    the audit log over REST.
+    Once the buffer is full, adding a new entry evicts the oldest one.
+    """
+
+    DEFAULT_MAX_ENTRIES: "Final[int]" = 256
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialise a new empty buffer, holding at most the given number of entries."""
+        if max_entries < 1:
+            INVALID_MAX_ENTRIES_MESSAGE: Final[str] = "max_entries must be a positive integer."
+            raise ValueError(INVALID_MAX_ENTRIES_MESSAGE)
+
+        self._entries: collections.deque[discord.RawAuditLogEntryEvent] = collections.deque()
+        self._max_entries: int = max_entries
+        self._index: dict[
+            _AuditLogEntryKey, collections.deque[discord.RawAuditLogEntryEvent]
+        ] = {}
+        self._waiters: dict[
+            _AuditLogEntryKey, list[asyncio.Future[discord.RawAuditLogEntryEvent]]
+        ] = {}
+
+    @staticmethod
+    def _get_key(audit_log_entry: discord.RawAuditLogEntryEvent) -> _AuditLogEntryKey | None:
+        if audit_log_entry.target_id is None:
+            return None
+
+        return audit_log_entry.target_id, audit_log_entry.action_type
+
+    @staticmethod
+    def get_created_at(audit_log_entry: discord.RawAuditLogEntryEvent) -> "datetime.datetime":
+        """Return the time that the given entry was created, taken from its snowflake ID."""
+        return discord.utils.snowflake_time(audit_log_entry.id)
+
+    def add(self, audit_log_entry: discord.RawAuditLogEntryEvent) -> None:
+        """Store a newly created audit log entry & wake any tasks waiting for it."""
+        key: _AuditLogEntryKey | None = self._get_key(audit_log_entry)
+        if key is None:
+            return
+
+        if len(self._entries) >= self._max_entries:
+            evicted_entry: discord.RawAuditLogEntryEvent = self._entries.popleft()
+            evicted_key: _AuditLogEntryKey | None = self._get_key(evicted_entry)
+            if evicted_key is not None:
+                evicted_bucket: collections.deque[discord.RawAuditLogEntryEvent] = self._index[
+                    evicted_key
+                ]
+                evicted_bucket.popleft()
+                if not evicted_bucket:
+                    del self._index[evicted_key]
+
+        self._entries.append(audit_log_entry)
+        self._index.setdefault(key, collections.deque()).append(audit_log_entry)
+
+        waiter: asyncio.Future[discord.RawAuditLogEntryEvent]
+        for waiter in self._waiters.pop(key, ()):
+            if not waiter.done():
+                waiter.set_result(audit_log_entry)
+
+    def get(
+        self,
+        target_id: int,
+        *actions: "discord.AuditLogAction",
+        after: "datetime.datetime | None" = None,
+    ) -> "discord.RawAuditLogEntryEvent | None":
+        """
+        Return the newest stored entry of any of the given actions upon the given target.
+
+        If `after` is given, entries created before that time are ignored.
+        """
+        newest_audit_log_entry: discord.RawAuditLogEntryEvent | None = None
+
+        action: discord.AuditLogAction
+        for action in actions:
+            bucket: collections.deque[discord.RawAuditLogEntryEvent] | None = self._index.get(
+                (target_id, action)
+            )
+            if not bucket:
+                continue
+
+            if after is not None and self.get_created_at(bucket[-1]) < after:
+                continue
+
+            if newest_audit_log_entry is None or bucket[-1].id > newest_audit_log_entry.id:
+                newest_audit_log_entry = bucket[-1]
+
+        return newest_audit_log_entry
+
+    async def wait_for(
+        self,
+        target_id: int,
+        *actions: "discord.AuditLogAction",
+        after: "datetime.datetime | None" = None,
+        max_wait_seconds: float,
+    ) -> "discord.RawAuditLogEntryEvent | None":
+        """
+        Return a matching entry, waiting up to `max_wait_seconds` for one to arrive.
+
+        Gateway events (such as a member being banned) can be received
+        before the audit log entry that caused them,
+        so a short waiting window avoids falling back to querying the audit log over REST.
+        Returns None if no matching entry arrived in time.
+        """
+        audit_log_entry: discord.RawAuditLogEntryEvent | None = self.get(
+            target_id, *actions, after=after
+        )
+        if audit_log_entry is not None:
+            return audit_log_entry
+
+        keys: Sequence[_AuditLogEntryKey] = [(target_id, action) for action in actions]
+        waiter: asyncio.Future[discord.RawAuditLogEntryEvent] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        key: _AuditLogEntryKey
+        for key in keys:
+            self._waiters.setdefault(key, []).append(waiter)
+
+        try:
+            return await asyncio.wait_for(waiter, timeout=max_wait_seconds)
+        except TimeoutError:
+            logger.debug(
+                "No audit log entry of %s upon target %s arrived within %ss",
+                " or ".join(str(action) for action in actions),
+                target_id,
+                max_wait_seconds,
+            )
+            return None
+        finally:
+            for key in keys:
+                key_waiters: list[asyncio.Future[discord.RawAuditLogEntryEvent]] | None = (
+                    self._waiters.get(key)
+                )
+                if key_waiters is not None and waiter in key_waiters:
+                    key_waiters.remove(waiter)
+                    if not key_waiters:
+                        del self._waiters[key]
@@ -0,0 +1,95 @@
+"""Cache of the sorted lists of channels that each set of permissions can select."""
+
+import bisect
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("ChannelAutocompleteCache",)
+
+
+class ChannelAutocompleteCache:
+    """
+    Cache of the channels that can be selected in each autocomplete, for each set of roles.
+
+    Members with the same roles (and no member-specific permission overwrites)
+    always have the same permissions in every channel,
+    so the channels they can select only need to be computed once.
+    The whole cache must be cleared whenever a channel or role changes,
+    because that could change which channels each set of roles can select.
+    """
+
+    DEFAULT_MAX_RESULTS: "Final[int]" = 25
+
+    def __init__(self) -> None:
+        """Initialise a new empty channel autocomplete cache."""
+        self._channel_lists: dict[Hashable, Sequence[tuple[str, str, int]]] = {}
+        self._member_overwrite_target_ids: frozenset[int] | None = None
+
+    def clear(self) -> None:
+        """Remove every cached list of channels."""
+        self._channel_lists.clear()
+        self._member_overwrite_target_ids = None
+
+    def get_permissions_key(
+        self, guild: discord.Guild, permissions_target: discord.Member | discord.Role
+    ) -> "Hashable":
+        """Return a key that is equal for every target with the same channel permissions."""
+        if isinstance(permissions_target, discord.Role):
+            return "role", permissions_target.id
+
+        if self._member_overwrite_target_ids is None:
+            self._member_overwrite_target_ids = frozenset(
+                overwrite_target.id
+                for channel in guild.channels
+                for overwrite_target in channel.overwrites
+                if not isinstance(overwrite_target, discord.Role)
+            )
+
+        HAS_MEMBER_SPECIFIC_PERMISSIONS: Final[bool] = (
+            permissions_target.id == guild.owner_id
+            or permissions_target.id in self._member_overwrite_target_ids
+        )
+
+        return (
+            "member",
+            frozenset(permissions_target._roles),  # noqa: SLF001
+            permissions_target.id if HAS_MEMBER_SPECIFIC_PERMISSIONS else None,
+        )
+
+    def search(
+        self,
+        key: "Hashable",
+        get_channels: "Callable[[], Iterable[discord.abc.GuildChannel]]",
+        prefix: str,
+        *,
+        max_results: int = DEFAULT_MAX_RESULTS,
+    ) -> "Sequence[tuple[str, int]]":
+        """
+        Return the name & ID of the cached channels whose names start with the given prefix.
+
+        If no list of channels is cached for the given key,
+        the given callable is used to retrieve them.
+        """
+        channel_list: Sequence[tuple[str, str, int]] | None = self._channel_lists.get(key)
+        if channel_list is None:
+            channel_list = sorted(
+                (channel.name.casefold(), channel.name, channel.id)
+                for channel in get_channels()
+            )
+            self._channel_lists[key] = channel_list
+
+        casefolded_prefix: str = prefix.casefold()
+        start_index: int = bisect.bisect_left(channel_list, (casefolded_prefix,))
+
+        return [
+            (channel_name, channel_id)
+            for casefolded_channel_name, channel_name, channel_id in channel_list[
+                start_index : start_index + max_results
+            ]
+            if casefolded_channel_name.startswith(casefolded_prefix)
+        ]
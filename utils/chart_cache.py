@@ -0,0 +1,161 @@
+"""Content-addressed cache of rendered statistics bar chart images."""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from config import settings
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Mapping, Sequence
+    from logging import Logger
+    from pathlib import Path
+    from typing import Final
+
+__all__: "Sequence[str]" = ("RenderedChartCache", "get_rendered_chart_cache")
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+
+class RenderedChartCache:
+    """
+    Two-tier cache of rendered PNG bar chart images, keyed by the hash of their content.
+
+    The in-memory tier is a fixed-length LRU cache.
+    The optional on-disk tier has its least recently used images removed
+    once it grows beyond the given maximum size.
+    Every access to the on-disk tier is run on a separate thread,
+    so the event loop is never blocked by disk I/O.
+    """
+
+    MAX_MEMORY_ENTRIES: "Final[int]" = 32
+
+    def __init__(self, disk_cache_directory: "Path | None", max_disk_size: int) -> None:
+        """Initialise a new empty cache of rendered chart images."""
+        self.disk_cache_directory: Path | None = disk_cache_directory
+        self.max_disk_size: int = max_disk_size
+
+        self._memory_cache: OrderedDict[str, bytes] = OrderedDict()
+
+    @staticmethod
+    def generate_key(
+        data: "Mapping[str, int]",
+        *,
+        x_label: str,
+        y_label: str,
+        title: str,
+        extra_text: str,
+        style: str,
+    ) -> str:
+        """
+        Return the content hash that identifies a chart rendered from the given values.
+
+        The order of the data items is included because it determines the order of the bars.
+        """
+        return hashlib.sha256(
+            json.dumps(
+                [list(data.items()), x_label, y_label, title, extra_text, style],
+                ensure_ascii=False,
+            ).encode()
+        ).hexdigest()
+
+    async def aget(self, key: str) -> bytes | None:
+        """Return the cached PNG image bytes for the given key, if they exist."""
+        image_bytes: bytes | None = self._memory_cache.get(key)
+        if image_bytes is not None:
+            self._memory_cache.move_to_end(key)
+            return image_bytes
+
+        if self.disk_cache_directory is None:
+            return None
+
+        e: OSError
+        try:
+            image_bytes = await asyncio.to_thread(
+                self._read_from_disk, self.disk_cache_directory, key
+            )
+        except OSError as e:
+            logger.warning("Failed to read rendered chart %s from the disk cache: %s", key, e)
+            return None
+
+        if image_bytes is None:
+            return None
+
+        self._store_in_memory(key, image_bytes)
+        return image_bytes
+
+    async def aset(self, key: str, image_bytes: bytes) -> None:
+        """Store the given rendered PNG image bytes in every enabled tier of the cache."""
+        self._store_in_memory(key, image_bytes)
+
+        if self.disk_cache_directory is None:
+            return
+
+        e: OSError
+        try:
+            await asyncio.to_thread(
+                self._write_to_disk, self.disk_cache_directory, key, image_bytes
+            )
+        except OSError as e:
+            logger.warning("Failed to write rendered chart %s to the disk cache: %s", key, e)
+
+    def _store_in_memory(self, key: str, image_bytes: bytes) -> None:
+        self._memory_cache[key] = image_bytes
+        self._memory_cache.move_to_end(key)
+
+        while len(self._memory_cache) > self.MAX_MEMORY_ENTRIES:
+            self._memory_cache.popitem(last=False)
+
+    @staticmethod
+    def _read_from_disk(disk_cache_directory: "Path", key: str) -> bytes | None:
+        cached_image_path: Path = disk_cache_directory / f"{key}.png"
+        if not cached_image_path.is_file():
+            return None
+
+        image_bytes: bytes = cached_image_path.read_bytes()
+        cached_image_path.touch()
+        return image_bytes
+
+    def _write_to_disk(
+        self, disk_cache_directory: "Path", key: str, image_bytes: bytes
+    ) -> None:
+        disk_cache_directory.mkdir(parents=True, exist_ok=True)
+        (disk_cache_directory / f"{key}.png").write_bytes(image_bytes)
+        self._evict_from_disk(disk_cache_directory)
+
+    def _evict_from_disk(self, cache_directory: "Path") -> None:
+        cached_images: list[tuple[float, int, Path]] = []
+
+        cached_image_path: Path
+        for cached_image_path in cache_directory.glob("*.png"):
+            cached_image_stat: os.stat_result = cached_image_path.stat()
+            cached_images.append(
+                (cached_image_stat.st_mtime, cached_image_stat.st_size, cached_image_path)
+            )
+
+        cached_images.sort()
+
+        total_size: int = sum(cached_image[1] for cached_image in cached_images)
+
+        cached_image_size: int
+        for _, cached_image_size, cached_image_path in cached_images:
+            if total_size <= self.max_disk_size:
+                break
+
+            cached_image_path.unlink(missing_ok=True)
+            total_size -= cached_image_size
+
+
+@functools.cache
+def get_rendered_chart_cache() -> RenderedChartCache:
+    """Return the shared cache of rendered chart images, configured from the settings."""
+    return RenderedChartCache(
+        disk_cache_directory=settings["STATISTICS_CHART_CACHE_DIRECTORY"],
+        max_disk_size=settings["STATISTICS_CHART_CACHE_MAX_DISK_SIZE"],
+    )
@@ -0,0 +1,132 @@
+"""Router that passes received component interactions to the tasks waiting for them."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import discord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from collections.abc import Set as AbstractSet
+    from logging import Logger
+    from typing import Final
+
+__all__: "Sequence[str]" = ("DEFAULT_MAX_WAIT_SECONDS", "ComponentInteractionRouter")
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+# NOTE: Waits expire at the same time as the default timeout of views, after which their buttons stop responding
+DEFAULT_MAX_WAIT_SECONDS: "Final[float]" = 180.0
+
+type _RouteKey = tuple[str, int | None, int]
+
+
+class _PendingComponentInteraction:
+    __slots__ = ("check", "future")
+
+    def __init__(
+        self,
+        future: asyncio.Future[discord.Interaction],
+        check: "Callable[[discord.Interaction], bool] | None",
+    ) -> None:
+        self.future: asyncio.Future[discord.Interaction] = future
+        self.check: Callable[[discord.Interaction], bool] | None = check
+
+
+class ComponentInteractionRouter:
+    """
+    Router of component interactions (E.g. button presses) to the tasks waiting for them.
+
+    Waiting tasks are stored by (custom ID, user ID, channel ID),
+    so each received interaction is only compared against the tasks waiting for
+    that exact component, rather than against every waiting task.
+    Every wait must have an expiry, after which the waiting task is removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialise a new router with no waiting tasks."""
+        self._routes: dict[_RouteKey, list[_PendingComponentInteraction]] = {}
+
+    def dispatch(self, interaction: discord.Interaction) -> None:
+        """Pass the given interaction to the first task waiting for it, if there is one."""
+        if interaction.type != discord.InteractionType.component:
+            return
+
+        if not interaction.data or "custom_id" not in interaction.data:
+            return
+
+        if interaction.channel_id is None or interaction.user is None:
+            return
+
+        custom_id: str = interaction.data["custom_id"]  # type: ignore[typeddict-item]
+
+        user_id: int | None
+        for user_id in (interaction.user.id, None):
+            pending_component_interaction: _PendingComponentInteraction
+            for pending_component_interaction in self._routes.get(
+                (custom_id, user_id, interaction.channel_id), ()
+            ):
+                if pending_component_interaction.future.done():
+                    continue
+
+                if pending_component_interaction.check and not (
+                    pending_component_interaction.check(interaction)
+                ):
+                    continue
+
+                pending_component_interaction.future.set_result(interaction)
+                return
+
+    async def on_interaction(self, interaction: discord.Interaction) -> None:
+        """Event listener that routes every received interaction."""
+        self.dispatch(interaction)
+
+    async def wait_for_component_interaction(
+        self,
+        custom_ids: "AbstractSet[str]",
+        channel_id: int,
+        *,
+        user_id: int | None,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        check: "Callable[[discord.Interaction], bool] | None" = None,
+    ) -> discord.Interaction:
+        """
+        Wait for an interaction with any of the given components in the given channel.
+
+        If `user_id` is None, an interaction from any user is accepted,
+        so `check` should be given to restrict which users are accepted.
+        Raises `TimeoutError` if no matching interaction is received
+        within `max_wait_seconds`.
+        """
+        pending_component_interaction: _PendingComponentInteraction = (
+            _PendingComponentInteraction(asyncio.get_running_loop().create_future(), check)
+        )
+        route_keys: Sequence[_RouteKey] = [
+            (custom_id, user_id, channel_id) for custom_id in custom_ids
+        ]
+
+        route_key: _RouteKey
+        for route_key in route_keys:
+            self._routes.setdefault(route_key, []).append(pending_component_interaction)
+
+        try:
+            return await asyncio.wait_for(
+                pending_component_interaction.future, timeout=max_wait_seconds
+            )
+        except TimeoutError:
+            logger.debug(
+                "No interaction with any of the components %s was received within %ss",
+                ", ".join(sorted(custom_ids)),
+                max_wait_seconds,
+            )
+            raise
+        finally:
+            for route_key in route_keys:
+                pending_component_interactions: list[_PendingComponentInteraction] = (
+                    self._routes[route_key]
+                )
+                pending_component_interactions.remove(pending_component_interaction)
+                if not pending_component_interactions:
+                    del self._routes[route_key]
@@ -0,0 +1,52 @@
+"""Utility functions for managing heavy third-party modules that are imported lazily."""
+
+import asyncio
+import importlib
+import logging
+import sys
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from logging import Logger
+    from typing import Final
+
+__all__: "Sequence[str]" = ("LAZILY_IMPORTED_MODULE_NAMES", "prewarm_lazily_imported_modules")
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+# NOTE: These modules are banned from being imported at module-level (see `banned-module-level-imports` in pyproject.toml), so they must be imported within the functions that use them
+LAZILY_IMPORTED_MODULE_NAMES: "Final[Sequence[str]]" = (
+    "bs4",
+    "mplcyberpunk",
+    "matplotlib.pyplot",
+    "parsedatetime",
+)
+
+
+def _import_module_timed(module_name: str) -> None:
+    if module_name in sys.modules:
+        return
+
+    start_time: float = time.perf_counter()
+    importlib.import_module(module_name)
+    logger.debug(
+        "Pre-warmed lazily imported module %r in %.3fs",
+        module_name,
+        time.perf_counter() - start_time,
+    )
+
+
+async def prewarm_lazily_imported_modules() -> None:
+    """
+    Import every lazily imported module in a background thread.
+
+    This should be called once TeX-Bot is ready,
+    so that the first command to need one of these modules does not pay its import cost,
+    without that cost delaying TeX-Bot from connecting to Discord.
+    """
+    module_name: str
+    for module_name in LAZILY_IMPORTED_MODULE_NAMES:
+        await asyncio.to_thread(_import_module_timed, module_name)
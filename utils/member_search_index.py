@@ -0,0 +1,204 @@
+"""Incrementally maintained search index of the names of a guild's members."""
+
+import bisect
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from collections.abc import Set as AbstractSet
+    from typing import Final
+
+    import discord
+
+__all__: "Sequence[str]" = ("MemberSearchIndex",)
+
+
+class MemberSearchIndex:
+    """
+    Sorted index of every casefolded name that each member of a guild can be searched by.
+
+    Each member can be found by their username, display name & global name.
+    Only member IDs are stored, so members are always retrieved from the guild's own cache
+    (which Pycord updates in place).
+    Names are also indexed by each of their trigrams (sequences of three characters),
+    so matching names that only contain the query never scans every stored name.
+    """
+
+    DEFAULT_MAX_RESULTS: "Final[int]" = 25
+    TRIGRAM_LENGTH: "Final[int]" = 3
+
+    def __init__(self) -> None:
+        """Initialise a new empty member search index."""
+        self._search_terms: list[tuple[str, int]] = []
+        self._member_search_terms: dict[int, frozenset[str]] = {}
+        self._trigram_member_ids: dict[str, set[int]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of members stored in this index."""
+        return len(self._member_search_terms)
+
+    @staticmethod
+    def _get_search_terms(member: "discord.Member") -> frozenset[str]:
+        return frozenset(
+            name.casefold()
+            for name in (member.name, member.display_name, member.global_name)
+            if name
+        )
+
+    @classmethod
+    def _get_trigrams(cls, text: str) -> "AbstractSet[str]":
+        return {
+            text[index : index + cls.TRIGRAM_LENGTH]
+            for index in range(len(text) - cls.TRIGRAM_LENGTH + 1)
+        }
+
+    def _index_trigrams(self, member_id: int, search_terms: "Iterable[str]") -> None:
+        search_term: str
+        for search_term in search_terms:
+            trigram: str
+            for trigram in self._get_trigrams(search_term):
+                self._trigram_member_ids.setdefault(trigram, set()).add(member_id)
+
+    def rebuild(self, members: "Iterable[discord.Member]") -> None:
+        """Replace the contents of this index with the given members."""
+        self._member_search_terms = {
+            member.id: self._get_search_terms(member) for member in members
+        }
+        self._search_terms = sorted(
+            (search_term, member_id)
+            for member_id, search_terms in self._member_search_terms.items()
+            for search_term in search_terms
+        )
+
+        self._trigram_member_ids = {}
+
+        member_id: int
+        search_terms: frozenset[str]
+        for member_id, search_terms in self._member_search_terms.items():
+            self._index_trigrams(member_id, search_terms)
+
+    def add_member(self, member: "discord.Member") -> None:
+        """Add the given member to this index, replacing any names stored for them."""
+        self.remove_member(member.id)
+
+        search_terms: frozenset[str] = self._get_search_terms(member)
+        self._member_search_terms[member.id] = search_terms
+
+        search_term: str
+        for search_term in search_terms:
+            bisect.insort(self._search_terms, (search_term, member.id))
+
+        self._index_trigrams(member.id, search_terms)
+
+    def remove_member(self, member_id: int) -> None:
+        """Remove the member with the given ID from this index, if they are stored."""
+        search_term: str
+        for search_term in self._member_search_terms.pop(member_id, ()):
+            search_term_index: int = bisect.bisect_left(
+                self._search_terms, (search_term, member_id)
+            )
+            if self._search_terms[search_term_index : search_term_index + 1] == [
+                (search_term, member_id)
+            ]:
+                del self._search_terms[search_term_index]
+
+            trigram: str
+            for trigram in self._get_trigrams(search_term):
+                trigram_member_ids: set[int] | None = self._trigram_member_ids.get(trigram)
+                if trigram_member_ids is None:
+                    continue
+
+                trigram_member_ids.discard(member_id)
+                if not trigram_member_ids:
+                    del self._trigram_member_ids[trigram]
+
+    def _get_substring_match_member_ids(self, casefolded_query: str) -> "Sequence[int]":
+        """
+        Return the IDs of members with a name containing the query, ordered by that name.
+
+        Only members sharing every trigram of the query are checked,
+        so queries shorter than a single trigram do not match any names by substring.
+        """
+        query_trigrams: AbstractSet[str] = self._get_trigrams(casefolded_query)
+        if not query_trigrams:
+            return []
+
+        trigram_member_id_sets: list[set[int]] = sorted(
+            (self._trigram_member_ids.get(trigram, set()) for trigram in query_trigrams),
+            key=len,
+        )
+        candidate_member_ids: set[int] = trigram_member_id_sets[0].intersection(
+            *trigram_member_id_sets[1:]
+        )
+
+        matched_search_terms: list[tuple[str, int]] = []
+
+        member_id: int
+        for member_id in candidate_member_ids:
+            matching_search_terms: Sequence[str] = [
+                search_term
+                for search_term in self._member_search_terms[member_id]
+                if casefolded_query in search_term
+            ]
+            if matching_search_terms:
+                matched_search_terms.append((min(matching_search_terms), member_id))
+
+        return [member_id for _, member_id in sorted(matched_search_terms)]
+
+    def search(
+        self,
+        guild: "discord.Guild",
+        query: str,
+        *,
+        member_filter: "Callable[[discord.Member], bool]",
+        max_results: int = DEFAULT_MAX_RESULTS,
+    ) -> "Sequence[discord.Member]":
+        """
+        Return the members whose names best match the given query, in order.
+
+        Members with a name starting with the query are returned first,
+        followed by members with a name containing the query
+        (if the query is at least as long as a single trigram).
+        Only members that pass the given filter are returned.
+        """
+        casefolded_query: str = query.casefold()
+
+        matched_members: dict[int, discord.Member] = {}
+        rejected_member_ids: set[int] = set()
+
+        def match(member_id: int) -> None:
+            if member_id in matched_members or member_id in rejected_member_ids:
+                return
+
+            member: discord.Member | None = guild.get_member(member_id)
+            if member is None or not member_filter(member):
+                rejected_member_ids.add(member_id)
+                return
+
+            matched_members[member_id] = member
+
+        search_term: str
+        member_id: int
+
+        # NOTE: Search terms starting with the query are sorted together, directly after the position the query itself would be inserted at
+        search_term_index: int
+        for search_term_index in range(
+            bisect.bisect_left(self._search_terms, (casefolded_query,)),
+            len(self._search_terms),
+        ):
+            search_term, member_id = self._search_terms[search_term_index]
+            if len(matched_members) >= max_results or not search_term.startswith(
+                casefolded_query
+            ):
+                break
+
+            match(member_id)
+
+        if len(matched_members) < max_results:
+            for member_id in self._get_substring_match_member_ids(casefolded_query):
+                if len(matched_members) >= max_results:
+                    break
+
+                match(member_id)
+
+        return list(matched_members.values())
@@ -71,6 +71,20 @@ class MessageSavingSenderComponent(abc.ABC):
 
         self.sent_message = await self._send(content=content, view=view)
 
+    async def edit(self, content: str, *, view: "View | None" = None) -> None:
+        """Replace the content & view of the previously sent message."""
+        if self.sent_message is None:
+            NOT_YET_SENT_MESSAGE: Final[str] = (
+                f"No message has been sent yet using this {type(self).__name__}Component."
+            )
+            raise RuntimeError(NOT_YET_SENT_MESSAGE)
+
+        if isinstance(self.sent_message, discord.Message):
+            await self.sent_message.edit(content=content, view=view)
+
+        else:
+            await self.sent_message.edit_original_response(content=content, view=view)
+
     async def delete(self) -> None:
         """Delete the previously sent message."""
         if self.sent_message is None:
@@ -5,8 +5,6 @@ import logging
 from typing import TYPE_CHECKING
 
 import aiohttp
-import bs4
-from bs4 import BeautifulSoup
 
 from config import settings
 from exceptions import MSLMembershipError
@@ -72,7 +70,10 @@ async def fetch_community_group_members_list() -> set[int]:
 
     Returns a set of IDs.
     """
-    parsed_html: BeautifulSoup = BeautifulSoup(
+    # NOTE: bs4 is slow to import, so it is only imported once a membership list is fetched
+    import bs4
+
+    parsed_html: bs4.BeautifulSoup = bs4.BeautifulSoup(
         markup=await fetch_url_content_with_session(MEMBERS_LIST_URL), features="html.parser"
     )
 
@@ -0,0 +1,252 @@
+"""Profiler of the database queries made by each slash-command invocation & task run."""
+
+import collections
+import contextlib
+import contextvars
+import functools
+import logging
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+    from logging import Logger
+    from typing import Final
+
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+__all__: "Sequence[str]" = (
+    "QueryProfile",
+    "QueryProfileStatistics",
+    "QueryProfiler",
+    "current_query_profile",
+    "get_query_fingerprint",
+    "profile_database_queries",
+    "profile_queries",
+    "query_profiler",
+)
+
+
+logger: "Final[Logger]" = logging.getLogger("TeX-Bot")
+
+_PARAMETER_LIST_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"(%s|\?)(?:\s*,\s*(?:%s|\?))+")
+_LITERAL_PATTERN: "Final[re.Pattern[str]]" = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+class QueryProfile:
+    """The number, duration & SQL fingerprints of the queries made within a single scope."""
+
+    __slots__ = ("_lock", "fingerprint_counts", "name", "query_count", "total_duration")
+
+    def __init__(self, name: str) -> None:
+        """Initialise a new empty profile, for the scope with the given name."""
+        self.name: str = name
+        self.query_count: int = 0
+        self.total_duration: float = 0.0
+        self.fingerprint_counts: collections.Counter[str] = collections.Counter()
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, sql: str, duration: float) -> None:
+        """Record a single query, that took the given duration (in milliseconds)."""
+        fingerprint: str = get_query_fingerprint(sql)
+
+        with self._lock:
+            self.query_count += 1
+            self.total_duration += duration
+            self.fingerprint_counts[fingerprint] += 1
+
+    def get_duplicated_fingerprints(self) -> "Mapping[str, int]":
+        """Return the fingerprint of every query that was made more than once."""
+        with self._lock:
+            return {
+                fingerprint: fingerprint_count
+                for fingerprint, fingerprint_count in self.fingerprint_counts.most_common()
+                if fingerprint_count > 1
+            }
+
+
+class QueryProfileStatistics(NamedTuple):
+    """Totals of every profiled run of a single slash-command or task."""
+
+    run_count: int
+    query_count: int
+    total_duration: float
+    max_query_count: int
+
+
+current_query_profile: "Final[contextvars.ContextVar[QueryProfile | None]]" = (
+    contextvars.ContextVar("current_query_profile", default=None)
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def get_query_fingerprint(sql: str) -> str:
+    """
+    Return the given SQL, with its literal values & the length of its parameter lists removed.
+
+    Queries made by the same ORM call have the same fingerprint,
+    even when they are made for different objects.
+    """
+    return _PARAMETER_LIST_PATTERN.sub(
+        r"\1, ...", _LITERAL_PATTERN.sub("?", " ".join(sql.split()))
+    )
+
+
+def _profile_query(
+    execute: "Callable[[str, object, bool, Mapping[str, object]], object]",
+    sql: str,
+    params: object,
+    many: bool,  # noqa: FBT001
+    context: "Mapping[str, object]",
+) -> object:
+    query_profile: QueryProfile | None = current_query_profile.get()
+    if query_profile is None:
+        return execute(sql, params, many, context)
+
+    start_time: float = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        query_profile.record(sql, (time.perf_counter() - start_time) * 1000)
+
+
+def _add_execute_wrapper(*, connection: "BaseDatabaseWrapper", **_kwargs: object) -> None:
+    # NOTE: Each thread has its own connection object, so the wrapper must be added to every connection as it is opened, rather than only to the current thread's connection
+    if _profile_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_profile_query)
+
+
+class QueryProfiler:
+    """
+    Collector of the totals of every profiled slash-command & task, by name.
+
+    Finished profiles are only collected once the profiler has been installed.
+    """
+
+    def __init__(self) -> None:
+        """Initialise a new profiler, that is not yet installed."""
+        # NOTE: A threshold of 0 disables the N+1 query warnings
+        self.n_plus_one_warning_threshold: int = 0
+        self.is_installed: bool = False
+
+        self._statistics: dict[str, QueryProfileStatistics] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def install(self, *, n_plus_one_warning_threshold: int = 0) -> None:
+        """
+        Start profiling every query made by every database connection.
+
+        If the given threshold is positive, a warning is logged whenever a single scope
+        makes more than that many queries with the same fingerprint
+        (which usually means that a query is being made once per object in a loop).
+        """
+        self.n_plus_one_warning_threshold = n_plus_one_warning_threshold
+        self.is_installed = True
+
+        connection_created.connect(_add_execute_wrapper, weak=False)
+
+        connection: BaseDatabaseWrapper
+        for connection in connections.all(initialized_only=True):
+            _add_execute_wrapper(connection=connection)
+
+    def report(self, query_profile: QueryProfile) -> None:
+        """Add the given finished profile to its scope's totals, logging any N+1 queries."""
+        if not query_profile.query_count:
+            return
+
+        with self._lock:
+            query_profile_statistics: QueryProfileStatistics | None = self._statistics.get(
+                query_profile.name
+            )
+            self._statistics[query_profile.name] = (
+                QueryProfileStatistics(
+                    run_count=1,
+                    query_count=query_profile.query_count,
+                    total_duration=query_profile.total_duration,
+                    max_query_count=query_profile.query_count,
+                )
+                if query_profile_statistics is None
+                else QueryProfileStatistics(
+                    run_count=query_profile_statistics.run_count + 1,
+                    query_count=(
+                        query_profile_statistics.query_count + query_profile.query_count
+                    ),
+                    total_duration=(
+                        query_profile_statistics.total_duration + query_profile.total_duration
+                    ),
+                    max_query_count=max(
+                        query_profile_statistics.max_query_count, query_profile.query_count
+                    ),
+                )
+            )
+
+        duplicated_fingerprints: Mapping[str, int] = (
+            query_profile.get_duplicated_fingerprints()
+        )
+
+        logger.debug(
+            "%s made %d database queries in %.1fms (%d repeated)",
+            query_profile.name,
+            query_profile.query_count,
+            query_profile.total_duration,
+            sum(duplicated_fingerprints.values()) - len(duplicated_fingerprints),
+        )
+
+        if not self.n_plus_one_warning_threshold:
+            return
+
+        fingerprint: str
+        fingerprint_count: int
+        for fingerprint, fingerprint_count in duplicated_fingerprints.items():
+            if fingerprint_count > self.n_plus_one_warning_threshold:
+                logger.warning(
+                    "Possible N+1 query pattern: %s made the same database query %d times: %s",
+                    query_profile.name,
+                    fingerprint_count,
+                    fingerprint,
+                )
+
+    def get_statistics(self) -> "Mapping[str, QueryProfileStatistics]":
+        """Return the totals of every profiled slash-command & task, by name."""
+        with self._lock:
+            return dict(self._statistics)
+
+
+query_profiler: "Final[QueryProfiler]" = QueryProfiler()
+
+
+@contextlib.contextmanager
+def profile_queries(name: str) -> "Iterator[QueryProfile]":
+    """
+    Profile every database query made within this context, under the given scope name.
+
+    Queries made on the database threads are included,
+    because each database call runs within a copy of the context it was made from.
+    """
+    query_profile: QueryProfile = QueryProfile(name)
+    token: contextvars.Token[QueryProfile | None] = current_query_profile.set(query_profile)
+    try:
+        yield query_profile
+    finally:
+        current_query_profile.reset(token)
+
+        if query_profiler.is_installed:
+            query_profiler.report(query_profile)
+
+
+def profile_database_queries[**P, T](
+    func: "Callable[P, Awaitable[T]]",
+) -> "Callable[P, Awaitable[T]]":
+    """Profile every database query made by each run of the decorated coroutine."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: "P.args", **kwargs: "P.kwargs") -> T:
+        with profile_queries(func.__qualname__):
+            return await func(*args, **kwargs)
+
+    return wrapper
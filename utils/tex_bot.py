@@ -2,6 +2,7 @@
 
 import logging
 import re
+import time
 from typing import TYPE_CHECKING, override
 
 import aiohttp
@@ -26,8 +27,18 @@ from exceptions import (
     RulesChannelDoesNotExistError,
 )
 
+from .channel_autocomplete_cache import ChannelAutocompleteCache
+from .component_interaction_router import (
+    DEFAULT_MAX_WAIT_SECONDS,
+    ComponentInteractionRouter,
+)
+from .member_search_index import MemberSearchIndex
+from .query_profiler import profile_queries
+from .timer_wheel import TimerWheel
+
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Sequence
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
+    from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final, LiteralString, NoReturn
 
@@ -61,23 +72,103 @@ class TeXBot(discord.Bot):
         self._roles_channel: discord.TextChannel | None = None
         self._general_channel: discord.TextChannel | None = None
         self._rules_channel: discord.TextChannel | None = None
+        self._log_channel: discord.TextChannel | None = None
+        self._webhook_http_session: aiohttp.ClientSession | None = None
+        self._main_guild_member_search_index: MemberSearchIndex = MemberSearchIndex()
+        self._main_guild_member_search_index_built: bool = False
+        self._main_guild_member_search_index_complete: bool = False
+        self._channel_autocomplete_cache: ChannelAutocompleteCache = ChannelAutocompleteCache()
+        self._message_deletion_timer_wheel: TimerWheel[tuple[int, int]] = TimerWheel(
+            time.time()
+        )
+        self._committee_action_choices: dict[int | None, Sequence[tuple[str, str, int]]] = {}
+        self._close_callbacks: list[Callable[[], object]] = []
         self._exit_was_due_to_kill_command: bool = False
 
         self._main_guild_set: bool = False
+        self._component_interaction_router: ComponentInteractionRouter = (
+            ComponentInteractionRouter()
+        )
 
         super().__init__(*args, **options)  # type: ignore[no-untyped-call]  # noqa: CAR151
 
+        self.add_listener(self._component_interaction_router.on_interaction, "on_interaction")
+        self.add_listener(self._clear_log_channel_on_webhooks_update, "on_webhooks_update")
+        self.add_listener(self._clear_log_channel_on_channel_delete, "on_guild_channel_delete")
+        self.add_listener(self._clear_log_channel_on_channel_update, "on_guild_channel_update")
+        self.add_listener(self._index_searchable_member, "on_member_join")
+        self.add_listener(self._unindex_searchable_member, "on_member_remove")
+        self.add_listener(self._reindex_searchable_member, "on_member_update")
+        self.add_listener(self._reindex_searchable_user, "on_user_update")
+        self.add_listener(self._build_main_guild_member_search_index_on_chunk, "on_ready")
+        self.add_listener(
+            self._build_main_guild_member_search_index_on_chunk, "on_guild_available"
+        )
+
+        event_name: str
+        for event_name in (
+            "on_guild_channel_create",
+            "on_guild_channel_delete",
+            "on_guild_channel_update",
+            "on_guild_role_create",
+            "on_guild_role_delete",
+            "on_guild_role_update",
+            "on_guild_update",
+        ):
+            self.add_listener(self._clear_channel_autocomplete_cache, event_name)
+
+    @override
+    async def invoke_application_command(self, ctx: discord.ApplicationContext) -> None:
+        with profile_queries(f"/{ctx.command.qualified_name}"):
+            await super().invoke_application_command(ctx)
+
     @override
     async def close(self) -> "NoReturn":  # type: ignore[misc]
+        if self._webhook_http_session is not None:
+            await self._webhook_http_session.close()
+
+        close_callback: Callable[[], object]
+        for close_callback in self._close_callbacks:
+            close_callback()
+
         await super().close()
 
         logger.info("TeX-Bot manually terminated.")
 
+    def add_close_callback(self, close_callback: "Callable[[], object]") -> None:
+        """
+        Register a callable to release a resource when TeX-Bot is closed.
+
+        This allows resources owned outside of the `utils` package (E.g. database connections)
+        to be released, without this class having to import them.
+        """
+        self._close_callbacks.append(close_callback)
+
     @property
     def EXIT_WAS_DUE_TO_KILL_COMMAND(self) -> bool:  # noqa: D102, N802
         # NOTE: Identifies whether TeX-Bot exited due to the kill command being used."""
         return self._exit_was_due_to_kill_command
 
+    @property
+    def message_deletion_timer_wheel(self) -> TimerWheel[tuple[int, int]]:
+        """
+        The timer wheel of every pending scheduled message deletion.
+
+        Each pending deletion is stored in memory only as its (channel ID, message ID) pair.
+        """
+        return self._message_deletion_timer_wheel
+
+    @property
+    def committee_action_choices(self) -> dict[int | None, "Sequence[tuple[str, str, int]]"]:
+        """
+        The cached autocomplete choices of the committee actions assigned to each user.
+
+        Each list of choices is sorted as (casefolded description, choice name, action ID),
+        keyed by the Discord ID of the user the actions are assigned to.
+        The `None` key holds every action, as shown to admins.
+        """
+        return self._committee_action_choices
+
     @property
     def main_guild(self) -> discord.Guild:
         """
@@ -496,6 +587,8 @@ class TeXBot(discord.Bot):
 
         If no DISCORD_LOG_CHANNEL_WEBHOOK_URL is specified,
         a ValueError exception will be raised.
+        The retrieved log channel is cached until a webhook or channel update event
+        could have changed it.
         """
         if not settings["DISCORD_LOG_CHANNEL_WEBHOOK_URL"]:
             NO_LOG_CHANNEL_MESSAGE: Final[str] = (
@@ -504,21 +597,197 @@ class TeXBot(discord.Bot):
             )
             raise ValueError(NO_LOG_CHANNEL_MESSAGE)
 
-        session: aiohttp.ClientSession
-        async with aiohttp.ClientSession() as session:
-            partial_webhook: Webhook = Webhook.from_url(
-                settings["DISCORD_LOG_CHANNEL_WEBHOOK_URL"], session=session
+        if self._log_channel is not None:
+            return self._log_channel
+
+        if self._webhook_http_session is None or self._webhook_http_session.closed:
+            self._webhook_http_session = aiohttp.ClientSession()
+
+        partial_webhook: Webhook = Webhook.from_url(
+            settings["DISCORD_LOG_CHANNEL_WEBHOOK_URL"], session=self._webhook_http_session
+        )
+
+        full_webhook: Webhook = await partial_webhook.fetch()
+        if not full_webhook.channel:
+            full_webhook = await self.fetch_webhook(partial_webhook.id)
+
+        if not full_webhook.channel:
+            LOG_CHANNEL_NOT_FOUND_MESSAGE: Final[str] = "Failed to fetch log channel."
+            raise RuntimeError(LOG_CHANNEL_NOT_FOUND_MESSAGE)
+
+        self._log_channel = full_webhook.channel
+        return self._log_channel
+
+    async def _clear_log_channel_on_webhooks_update(
+        self, channel: "discord.abc.GuildChannel"
+    ) -> None:
+        # NOTE: The log channel webhook may have been moved to a different channel or deleted
+        logger.debug("Clearing cached log channel, because webhooks changed in %s", channel)
+        self._log_channel = None
+
+    async def _clear_log_channel_on_channel_delete(
+        self, channel: "discord.abc.GuildChannel"
+    ) -> None:
+        if self._log_channel is not None and channel.id == self._log_channel.id:
+            self._log_channel = None
+
+    async def _clear_log_channel_on_channel_update(
+        self, before: "discord.abc.GuildChannel", _: "discord.abc.GuildChannel"
+    ) -> None:
+        if self._log_channel is not None and before.id == self._log_channel.id:
+            self._log_channel = None
+
+    def _build_main_guild_member_search_index(self, main_guild: discord.Guild) -> None:
+        """
+        Build the member search index, unless it has already been built from these members.
+
+        The index is built from a partial list of members at most once,
+        then built once more when all the guild's members have been received.
+        Afterwards, it is kept up to date by the member event listeners.
+        """
+        if self._main_guild_member_search_index_complete:
+            return
+
+        if self._main_guild_member_search_index_built and not main_guild.chunked:
+            return
+
+        self._main_guild_member_search_index.rebuild(main_guild.members)
+        self._main_guild_member_search_index_built = True
+        self._main_guild_member_search_index_complete = main_guild.chunked
+
+    async def _build_main_guild_member_search_index_on_chunk(
+        self, guild: discord.Guild | None = None
+    ) -> None:
+        if self._main_guild is None or (guild is not None and guild != self._main_guild):
+            return
+
+        if self._main_guild.chunked:
+            self._build_main_guild_member_search_index(self._main_guild)
+
+    def search_main_guild_members(
+        self, query: str, *, member_filter: "Callable[[discord.Member], bool]"
+    ) -> "Sequence[discord.Member]":
+        """
+        Return the members of your group's Discord guild whose names best match the query.
+
+        Members are matched by their username, display name & global name,
+        ignoring case & any leading "@".
+        At most 25 members are returned (the most that autocomplete options can show).
+        The returned members are already filtered,
+        so must not be passed through `basic_autocomplete()`, which drops substring matches.
+        """
+        main_guild: discord.Guild = self.main_guild
+
+        self._build_main_guild_member_search_index(main_guild)
+
+        return self._main_guild_member_search_index.search(
+            main_guild, query.removeprefix("@"), member_filter=member_filter
+        )
+
+    def search_main_guild_member_choices(
+        self, query: str, *, member_filter: "Callable[[discord.Member], bool]"
+    ) -> "Sequence[discord.OptionChoice]":
+        """
+        Return the autocomplete options of the members whose names best match the query.
+
+        Each option is named by the member's username,
+        which is prefixed with "@" if the query is empty or also starts with "@".
+        """
+        SHOW_AT_PREFIX: Final[bool] = not query or query.startswith("@")
+
+        return [
+            discord.OptionChoice(
+                name=f"@{member.name}" if SHOW_AT_PREFIX else member.name, value=str(member.id)
             )
+            for member in self.search_main_guild_members(query, member_filter=member_filter)
+        ]
+
+    def _is_main_guild_member_indexed(self, member: discord.Member) -> bool:
+        return bool(
+            self._main_guild_member_search_index_built
+            and member.guild.id == settings["_DISCORD_MAIN_GUILD_ID"]
+        )
 
-            full_webhook: Webhook = await partial_webhook.fetch()
-            if not full_webhook.channel:
-                full_webhook = await self.fetch_webhook(partial_webhook.id)
+    async def _index_searchable_member(self, member: discord.Member) -> None:
+        if self._is_main_guild_member_indexed(member):
+            self._main_guild_member_search_index.add_member(member)
 
-            if not full_webhook.channel:
-                LOG_CHANNEL_NOT_FOUND_MESSAGE: Final[str] = "Failed to fetch log channel."
-                raise RuntimeError(LOG_CHANNEL_NOT_FOUND_MESSAGE)
+    async def _unindex_searchable_member(self, member: discord.Member) -> None:
+        if self._is_main_guild_member_indexed(member):
+            self._main_guild_member_search_index.remove_member(member.id)
 
-            return full_webhook.channel
+    async def _reindex_searchable_member(
+        self, _: discord.Member, after: discord.Member
+    ) -> None:
+        if self._is_main_guild_member_indexed(after):
+            self._main_guild_member_search_index.add_member(after)
+
+    async def _reindex_searchable_user(self, _: discord.User, after: discord.User) -> None:
+        if not self._main_guild_member_search_index_built or not self._main_guild:
+            return
+
+        member: discord.Member | None = self._main_guild.get_member(after.id)
+        if member is not None:
+            self._main_guild_member_search_index.add_member(member)
+
+    def search_main_guild_channels(
+        self,
+        autocomplete_name: str,
+        get_channels: "Callable[[discord.Guild], Iterable[discord.abc.GuildChannel]]",
+        prefix: str,
+        *,
+        permissions_target: discord.Member | discord.Role | None = None,
+    ) -> "Sequence[tuple[str, int]]":
+        """
+        Return the name & ID of the channels whose names start with the given prefix.
+
+        The channels given by `get_channels` are cached for each autocomplete,
+        and for each set of permissions if the channels depend upon `permissions_target`,
+        until a channel or role in your group's Discord guild is changed.
+        At most 25 channels are returned (the most that autocomplete options can show).
+        """
+        main_guild: discord.Guild = self.main_guild
+
+        return self._channel_autocomplete_cache.search(
+            (
+                autocomplete_name,
+                self._channel_autocomplete_cache.get_permissions_key(
+                    main_guild, permissions_target
+                )
+                if permissions_target is not None
+                else None,
+            ),
+            lambda: get_channels(main_guild),
+            prefix,
+        )
+
+    async def _clear_channel_autocomplete_cache(self, *_: object) -> None:
+        self._channel_autocomplete_cache.clear()
+
+    async def wait_for_component_interaction(
+        self,
+        custom_ids: "AbstractSet[str]",
+        channel_id: int,
+        *,
+        user_id: int | None,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        check: "Callable[[discord.Interaction], bool] | None" = None,
+    ) -> discord.Interaction:
+        """
+        Wait for an interaction with any of the given components in the given channel.
+
+        Unlike `wait_for("interaction")`, received interactions are only compared
+        against the waits for that exact component, and every wait expires.
+        Raises `TimeoutError` if no matching interaction is received
+        within `max_wait_seconds`.
+        """
+        return await self._component_interaction_router.wait_for_component_interaction(
+            custom_ids,
+            channel_id,
+            user_id=user_id,
+            max_wait_seconds=max_wait_seconds,
+            check=check,
+        )
 
     @classmethod
     async def get_mention_string(
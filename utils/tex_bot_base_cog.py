@@ -13,7 +13,6 @@ from exceptions.base import BaseDoesNotExistError
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
-    from collections.abc import Set as AbstractSet
     from logging import Logger
     from typing import Final
 
@@ -160,40 +159,43 @@ class TeXBotBaseCog(Cog):
     @staticmethod
     async def autocomplete_get_text_channels(
         ctx: "TeXBotAutocompleteContext",
-    ) -> "AbstractSet[discord.OptionChoice] | AbstractSet[str]":
+    ) -> "Sequence[discord.OptionChoice]":
         """
-        Autocomplete callable that generates the set of available selectable channels.
+        Autocomplete callable that generates the list of available selectable channels.
 
         The list of available selectable channels is unique to each member and is used in any
         slash-command options that have a channel input-type.
         """
         if not ctx.interaction.user:
-            return set()
+            return []
 
         try:
-            main_guild: discord.Guild = ctx.bot.main_guild
             channel_permissions_limiter: MentionableMember = await ctx.bot.guest_role
         except BaseDoesNotExistError:
-            return set()
+            return []
 
         with contextlib.suppress(DiscordMemberNotInMainGuildError):
             channel_permissions_limiter = await ctx.bot.get_main_guild_member(
                 ctx.interaction.user
             )
 
-        if not ctx.value or re.fullmatch(r"\A#.*\Z", ctx.value):
-            return {
-                discord.OptionChoice(name=f"#{channel.name}", value=str(channel.id))
-                for channel in main_guild.text_channels
-                if channel.permissions_for(channel_permissions_limiter).is_superset(
-                    discord.Permissions(send_messages=True, view_channel=True)
-                )
-            }
-
-        return {
-            discord.OptionChoice(name=channel.name, value=str(channel.id))
-            for channel in main_guild.text_channels
-            if channel.permissions_for(channel_permissions_limiter).is_superset(
-                discord.Permissions(send_messages=True, view_channel=True),
+        SHOW_HASH_PREFIX: Final[bool] = not ctx.value or ctx.value.startswith("#")
+
+        return [
+            discord.OptionChoice(
+                name=f"#{channel_name}" if SHOW_HASH_PREFIX else channel_name,
+                value=str(channel_id),
+            )
+            for channel_name, channel_id in ctx.bot.search_main_guild_channels(
+                "text_channels",
+                lambda main_guild: (
+                    channel
+                    for channel in main_guild.text_channels
+                    if channel.permissions_for(channel_permissions_limiter).is_superset(
+                        discord.Permissions(send_messages=True, view_channel=True)
+                    )
+                ),
+                (ctx.value or "").removeprefix("#"),
+                permissions_target=channel_permissions_limiter,
             )
-        }
+        ]
@@ -0,0 +1,100 @@
+"""Hashed timer wheel, used to schedule many deferred actions with little memory each."""
+
+import collections
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+    from typing import Final
+
+__all__: "Sequence[str]" = ("TimerWheel",)
+
+
+class TimerWheel[T: "Hashable"]:
+    """
+    Hashed timer wheel of items that become due at given timestamps.
+
+    Time is divided into ticks, and each item is stored in the slot of the tick it is due in,
+    along with the number of full rotations of the wheel to wait before that tick is reached.
+    Scheduling an item & advancing by a single tick both take constant time,
+    however many items are waiting.
+    """
+
+    DEFAULT_SLOT_COUNT: "Final[int]" = 512
+
+    def __init__(
+        self,
+        start_timestamp: float,
+        *,
+        tick_seconds: float = 1.0,
+        slot_count: int = DEFAULT_SLOT_COUNT,
+    ) -> None:
+        """Initialise a new empty timer wheel, starting at the given timestamp."""
+        if tick_seconds <= 0:
+            INVALID_TICK_SECONDS_MESSAGE: Final[str] = "tick_seconds must be positive."
+            raise ValueError(INVALID_TICK_SECONDS_MESSAGE)
+
+        if slot_count < 1:
+            INVALID_SLOT_COUNT_MESSAGE: Final[str] = "slot_count must be a positive integer."
+            raise ValueError(INVALID_SLOT_COUNT_MESSAGE)
+
+        self._tick_seconds: float = tick_seconds
+        self._slots: list[list[tuple[int, T]]] = [[] for _ in range(slot_count)]
+        self._next_tick: int = math.floor(start_timestamp / tick_seconds)
+        self._item_counts: collections.Counter[T] = collections.Counter()
+
+    def __len__(self) -> int:
+        """Return the number of items that are yet to become due."""
+        return self._item_counts.total()
+
+    def __contains__(self, item: object) -> bool:
+        """Return whether the given item is scheduled & yet to become due."""
+        return self._item_counts[item] > 0  # type: ignore[index]
+
+    def schedule(self, item: T, due_timestamp: float) -> None:
+        """
+        Add an item that becomes due at the given timestamp.
+
+        Items with a timestamp in the past become due when the wheel is next advanced.
+        """
+        due_tick: int = max(math.ceil(due_timestamp / self._tick_seconds), self._next_tick)
+
+        rotations: int
+        slot_index: int
+        rotations, slot_index = divmod(due_tick - self._next_tick, len(self._slots))
+
+        self._slots[(self._next_tick + slot_index) % len(self._slots)].append(
+            (rotations, item)
+        )
+        self._item_counts[item] += 1
+
+    def advance(self, timestamp: float) -> "Sequence[T]":
+        """Advance the wheel up to the given timestamp, returning the items now due."""
+        due_items: list[T] = []
+        last_tick: int = math.floor(timestamp / self._tick_seconds)
+
+        while self._next_tick <= last_tick and self._item_counts:
+            slot_index: int = self._next_tick % len(self._slots)
+
+            waiting_items: list[tuple[int, T]] = []
+            rotations: int
+            item: T
+            for rotations, item in self._slots[slot_index]:
+                if rotations:
+                    waiting_items.append((rotations - 1, item))
+                else:
+                    due_items.append(item)
+
+            self._slots[slot_index] = waiting_items
+            self._next_tick += 1
+
+        due_item: T
+        for due_item in due_items:
+            self._item_counts[due_item] -= 1
+            if not self._item_counts[due_item]:
+                del self._item_counts[due_item]
+
+        self._next_tick = max(self._next_tick, last_tick + 1)
+
+        return due_items